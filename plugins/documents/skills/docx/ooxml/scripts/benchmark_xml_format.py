@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark the lxml formatter against the previous minidom implementation.
+
+Times condense (pack) and pretty-print (unpack) for every XML part of an
+Office file, or for a generated document.xml when no file is given.
+
+Example usage:
+    python benchmark_xml_format.py [office_file] [--paragraphs N] [--repeat N]
+"""
+
+import argparse
+import time
+import zipfile
+
+import defusedxml.minidom
+
+from xml_format import condense, pretty_print
+
+
+def minidom_condense(data):
+    """Condense as pack.py did before the lxml formatter."""
+    dom = defusedxml.minidom.parseString(data)
+    for element in dom.getElementsByTagName("*"):
+        if element.tagName.endswith(":t"):
+            continue
+        for child in list(element.childNodes):
+            if (
+                child.nodeType == child.TEXT_NODE
+                and child.nodeValue
+                and child.nodeValue.strip() == ""
+            ) or child.nodeType == child.COMMENT_NODE:
+                element.removeChild(child)
+    return dom.toxml(encoding="UTF-8")
+
+
+def minidom_pretty_print(data):
+    """Pretty-print as unpack.py did before the lxml formatter."""
+    dom = defusedxml.minidom.parseString(data.decode("utf-8"))
+    return dom.toprettyxml(indent="  ", encoding="ascii")
+
+
+def generate_document(paragraphs):
+    """Build a condensed document.xml with the given number of paragraphs."""
+    body = "".join(
+        f'<w:p w:rsidR="00AB12CD"><w:pPr><w:pStyle w:val="Normal"/></w:pPr>'
+        f'<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">Paragraph {i} </w:t></w:r>'
+        f"<w:r><w:t>with some text that is reasonably long to matter.</w:t></w:r></w:p>"
+        for i in range(paragraphs)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    ).encode("utf-8")
+
+
+def best_time(func, parts, repeat):
+    """Return the best wall time of func over all parts across repeat runs."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for data in parts:
+            func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark XML formatting backends")
+    parser.add_argument("office_file", nargs="?", help="Office file to benchmark")
+    parser.add_argument(
+        "--paragraphs",
+        type=int,
+        default=20000,
+        help="Paragraphs in the generated document (default: 20000)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per measurement (default: 3)"
+    )
+    args = parser.parse_args()
+
+    if args.office_file:
+        with zipfile.ZipFile(args.office_file) as zf:
+            parts = [
+                zf.read(name)
+                for name in zf.namelist()
+                if name.endswith((".xml", ".rels"))
+            ]
+    else:
+        parts = [generate_document(args.paragraphs)]
+
+    pretty_parts = [pretty_print(data) for data in parts]
+    size = sum(len(data) for data in parts)
+    print(f"{len(parts)} part(s), {size / 1e6:.1f} MB condensed")
+    print(f"{'operation':<14}{'minidom':>12}{'lxml':>12}{'speedup':>10}")
+
+    for name, old, new, inputs in [
+        ("pretty-print", minidom_pretty_print, pretty_print, parts),
+        ("condense", minidom_condense, condense, pretty_parts),
+    ]:
+        old_time = best_time(old, inputs, args.repeat)
+        new_time = best_time(new, inputs, args.repeat)
+        print(
+            f"{name:<14}{old_time:>11.3f}s{new_time:>11.3f}s{old_time / new_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,23 @@ Example usage:
 """
 
 import argparse
-import shutil
+import os
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
 import zipfile
 from pathlib import Path
 
+try:
+    from .soffice_pool import pool_request
+    from .xml_format import condense
+except ImportError:  # Run as a script from this directory
+    from soffice_pool import pool_request
+    from xml_format import condense
+
+# Seconds allowed for the soffice conversion (excluding soffice_pool queueing)
+VALIDATION_TIMEOUT = 10
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
@@ -50,6 +59,10 @@ def pack_document(input_dir, output_file, validate=False):
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
 
+    The archive is written to a temporary file next to output_file and only
+    moved into place once it is complete (and valid, if validating), so an
+    existing output_file is never left truncated or corrupt.
+
     Returns:
         bool: True if successful, False if validation failed
     """
@@ -61,34 +74,77 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    # List the parts before creating the temporary file, and never pack the
+    # output itself if it lives inside input_dir
+    entries = _package_entries(input_dir, exclude=output_file)
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{output_file.stem}-", suffix=output_file.suffix, dir=output_file.parent
+    )
+    os.close(fd)
+    temp_file = Path(temp_name)
+    try:
+        # mkstemp creates the file owner-only; give it the usual permissions
+        umask = os.umask(0)
+        os.umask(umask)
+        temp_file.chmod(0o666 & ~umask)
+
+        # Create the Office file as a zip archive, reading each part once and
+        # condensing XML in memory so the input directory is never modified
+        with zipfile.ZipFile(temp_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            for f, arcname in entries:
+                if f.name.endswith((".xml", ".rels")):
+                    # Remove pretty-printing whitespace
+                    info = zipfile.ZipInfo.from_file(f, arcname)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    zf.writestr(info, condense_xml_bytes(f.read_bytes()))
+                else:
+                    # Media and other binary parts are streamed from disk as-is
+                    zf.write(f, arcname)
+
+        # Validate if requested; a corrupt file never replaces output_file
+        if validate and not validate_document(temp_file):
+            temp_file.unlink()
+            return False
+
+        os.replace(temp_file, output_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
 
     return True
 
 
+def _package_entries(input_dir, exclude=None):
+    """List (path, archive name) for every file, in a deterministic order.
+
+    [Content_Types].xml comes first and the package relationships second, as
+    Office writes them; all other parts follow in path order.
+
+    Args:
+        input_dir: Unpacked package directory
+        exclude: Optional file to leave out (the output file, if it is
+            inside input_dir)
+    """
+    exclude = Path(exclude).resolve() if exclude is not None else None
+    entries = sorted(
+        (f.relative_to(input_dir).as_posix(), f)
+        for f in input_dir.rglob("*")
+        if f.is_file()
+        and not (exclude and f.name == exclude.name and f.resolve() == exclude)
+    )
+    first = {"[Content_Types].xml": 0, "_rels/.rels": 1}
+    entries.sort(key=lambda entry: first.get(entry[0], len(first)))
+    return [(f, arcname) for arcname, f in entries]
+
+
 def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
+    """Validate document by converting to HTML with soffice.
+
+    Uses a running soffice_pool when one is listening, which skips the
+    soffice start-up; otherwise starts soffice for this document.
+    """
     # Determine the correct filter based on file extension
     match doc_path.suffix.lower():
         case ".docx":
@@ -99,6 +155,25 @@ def validate_document(doc_path):
             filter_name = "html:HTML (StarCalc)"
 
     with tempfile.TemporaryDirectory() as temp_dir:
+        response = pool_request(
+            {
+                "op": "convert",
+                "path": str(Path(doc_path).resolve()),
+                "filter": filter_name,
+                "outdir": temp_dir,
+                "timeout": VALIDATION_TIMEOUT,
+            }
+        )
+        if response is not None:
+            if response.get("timeout"):
+                print("Validation error: Timeout during conversion", file=sys.stderr)
+                return False
+            if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
+                error_msg = response.get("error") or "Document validation failed"
+                print(f"Validation error: {error_msg}", file=sys.stderr)
+                return False
+            return True
+
         try:
             result = subprocess.run(
                 [
@@ -111,7 +186,7 @@ def validate_document(doc_path):
                     str(doc_path),
                 ],
                 capture_output=True,
-                timeout=10,
+                timeout=VALIDATION_TIMEOUT,
                 text=True,
             )
             if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
@@ -130,29 +205,16 @@ def validate_document(doc_path):
             return False
 
 
-def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
-
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+def condense_xml_bytes(data):
+    """Strip unnecessary whitespace and remove comments from serialized XML.
+
+    Args:
+        data: XML document as bytes
+
+    Returns:
+        bytes: The condensed document, UTF-8 encoded
+    """
+    return condense(data)
 
 
 if __name__ == "__main__":
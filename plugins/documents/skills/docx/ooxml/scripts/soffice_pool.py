@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Pool of warm headless LibreOffice workers shared by pack.py and recalc.py.
+
+Starting soffice costs seconds per document. The pool keeps N soffice
+processes running, each with its own user profile and driven over UNO, and
+serves jobs from a local Unix socket:
+
+    {"op": "convert", "path": ..., "filter": "html:HTML", "outdir": ..., "timeout": 10}
+    {"op": "recalc", "path": ..., "timeout": 30}
+    {"op": "stats"}
+    {"op": "stop"}
+
+Each request is one JSON line and gets one JSON line back. A job that runs
+past its timeout has its worker killed and restarted; so does a worker
+whose soffice crashed or that reached --max-jobs. Clients call
+pool_request(), which returns None when no pool is listening so callers can
+fall back to a cold soffice run.
+
+The server needs LibreOffice's Python UNO bridge (the `uno` module), so run
+it with the Python bundled with LibreOffice or one with python3-uno
+installed. Clients only need the standard library.
+
+Example usage:
+    python soffice_pool.py serve [--workers N] [--max-jobs N] [--socket PATH]
+    python soffice_pool.py stats
+    python soffice_pool.py stop
+"""
+
+import argparse
+import getpass
+import json
+import os
+import queue
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Environment variable overriding the socket path
+SOCKET_ENV = "SOFFICE_POOL_SOCKET"
+
+DEFAULT_WORKERS = 2
+DEFAULT_JOB_TIMEOUT = 60
+STARTUP_TIMEOUT = 60
+
+# Seconds a client waits beyond the job timeout (queueing, worker restarts)
+CLIENT_TIMEOUT_MARGIN = 30
+
+
+def default_socket_path():
+    """Socket the pool listens on ($SOFFICE_POOL_SOCKET or a per-user temp path)."""
+    if os.environ.get(SOCKET_ENV):
+        return Path(os.environ[SOCKET_ENV])
+    return Path(tempfile.gettempdir()) / f"soffice-pool-{getpass.getuser()}.sock"
+
+
+def pool_request(request, socket_path=None):
+    """Send one request to a running pool and wait for its response.
+
+    The wait is bounded by the job timeout plus CLIENT_TIMEOUT_MARGIN, so
+    a pool that hangs makes the caller fall back to a cold soffice run.
+
+    Args:
+        request: Request dict (see the module docstring)
+        socket_path: Pool socket (default: default_socket_path())
+
+    Returns:
+        dict: The response, with "ok" set, or None if no pool is listening,
+            it dropped the connection or it did not answer in time
+    """
+    # xlsx/recalc.py has its own copy of this client (recalc_with_pool),
+    # since that skill ships without this module; keep the two in sync
+    # (docx/tests/test_soffice_pool.py runs both against the same server).
+    path = Path(socket_path) if socket_path else default_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+
+    timeout = float(request.get("timeout") or DEFAULT_JOB_TIMEOUT)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout + CLIENT_TIMEOUT_MARGIN)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except (ConnectionRefusedError, FileNotFoundError):
+        # Stale socket file left by a pool that is no longer running
+        return None
+    except (ConnectionResetError, BrokenPipeError):
+        # The pool went away while handling the request
+        return None
+    except socket.timeout:
+        print(
+            "soffice pool did not answer in time; running soffice directly",
+            file=sys.stderr,
+        )
+        return None
+
+    if not line:
+        # The pool closed the connection without answering
+        return None
+    return json.loads(line)
+
+
+class Job:
+    """One conversion or recalculation waiting for a worker."""
+
+    def __init__(self, request):
+        self.request = request
+        self.timeout = float(request.get("timeout") or DEFAULT_JOB_TIMEOUT)
+        self.submitted = time.monotonic()
+        self.started = None
+        self.response = None
+        self.done = threading.Event()
+
+    def finish(self, response):
+        self.response = response
+        self.done.set()
+
+
+class PoolStats:
+    """Counters reported by the "stats" request."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.restarts = 0
+        self.busy = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def record(self, job, outcome):
+        """Record a finished job; outcome is "ok", "failed" or "timeout"."""
+        with self.lock:
+            self.completed += outcome == "ok"
+            self.failed += outcome == "failed"
+            self.timed_out += outcome == "timeout"
+            self.wait_seconds += job.started - job.submitted
+            self.run_seconds += time.monotonic() - job.started
+
+    def to_dict(self, workers, queued):
+        with self.lock:
+            finished = self.completed + self.failed + self.timed_out
+            return {
+                "workers": workers,
+                "busy": self.busy,
+                "queued": queued,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "timed_out": self.timed_out,
+                "restarts": self.restarts,
+                "mean_wait_seconds": round(self.wait_seconds / finished, 3)
+                if finished
+                else 0.0,
+                "mean_run_seconds": round(self.run_seconds / finished, 3)
+                if finished
+                else 0.0,
+            }
+
+
+class Office:
+    """One headless soffice process with its own profile, driven over UNO."""
+
+    def __init__(self, name, profile_dir):
+        self.name = name
+        self.profile_dir = Path(profile_dir)
+        self.process = None
+        self.desktop = None
+        self.jobs = 0
+
+    def start(self):
+        """Start soffice and connect to it, waiting up to STARTUP_TIMEOUT."""
+        import uno
+        from com.sun.star.connection import NoConnectException
+
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--nodefault",
+                "--norestore",
+                "--nolockcheck",
+                f"-env:UserInstallation={self.profile_dir.as_uri()}",
+                f"--accept=pipe,name={self.name};urp;StarOffice.ComponentContext",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(
+                    f"uno:pipe,name={self.name};urp;StarOffice.ComponentContext"
+                )
+                break
+            except NoConnectException:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.kill()
+                    raise RuntimeError(f"soffice worker {self.name} did not start")
+                time.sleep(0.2)
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+        self.jobs = 0
+
+    def kill(self):
+        """Stop the soffice process (also used to abort a running job)."""
+        if self.process and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        self.desktop = None
+
+    def restart(self):
+        self.kill()
+        self.start()
+
+    def run(self, request):
+        """Run one job request and return the response fields."""
+        import uno
+
+        path = Path(request["path"]).resolve()
+        document = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(path)),
+            "_blank",
+            0,
+            (_property("Hidden", True),),
+        )
+        if document is None:
+            raise RuntimeError(f"source file could not be loaded: {path}")
+
+        try:
+            if request["op"] == "convert":
+                # "html:HTML" -> extension "html", filter "HTML"
+                extension, _, filter_name = request["filter"].partition(":")
+                output = Path(request["outdir"]).resolve() / f"{path.stem}.{extension}"
+                properties = (
+                    (_property("FilterName", filter_name),) if filter_name else ()
+                )
+                document.storeToURL(uno.systemPathToFileUrl(str(output)), properties)
+                return {"output": str(output)}
+
+            document.calculateAll()
+            document.store()
+            return {}
+        finally:
+            document.close(True)
+            self.jobs += 1
+
+
+def _property(name, value):
+    from com.sun.star.beans import PropertyValue
+
+    prop = PropertyValue()
+    prop.Name = name
+    prop.Value = value
+    return prop
+
+
+class SofficePool:
+    """Worker threads, each owning one Office, serving a shared job queue."""
+
+    def __init__(self, workers=DEFAULT_WORKERS, max_jobs=None):
+        """
+        Args:
+            workers: Number of soffice processes to keep warm
+            max_jobs: Restart a worker after this many jobs (None = never)
+        """
+        self.max_jobs = max_jobs
+        self.jobs = queue.Queue()
+        self.stats = PoolStats()
+        self.profile_root = Path(tempfile.mkdtemp(prefix="soffice-pool-"))
+        self.offices = [
+            Office(f"soffice-pool-{os.getpid()}-{i}", self.profile_root / f"worker-{i}")
+            for i in range(workers)
+        ]
+        self._threads = []
+
+    def start(self):
+        """Start every soffice process in parallel, then the worker threads."""
+        starters = [threading.Thread(target=office.start) for office in self.offices]
+        for thread in starters:
+            thread.start()
+        for thread in starters:
+            thread.join()
+        for office in self.offices:
+            if office.desktop is None:
+                raise RuntimeError(f"soffice worker {office.name} did not start")
+            thread = threading.Thread(target=self._work, args=(office,), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, request):
+        """Queue a job and block until a worker has finished it."""
+        job = Job(request)
+        with self.stats.lock:
+            self.stats.submitted += 1
+        self.jobs.put(job)
+        job.done.wait()
+        return job.response
+
+    def stop(self):
+        for _ in self._threads:
+            self.jobs.put(None)
+        for thread in self._threads:
+            thread.join()
+        for office in self.offices:
+            office.kill()
+        shutil.rmtree(self.profile_root, ignore_errors=True)
+
+    def _work(self, office):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            job.started = time.monotonic()
+            with self.stats.lock:
+                self.stats.busy += 1
+
+            if office.desktop is None:
+                # A previous restart failed; try again before taking the job
+                self._restart(office)
+            if office.desktop is None:
+                self.stats.record(job, "failed")
+                with self.stats.lock:
+                    self.stats.busy -= 1
+                job.finish({"ok": False, "error": f"soffice worker {office.name} is down"})
+                continue
+
+            # Killing soffice makes the blocked UNO call raise
+            timer = threading.Timer(job.timeout, office.kill)
+            timer.start()
+            try:
+                response = {"ok": True, **office.run(job.request)}
+                outcome = "ok"
+            except Exception as e:
+                if office.desktop is None:
+                    response = {
+                        "ok": False,
+                        "timeout": True,
+                        "error": f"Timeout after {job.timeout:g}s",
+                    }
+                    outcome = "timeout"
+                else:
+                    response = {"ok": False, "error": str(e)}
+                    outcome = "failed"
+            finally:
+                timer.cancel()
+
+            self.stats.record(job, outcome)
+            with self.stats.lock:
+                self.stats.busy -= 1
+            job.finish(response)
+
+            # Recycle workers that crashed, timed out or did enough jobs
+            crashed = office.process.poll() is not None
+            if crashed or (self.max_jobs and office.jobs >= self.max_jobs):
+                self._restart(office)
+
+    def _restart(self, office):
+        with self.stats.lock:
+            self.stats.restarts += 1
+        try:
+            office.restart()
+        except Exception as e:
+            office.desktop = None
+            print(f"Error: {e}", file=sys.stderr)
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        pool = self.server.pool
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            op = request.get("op")
+            if op == "stats":
+                response = {
+                    "ok": True,
+                    **pool.stats.to_dict(len(pool.offices), pool.jobs.qsize()),
+                }
+            elif op == "stop":
+                response = {"ok": True}
+                threading.Thread(target=self.server.shutdown).start()
+            elif op == "convert" and request.get("filter") and request.get("outdir"):
+                response = pool.submit(request)
+            elif op == "recalc":
+                response = pool.submit(request)
+            else:
+                response = {"ok": False, "error": f"Unknown request: {op!r}"}
+        except (ValueError, KeyError, AttributeError) as e:
+            response = {"ok": False, "error": f"Bad request: {e}"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class _PoolServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path=None, workers=DEFAULT_WORKERS, max_jobs=None):
+    """Run the pool until a "stop" request arrives.
+
+    Args:
+        socket_path: Socket to listen on (default: default_socket_path())
+        workers: Number of soffice processes to keep warm
+        max_jobs: Restart a worker after this many jobs (None = never)
+    """
+    try:
+        import uno  # noqa: F401
+    except ImportError:
+        sys.exit(
+            "Error: the soffice pool needs LibreOffice's Python UNO bridge; run it "
+            "with LibreOffice's bundled python or install python3-uno"
+        )
+
+    path = Path(socket_path) if socket_path else default_socket_path()
+    if pool_request({"op": "stats"}, path) is not None:
+        sys.exit(f"Error: a pool is already listening on {path}")
+    path.unlink(missing_ok=True)
+
+    pool = SofficePool(workers=workers, max_jobs=max_jobs)
+    try:
+        pool.start()
+        with _PoolServer(str(path), _RequestHandler) as server:
+            os.chmod(path, 0o600)
+            server.pool = pool
+            print(f"soffice pool: {workers} worker(s) listening on {path}")
+            server.serve_forever()
+    finally:
+        pool.stop()
+        path.unlink(missing_ok=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pool of warm soffice workers")
+    parser.add_argument("command", choices=["serve", "stats", "stop"])
+    parser.add_argument(
+        "--socket",
+        help=f"Socket path (default: ${SOCKET_ENV} or {default_socket_path()})",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of soffice processes (default: {DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--max-jobs",
+        type=int,
+        help="Restart each worker after this many jobs (default: never)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args.socket, workers=args.workers, max_jobs=args.max_jobs)
+        return
+
+    response = pool_request({"op": args.command}, args.socket)
+    if response is None:
+        sys.exit("Error: no soffice pool is running")
+    print(json.dumps(response, indent=2))
+
+
+if __name__ == "__main__":
+    main()
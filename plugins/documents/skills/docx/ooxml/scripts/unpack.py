@@ -1,29 +1,131 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx).
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--part GLOB ...] [--no-pretty] [--jobs N]
+"""
+
+import argparse
+import fnmatch
 import random
-import sys
-import defusedxml.minidom
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+try:
+    from .xml_format import pretty_print
+except ImportError:  # Run as a script from this directory
+    from xml_format import pretty_print
+
+# XML parts larger than this are extracted as-is rather than pretty-printed
+PRETTY_PRINT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--part",
+        dest="parts",
+        action="append",
+        metavar="GLOB",
+        help="Only extract parts matching this glob, e.g. 'word/document.xml' "
+        "(may be repeated; default: all parts)",
+    )
+    parser.add_argument(
+        "--no-pretty",
+        action="store_true",
+        help="Extract XML parts without pretty-printing them",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for formatting XML (default: 1)",
+    )
+    args = parser.parse_args()
+
+    unpack_document(
+        args.office_file,
+        args.output_dir,
+        parts=args.parts,
+        pretty=not args.no_pretty,
+        jobs=args.jobs,
+    )
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(
+    input_file,
+    output_dir,
+    parts=None,
+    pretty=True,
+    jobs=1,
+    max_pretty_size=PRETTY_PRINT_MAX_BYTES,
+):
+    """Extract an Office file and pretty-print its XML parts.
+
+    Args:
+        input_file: Path to the Office file
+        output_dir: Directory to extract into (created if needed)
+        parts: Optional glob pattern or list of patterns selecting the parts
+            to extract (e.g. "word/document.xml" or "word/*.xml"); all parts
+            are extracted by default
+        pretty: If True, pretty-prints extracted .xml and .rels parts
+        jobs: Number of worker processes used for pretty-printing
+        max_pretty_size: XML parts larger than this many bytes are left
+            unformatted
+
+    Returns:
+        list: Names of the extracted parts
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    if isinstance(parts, str):
+        parts = [parts]
+
+    with zipfile.ZipFile(input_file) as zf:
+        members = [
+            info
+            for info in zf.infolist()
+            if not info.is_dir()
+            and (
+                parts is None
+                or any(fnmatch.fnmatchcase(info.filename, p) for p in parts)
+            )
+        ]
+        for info in members:
+            zf.extract(info, output_path)
+
+    # Pretty print the extracted XML files
+    if pretty:
+        xml_files = [
+            output_path / info.filename
+            for info in members
+            if info.filename.endswith((".xml", ".rels"))
+            and info.file_size <= max_pretty_size
+        ]
+        if jobs > 1 and len(xml_files) > 1:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(xml_files))) as pool:
+                list(pool.map(_pretty_print_file, xml_files, chunksize=4))
+        else:
+            for xml_file in xml_files:
+                _pretty_print_file(xml_file)
+
+    return [info.filename for info in members]
+
+
+def _pretty_print_file(xml_file):
+    """Pretty-print one extracted XML file in place."""
+    xml_file.write_bytes(pretty_print(xml_file.read_bytes()))
+
+
+if __name__ == "__main__":
+    main()
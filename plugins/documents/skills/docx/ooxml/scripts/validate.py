@@ -3,66 +3,282 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir|office_file> --original <original_file> [--jobs N] [--schema-cache <dir>] [--cache]
+                       [--no-cache] [--format text|json] [--no-diff]
+    python validate.py --batch <manifest.jsonl|-> [--jobs N] [--schema-cache <dir>] [--cache] [--no-cache]
+                       [--no-diff]
+
+In batch mode each manifest line is a JSON object such as
+{"unpacked_dir": "out/contract-1", "original": "templates/contract.docx"}
+(relative paths are resolved against the current directory). Documents are
+validated by --jobs worker processes that keep compiled schemas and the
+original documents' paragraph texts between documents, and one JSON result
+line is printed per document, in manifest order.
+
+A packed .docx/.pptx can be validated in place of an unpacked directory: its
+parts are read straight from the archive, without extracting anything.
 """
 
 import argparse
+import contextlib
+import json
+import os
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
+from validation.redlining import ParagraphMemo
+from validation.result_cache import CACHE_PATH_ENV, default_cache_path
+from validation.schema_cache import CACHE_DIR_ENV
+
+
+# Paragraph texts kept warm across a worker's batch (a bounded LRU, see ParagraphMemo)
+_batch_memo = None
 
 
 def main():
     parser = argparse.ArgumentParser(description="Validate Office document XML files")
     parser.add_argument(
         "unpacked_dir",
-        help="Path to unpacked Office document directory",
+        nargs="?",
+        help="Path to unpacked Office document directory, or a packed Office "
+        "file to validate without unpacking",
     )
     parser.add_argument(
         "--original",
-        required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
+    parser.add_argument(
+        "--batch",
+        metavar="MANIFEST",
+        help="Validate every (unpacked_dir, original) pair listed in a JSON lines "
+        "manifest ('-' for stdin), printing one JSON result per line",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for XSD validation, or for documents "
+        "with --batch (default: 1)",
+    )
+    parser.add_argument(
+        "--schema-cache",
+        metavar="DIR",
+        help=f"Directory for pre-resolved XSD schema bundles (default: ${CACHE_DIR_ENV})",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=f"Reuse per-part results from {default_cache_path()} "
+        f"(also enabled by setting ${CACHE_PATH_ENV})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write the per-part result cache, even if "
+        f"${CACHE_PATH_ENV} is set",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format; json prints one report object and sends "
+        "human-readable progress to stderr (default: text)",
+    )
+    parser.add_argument(
+        "--no-diff",
+        action="store_true",
+        help="Stop the tracked-change check at the first differing paragraph "
+        "instead of printing a full diff",
+    )
     args = parser.parse_args()
 
+    if args.schema_cache:
+        os.environ[CACHE_DIR_ENV] = args.schema_cache
+    if args.cache and not args.no_cache:
+        # Workers inherit the setting through the environment
+        os.environ[CACHE_PATH_ENV] = str(default_cache_path())
+
+    if args.batch:
+        if args.unpacked_dir or args.original:
+            parser.error("--batch cannot be combined with unpacked_dir or --original")
+        sys.exit(0 if run_batch(args) else 1)
+    if not args.unpacked_dir or not args.original:
+        parser.error("unpacked_dir and --original are required without --batch")
+
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
     original_file = Path(args.original)
+    try:
+        validators = select_validators(unpacked_dir, original_file)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # Run validators (keeping stdout clean for the JSON report)
+    output = sys.stderr if args.format == "json" else sys.stdout
+    with contextlib.redirect_stdout(output):
+        reports = run_validators(
+            validators,
+            unpacked_dir,
+            original_file,
+            verbose=args.verbose,
+            jobs=args.jobs,
+            cache=not args.no_cache,
+            diff=not args.no_diff,
+        )
+    success = all(reports)
+
+    if args.format == "json":
+        json.dump(
+            result_dict(unpacked_dir, original_file, reports), sys.stdout, indent=2
+        )
+        print()
+    elif success:
+        print("All validations PASSED!")
+
+    sys.exit(0 if success else 1)
+
+
+def select_validators(unpacked_dir, original_file):
+    """Return the validator classes for a document.
+
+    Raises:
+        AssertionError: If a path is missing or the file type is unknown
+        ValueError: If validation is not supported for the file type
+    """
     file_extension = original_file.suffix.lower()
-    assert unpacked_dir.is_dir(), f"Error: {unpacked_dir} is not a directory"
+    assert unpacked_dir.is_dir() or (
+        unpacked_dir.is_file() and zipfile.is_zipfile(unpacked_dir)
+    ), f"Error: {unpacked_dir} is not a directory or an Office file"
     assert original_file.is_file(), f"Error: {original_file} is not a file"
     assert file_extension in [".docx", ".pptx", ".xlsx"], (
         f"Error: {original_file} must be a .docx, .pptx, or .xlsx file"
     )
 
-    # Run validations
     match file_extension:
         case ".docx":
-            validators = [DOCXSchemaValidator, RedliningValidator]
+            return [DOCXSchemaValidator, RedliningValidator]
         case ".pptx":
-            validators = [PPTXSchemaValidator]
+            return [PPTXSchemaValidator]
         case _:
-            print(f"Error: Validation not supported for file type {file_extension}")
-            sys.exit(1)
+            raise ValueError(f"Validation not supported for file type {file_extension}")
 
-    # Run validators
-    success = True
+
+def run_validators(
+    validators,
+    unpacked_dir,
+    original_file,
+    verbose=False,
+    jobs=1,
+    cache=True,
+    diff=True,
+    memo=None,
+):
+    """Run each validator on a document and return their reports."""
+    reports = []
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+        if issubclass(V, BaseSchemaValidator):
+            options = {"jobs": jobs, "cache": cache}
+        else:
+            options = {"diff": diff}
+            if memo is not None:
+                options["memo"] = memo
+        with V(unpacked_dir, original_file, verbose=verbose, **options) as validator:
+            reports.append(validator.validate())
+    return reports
 
-    if success:
-        print("All validations PASSED!")
 
-    sys.exit(0 if success else 1)
+def result_dict(unpacked_dir, original_file, reports):
+    """Return the JSON result for one document."""
+    return {
+        "unpacked_dir": str(unpacked_dir),
+        "original": str(original_file),
+        "passed": all(reports),
+        "reports": [report.to_dict() for report in reports],
+    }
+
+
+def run_batch(args):
+    """Validate every document in the manifest, printing one JSON line each.
+
+    Returns:
+        bool: True if every document passed
+    """
+    if args.batch == "-":
+        lines = sys.stdin.readlines()
+    else:
+        with open(args.batch, encoding="utf-8") as manifest:
+            lines = manifest.readlines()
+    entries = [line for line in lines if line.strip()]
+
+    options = {
+        "verbose": args.verbose,
+        "cache": not args.no_cache,
+        "diff": not args.no_diff,
+    }
+    jobs = max(1, min(args.jobs, len(entries)))
+    if jobs == 1:
+        results = (_validate_entry(entry, options) for entry in entries)
+        return _print_results(results)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return _print_results(
+            pool.map(_validate_entry, entries, [options] * len(entries))
+        )
+
+
+def _print_results(results):
+    success = True
+    for result in results:
+        success = success and result["passed"]
+        print(json.dumps(result), flush=True)
+    return success
+
+
+def _validate_entry(line, options):
+    """Validate one manifest line; runs in a batch worker process."""
+    global _batch_memo
+    if _batch_memo is None:
+        _batch_memo = ParagraphMemo()
+
+    try:
+        entry = json.loads(line)
+        unpacked_dir = Path(entry["unpacked_dir"])
+        original_file = Path(entry["original"])
+    except (ValueError, KeyError, TypeError) as e:
+        return {"manifest_line": line.strip(), "passed": False, "error": f"Bad entry: {e}"}
+
+    try:
+        validators = select_validators(unpacked_dir, original_file)
+        # Progress goes to stderr with --verbose and is dropped otherwise
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(
+            sys.stderr if options["verbose"] else devnull
+        ):
+            reports = run_validators(
+                validators, unpacked_dir, original_file, memo=_batch_memo, **options
+            )
+    except Exception as e:
+        return {
+            "unpacked_dir": str(unpacked_dir),
+            "original": str(original_file),
+            "passed": False,
+            "error": str(e).removeprefix("Error: "),
+        }
+    return result_dict(unpacked_dir, original_file, reports)
 
 
 if __name__ == "__main__":
@@ -2,11 +2,31 @@
 Base validator with common validation logic for document files.
 """
 
+import hashlib
+import io
+import posixpath
 import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+from .package import open_package
+from .relationships import RelationshipGraph, is_external_target, part_sort_key
+from .report import ValidationReport, Violation
+from .result_cache import ResultCache
+from .schema_cache import get_schema
+from .streaming import (
+    IgnorableNamespaceRule,
+    RelationshipIdRule,
+    RootNameRule,
+    StreamingChecker,
+    UniqueIdRule,
+    WellFormedRule,
+    local_name,
+)
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -84,6 +104,33 @@ class BaseSchemaValidator:
     # Folders where we should clean ignorable namespaces
     MAIN_CONTENT_FOLDERS = {"word", "ppt", "xl"}
 
+    # Root elements of parts that need an Override in [Content_Types].xml
+    DECLARABLE_ROOTS = {
+        "sld",
+        "sldLayout",
+        "sldMaster",
+        "presentation",  # PowerPoint
+        "document",  # Word
+        "workbook",
+        "worksheet",  # Excel
+        "theme",  # Common
+    }
+
+    # XML parts not checked for Override declarations (matched as substrings)
+    CONTENT_TYPES_SKIP_XML = (".rels", "[Content_Types]", "docProps/", "_rels/")
+
+    # Common media file extensions that should have a Default declaration
+    MEDIA_CONTENT_TYPES = {
+        "png": "image/png",
+        "jpg": "image/jpeg",
+        "jpeg": "image/jpeg",
+        "gif": "image/gif",
+        "bmp": "image/bmp",
+        "tiff": "image/tiff",
+        "wmf": "image/x-wmf",
+        "emf": "image/x-emf",
+    }
+
     # All allowed OOXML namespaces (superset of all document types)
     OOXML_NAMESPACES = {
         "http://schemas.openxmlformats.org/officeDocument/2006/math",
@@ -103,50 +150,290 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir).resolve()
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        jobs=1,
+        cache=True,
+        changed_parts=None,
+    ):
+        # Unpacked directory or packed Office file; parts are read through it.
+        # A Package passed in by the caller stays open after close().
+        self.package = open_package(unpacked_dir)
+        self._owns_package = self.package is not unpacked_dir
+        self.unpacked_dir = self.package.root
         self.original_file = Path(original_file)
         self.verbose = verbose
 
+        # Parts edited since original_file (None = unknown, check everything).
+        # Unchanged parts cannot introduce new XSD errors, so only these are
+        # validated against schemas.
+        self.changed_parts = (
+            None
+            if changed_parts is None
+            else {str(part).replace("\\", "/") for part in changed_parts}
+        )
+
+        # Number of worker processes for per-part XSD validation
+        self.jobs = max(1, jobs or 1)
+
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
 
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
         self.xml_files = [
-            f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
+            f for pattern in patterns for f in self.package.rglob(pattern)
         ]
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Parsed trees (or parse errors) and content hashes keyed by file path
+        self._trees = {}
+        self._digests = {}
+
+        # Streaming rule results keyed by file path (see _stream_part)
+        self._streamed = {}
+
+        # Package relationship graph shared by the reference checks
+        self._relationship_graph = None
+
+        # Persistent per-part result cache, opt-in via $OOXML_VALIDATION_CACHE
+        # (None when disabled or unavailable)
+        self.cache = cache
+        self._result_cache = ResultCache.open() if cache else None
+
+        # Original package, opened on first use, and its memoised XSD errors
+        self._original_zip = None
+        self._original_errors = {}
+
+        # I/O counters sampled by the report around each check
+        self._parse_count = 0
+        self._bytes_read = 0
+        self.report = self._new_report()
+
     def validate(self):
-        """Run all validation checks and return True if all pass."""
+        """Run all validation checks.
+
+        Returns:
+            ValidationReport: Violations and per-check costs; truthy if all pass
+        """
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def close(self):
+        """Close the files this validator opened; its report stays usable."""
+        if self._owns_package:
+            self.package.close()
+        if self._original_zip is not None:
+            self._original_zip.close()
+            self._original_zip = None
+        if self._result_cache is not None:
+            self._result_cache.close()
+            self._result_cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _new_report(self):
+        """Start a fresh report for a validation run."""
+        return ValidationReport(type(self).__name__, self.package)
+
+    def _run_check(self, name, check):
+        """Run one check, timing it and recording its I/O in the report."""
+        return self.report.time_check(
+            name, check, lambda: (self._parse_count, self._bytes_read)
+        )
+
+    def _read(self, xml_file):
+        """Read a file's bytes and record its content hash."""
+        data = self.package.read(self.package.name(xml_file))
+        self._bytes_read += len(data)
+        self._digests[Path(xml_file)] = hashlib.sha256(data).hexdigest()
+        return data
+
+    def _digest(self, xml_file):
+        """Return the SHA-256 of a file's content (None if it cannot be read)."""
+        xml_file = Path(xml_file)
+        if xml_file not in self._digests:
+            digest = hashlib.sha256()
+            try:
+                with self.package.open(self.package.name(xml_file)) as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(chunk)
+                        self._bytes_read += len(chunk)
+                self._digests[xml_file] = digest.hexdigest()
+            except OSError:
+                self._digests[xml_file] = None
+        return self._digests[xml_file]
+
+    def _parse(self, xml_file):
+        """Return the parsed tree for an XML file, parsing it at most once.
+
+        The cached tree is shared by every check and must not be modified.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: If the file is not well-formed
+        """
+        xml_file = Path(xml_file)
+        if xml_file not in self._trees:
+            self._parse_count += 1
+            try:
+                self._trees[xml_file] = lxml.etree.parse(
+                    io.BytesIO(self._read(xml_file)), base_url=str(xml_file)
+                )
+            except Exception as e:
+                self._trees[xml_file] = e
+
+        tree = self._trees[xml_file]
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    def _cached_part_result(self, check, xml_file, compute, depends=()):
+        """Return compute() for one part, reusing the persistent result cache.
+
+        The result must be JSON-serializable (Violations included, see
+        ResultCache) and depend only on the path and
+        content of xml_file and of the files listed in depends. Unchanged
+        parts are then never parsed at all.
+        """
+        if self._result_cache is None:
+            return compute()
+
+        key = ResultCache.make_key(
+            type(self).__name__,
+            check,
+            xml_file.relative_to(self.unpacked_dir).as_posix(),
+            self._digest(xml_file),
+            [self._digest(path) for path in depends],
+        )
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            return cached[0]
+
+        result = compute()
+        self._result_cache.put(key, [result])
+        return result
+
+    def _streaming_rules(self, xml_file):
+        """Return the streaming rules to run over one part, keyed by check name.
+
+        Subclasses extend this with format-specific rules.
+        """
+        label = str(xml_file.relative_to(self.unpacked_dir))
+        rules = {
+            "xml": WellFormedRule(label),
+            "root_name": RootNameRule(label),
+            "namespaces": IgnorableNamespaceRule(label),
+            "unique_ids": UniqueIdRule(label, self.UNIQUE_ID_REQUIREMENTS),
+        }
+
+        rels_file = self._get_rels_file(xml_file)
+        if rels_file is not None:
+            rules["relationship_ids"] = self._relationship_id_rule(label, rels_file)
+        return rules
+
+    def _stream_part(self, xml_file):
+        """Run every streaming rule over a part in a single pass.
+
+        The part is never held in memory as a full tree, and the pass runs
+        at most once per part however many checks consume its results.
+
+        Returns:
+            dict: Check name -> results
+        """
+        if xml_file not in self._streamed:
+            self._parse_count += 1
+            part_name = self.package.name(xml_file)
+            try:
+                self._bytes_read += self.package.size(part_name)
+                source = self.package.open(part_name)
+            except OSError:
+                source = str(xml_file)  # Let the checker report the error
+            checker = StreamingChecker(self._streaming_rules(xml_file))
+            try:
+                self._streamed[xml_file] = checker.run(source)
+            finally:
+                if not isinstance(source, str):
+                    source.close()
+        return self._streamed[xml_file]
+
+    def _get_rels_file(self, xml_file):
+        """Return the .rels file for a part, or None if it has none.
+
+        For dir/file.xml, it's dir/_rels/file.xml.rels
+        """
+        if xml_file.suffix == ".rels":
+            return None
+        graph = self._get_relationship_graph()
+        rels_part = graph.rels_part_for(
+            xml_file.relative_to(self.unpacked_dir).as_posix()
+        )
+        return self.unpacked_dir / rels_part if rels_part in graph.files else None
+
+    def _get_relationship_graph(self):
+        """Return the package relationship graph, building it on first use."""
+        if self._relationship_graph is None:
+            self._relationship_graph = RelationshipGraph(
+                self.package, parse=self._parse
+            )
+        return self._relationship_graph
+
+    def _relationship_id_rule(self, label, rels_file):
+        """Build the r:id rule for a part from its .rels file."""
+        graph = self._get_relationship_graph()
+        rels_part = rels_file.relative_to(self.unpacked_dir).as_posix()
+        if rels_part in graph.errors:
+            rule = RelationshipIdRule(label, {})
+            rule.tags = ()  # Nothing to check references against
+            rule.failed(graph.errors[rels_part])
+            return rule
+
+        rid_to_type = {}
+        errors = []
+        for rel in graph.relationships.get(rels_part, ()):
+            if rel.id:
+                # Check for duplicate rIds
+                if rel.id in rid_to_type:
+                    errors.append(
+                        Violation(
+                            "relationship_ids",
+                            f"Duplicate relationship ID '{rel.id}' (IDs must be unique)",
+                            rels_part,
+                            rel.line,
+                        )
+                    )
+                rid_to_type[rel.id] = rel.type_name
+
+        expected_type = (
+            self._get_expected_relationship_type
+            if self.ELEMENT_RELATIONSHIP_TYPES
+            else None
+        )
+        return RelationshipIdRule(label, rid_to_type, expected_type, errors)
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+            error = self._cached_part_result(
+                "xml", xml_file, lambda: self._stream_part(xml_file)["xml"]
+            )
+            if error:
+                errors.append(error)
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} XML violations:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
@@ -158,26 +445,19 @@ class BaseSchemaValidator:
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+            errors.extend(
+                self._cached_part_result(
+                    "namespaces",
+                    xml_file,
+                    lambda: self._stream_part(xml_file)["namespaces"],
+                )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - {len(errors)} namespace issues:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         if self.verbose:
             print("PASSED - All namespace prefixes properly declared")
@@ -189,85 +469,38 @@ class BaseSchemaValidator:
         global_ids = {}  # Track globally unique IDs across all files
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+            events = self._cached_part_result(
+                "unique_ids", xml_file, lambda: self._stream_part(xml_file)["unique_ids"]
+            )
+            relative_path = None
+            for event in events:
+                if event[0] == "error":
+                    errors.append(event[1])
+                    continue
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                # Check global uniqueness
+                _, id_value, line, tag = event
+                if relative_path is None:
+                    relative_path = xml_file.relative_to(self.unpacked_dir)
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        Violation(
+                            "unique_ids",
+                            f"Global ID '{id_value}' in <{tag}> "
+                            f"already used in {prev_file} at line {prev_line} in <{prev_tag}>",
+                            relative_path,
+                            line,
+                        )
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                else:
+                    global_ids[id_value] = (relative_path, line, tag)
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
@@ -279,99 +512,75 @@ class BaseSchemaValidator:
         Validate that all .rels files properly reference files and that all files are referenced.
         """
         errors = []
+        graph = self._get_relationship_graph()
 
         # Find all .rels files
-        rels_files = list(self.unpacked_dir.rglob("*.rels"))
+        rels_parts = graph.rels_parts
 
-        if not rels_files:
+        if not rels_parts:
             if self.verbose:
                 print("PASSED - No .rels files found")
             return True
 
-        # Get all files in the unpacked directory (excluding reference files)
-        all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
-            if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
-                and not file_path.name.endswith(".rels")
-            ):  # This file is not referenced by .rels
-                all_files.append(file_path.resolve())
-
-        # Track all files that are referenced by any .rels file
-        all_referenced_files = set()
+        # Get all files in the package (excluding reference files)
+        all_files = {
+            part
+            for part in graph.files
+            if posixpath.basename(part) != "[Content_Types].xml"
+            and not part.endswith(".rels")
+        }  # These files are not referenced by .rels
 
         if self.verbose:
             print(
-                f"Found {len(rels_files)} .rels files and {len(all_files)} target files"
+                f"Found {len(rels_parts)} .rels files and {len(all_files)} target files"
             )
 
         # Check each .rels file
-        for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+        for rels_part in rels_parts:
+            rel_path = Path(rels_part)
+            if rels_part in graph.errors:
+                errors.append(
+                    Violation(
+                        "file_references",
+                        f"Error parsing {rel_path}: {graph.errors[rels_part]}",
+                        rels_part,
+                        located=False,
+                    )
+                )
+                continue
 
-            except Exception as e:
-                rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+            # Report broken references (external URLs are skipped)
+            for rel in graph.relationships[rels_part]:
+                if not rel.target or is_external_target(rel.target):
+                    continue
+                if rel.part not in graph.files:
+                    errors.append(
+                        Violation(
+                            "file_references",
+                            f"Broken reference to {rel.target}",
+                            rels_part,
+                            rel.line,
+                        )
+                    )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
-        unreferenced_files = set(all_files) - all_referenced_files
-
-        if unreferenced_files:
-            for unref_file in sorted(unreferenced_files):
-                unref_rel_path = unref_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Unreferenced file: {unref_rel_path}")
+        unreferenced_files = all_files - graph.referenced_parts
+
+        for unref_part in sorted(unreferenced_files, key=part_sort_key):
+            errors.append(
+                Violation(
+                    "file_references",
+                    f"Unreferenced file: {Path(unref_part)}",
+                    unref_part,
+                    located=False,
+                )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} relationship validation errors:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             print(
                 "CRITICAL: These errors will cause the document to appear corrupt. "
                 + "Broken references MUST be fixed, "
@@ -390,8 +599,6 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -400,82 +607,25 @@ class BaseSchemaValidator:
             if xml_file.suffix == ".rels":
                 continue
 
-            # Determine the corresponding .rels file
-            # For dir/file.xml, it's dir/_rels/file.xml.rels
-            rels_dir = xml_file.parent / "_rels"
-            rels_file = rels_dir / f"{xml_file.name}.rels"
-
             # Skip if there's no corresponding .rels file (that's okay)
-            if not rels_file.exists():
+            rels_file = self._get_rels_file(xml_file)
+            if rels_file is None:
                 continue
 
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+            errors.extend(
+                self._cached_part_result(
+                    "relationship_ids",
+                    xml_file,
+                    lambda: self._stream_part(xml_file)["relationship_ids"],
+                    depends=[rels_file],
+                )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             print("\nThese ID mismatches will cause the document to appear corrupt!")
             return False
         else:
@@ -524,14 +674,17 @@ class BaseSchemaValidator:
         errors = []
 
         # Find [Content_Types].xml file
-        content_types_file = self.unpacked_dir / "[Content_Types].xml"
-        if not content_types_file.exists():
+        content_types_file = self.package.path("[Content_Types].xml")
+        if not self.package.exists("[Content_Types].xml"):
+            self.report.add_violation(
+                "content_types", "[Content_Types].xml file not found"
+            )
             print("FAILED - [Content_Types].xml file not found")
             return False
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -551,85 +704,67 @@ class BaseSchemaValidator:
                 if extension is not None:
                     declared_extensions.add(extension.lower())
 
-            # Root elements that require content type declaration
-            declarable_roots = {
-                "sld",
-                "sldLayout",
-                "sldMaster",
-                "presentation",  # PowerPoint
-                "document",  # Word
-                "workbook",
-                "worksheet",  # Excel
-                "theme",  # Common
-            }
-
-            # Common media file extensions that should be declared
-            media_extensions = {
-                "png": "image/png",
-                "jpg": "image/jpeg",
-                "jpeg": "image/jpeg",
-                "gif": "image/gif",
-                "bmp": "image/bmp",
-                "tiff": "image/tiff",
-                "wmf": "image/x-wmf",
-                "emf": "image/x-emf",
-            }
-
-            # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
-
-            # Check all XML files for Override declarations
-            for xml_file in self.xml_files:
-                path_str = str(xml_file.relative_to(self.unpacked_dir)).replace(
-                    "\\", "/"
-                )
-
-                # Skip non-content files
-                if any(
-                    skip in path_str
-                    for skip in [".rels", "[Content_Types]", "docProps/", "_rels/"]
-                ):
-                    continue
-
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
-
-                    if root_name in declarable_roots and path_str not in declared_parts:
+            # One pass over the package manifest, shared with the other checks
+            media_errors = []
+            for part in self.package.manifest().values():
+                if part.name.endswith((".xml", ".rels")):
+                    # Check XML files for Override declarations
+                    if any(skip in part.name for skip in self.CONTENT_TYPES_SKIP_XML):
+                        continue  # Skip non-content files
+
+                    root_name = self._root_name(part.name)
+                    if root_name is None:
+                        continue  # Skip unparseable files
+
+                    if (
+                        root_name in self.DECLARABLE_ROOTS
+                        and part.name not in declared_parts
+                    ):
                         errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                            Violation(
+                                "content_types",
+                                f"File with <{root_name}> root not declared in [Content_Types].xml",
+                                part.name,
+                            )
                         )
-
-                except Exception:
-                    continue  # Skip unparseable files
-
-            # Check all non-XML files for Default extension declarations
-            for file_path in all_files:
-                # Skip XML files and metadata files (already checked above)
-                if file_path.suffix.lower() in {".xml", ".rels"}:
                     continue
-                if file_path.name == "[Content_Types].xml":
+
+                # Check non-XML files for Default extension declarations,
+                # skipping metadata files
+                if part.extension in ("xml", "rels"):
                     continue
-                if "_rels" in file_path.parts or "docProps" in file_path.parts:
+                folders = part.name.split("/")[:-1]
+                if "_rels" in folders or "docProps" in folders:
                     continue
 
-                extension = file_path.suffix.lstrip(".").lower()
+                extension = part.extension
                 if extension and extension not in declared_extensions:
                     # Check if it's a known media extension that should be declared
-                    if extension in media_extensions:
-                        relative_path = file_path.relative_to(self.unpacked_dir)
-                        errors.append(
-                            f'  {relative_path}: File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{media_extensions[extension]}"/>'
+                    if extension in self.MEDIA_CONTENT_TYPES:
+                        media_errors.append(
+                            Violation(
+                                "content_types",
+                                f'File with extension \'{extension}\' not declared in [Content_Types].xml - should add: <Default Extension="{extension}" ContentType="{self.MEDIA_CONTENT_TYPES[extension]}"/>',
+                                part.name,
+                            )
                         )
+            errors.extend(media_errors)
 
         except Exception as e:
-            errors.append(f"  Error parsing [Content_Types].xml: {e}")
+            errors.append(
+                Violation(
+                    "content_types",
+                    f"Error parsing [Content_Types].xml: {e}",
+                    "[Content_Types].xml",
+                    located=False,
+                )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} content type declaration errors:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
@@ -638,6 +773,18 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _root_name(self, part_name):
+        """Return the local name of a part's root element (None if unreadable).
+
+        Parts already streamed in this run reuse that pass; any other part
+        is read only up to its root start tag.
+        """
+        streamed = self._streamed.get(self.package.path(part_name))
+        if streamed is not None:
+            return streamed["root_name"]
+        tag = self.package.root_tag(part_name)
+        return local_name(tag) if tag is not None else None
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
@@ -692,11 +839,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        xml_files = self._xsd_files()
+        results = self._validate_files_against_xsd(xml_files)
+        for xml_file, (is_valid, new_file_errors) in zip(xml_files, results):
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -711,15 +857,19 @@ class BaseSchemaValidator:
                 continue
 
             # Has new errors
+            for error in sorted(new_file_errors):
+                self.report.add_violation(
+                    "xsd", error, xml_file.relative_to(self.unpacked_dir).as_posix()
+                )
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(xml_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -738,6 +888,37 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _xsd_files(self):
+        """XML files to validate against schemas: all, or only changed parts."""
+        if self.changed_parts is None:
+            return self.xml_files
+        return [
+            f
+            for f in self.xml_files
+            if f.relative_to(self.unpacked_dir).as_posix() in self.changed_parts
+        ]
+
+    def _validate_files_against_xsd(self, xml_files):
+        """Run validate_file_against_xsd on each of xml_files.
+
+        With jobs > 1 the files are spread across a process pool in which
+        every worker holds its own validator and compiled schemas. Results
+        are always returned in xml_files order, so the report matches a
+        serial run.
+
+        Returns:
+            list: (is_valid, new_errors_set) tuples, one per XML file
+        """
+        if self.jobs == 1 or len(xml_files) < 2:
+            return [self.validate_file_against_xsd(f) for f in xml_files]
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.jobs, len(xml_files)),
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file, self.cache),
+        ) as pool:
+            return list(pool.map(_validate_file_in_xsd_worker, xml_files))
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -823,24 +1004,65 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, content=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        The file is read through the tree cache unless its raw bytes are
+        passed as content (used for parts of the original package). Results
+        are stored in the result cache keyed by content hash and schema, so
+        a part that is byte-identical to one seen before is not revalidated.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
+        if self._result_cache is None:
+            return self._validate_content_against_schema(
+                schema_path, xml_file, base_path, content
+            )
+
+        digest = (
+            self._digest(xml_file)
+            if content is None
+            else hashlib.sha256(content).hexdigest()
+        )
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            relative_path = xml_file.relative_to(base_path)
+        except ValueError:
+            relative_path = Path(xml_file.name)
+        key = ResultCache.make_key(
+            type(self).__name__,
+            "xsd",
+            schema_path.relative_to(self.schemas_dir).as_posix(),
+            bool(
+                relative_path.parts
+                and relative_path.parts[0] in self.MAIN_CONTENT_FOLDERS
+            ),
+            digest,
+        )
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            is_valid, errors = cached
+            return is_valid, set(errors)
+
+        is_valid, errors = self._validate_content_against_schema(
+            schema_path, xml_file, base_path, content
+        )
+        self._result_cache.put(key, [is_valid, sorted(errors)])
+        return is_valid, errors
+
+    def _validate_content_against_schema(self, schema_path, xml_file, base_path, content):
+        """Validate one document against a schema without consulting the result cache."""
+        try:
+            # Load schema (compiled once per process)
+            schema = get_schema(schema_path)
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            if content is None:
+                xml_doc = self._parse(xml_file)
+            else:
+                self._parse_count += 1
+                xml_doc = lxml.etree.parse(io.BytesIO(content))
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
@@ -866,42 +1088,71 @@ class BaseSchemaValidator:
         except Exception as e:
             return False, {str(e)}
 
+    def _read_original_part(self, part_name):
+        """Read a part of the original package into memory.
+
+        The original package is opened once and kept open until close().
+
+        Args:
+            part_name: Part path relative to the package root (e.g. "word/document.xml")
+
+        Returns:
+            bytes: The part content, or None if the original has no such part
+        """
+        source = self._open_original_part(part_name)
+        if source is None:
+            return None
+        with source:
+            return source.read()
+
+    def _open_original_part(self, part_name):
+        """Open a part of the original package for streaming.
+
+        Args:
+            part_name: Part path relative to the package root
+
+        Returns:
+            A binary file object, or None if the original has no such part
+        """
+        if self._original_zip is None:
+            self._original_zip = zipfile.ZipFile(self.original_file, "r")
+        try:
+            info = self._original_zip.getinfo(part_name)
+        except KeyError:
+            return None
+        self._bytes_read += info.file_size
+        return self._original_zip.open(info)
+
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        Results are memoised per part, so each original part is validated at
+        most once per validator run.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
+        part_name = xml_file.relative_to(unpacked_dir).as_posix()
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
-
-            if not original_xml_file.exists():
+        if part_name not in self._original_errors:
+            content = self._read_original_part(part_name)
+            if content is None:
                 # File didn't exist in original, so no original errors
-                return set()
+                errors = set()
+            else:
+                # Validate the specific file in original
+                _, errors = self._validate_single_file_xsd(
+                    xml_file, unpacked_dir, content=content
+                )
+            self._original_errors[part_name] = errors or set()
 
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        return self._original_errors[part_name]
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -947,5 +1198,20 @@ class BaseSchemaValidator:
         return lxml.etree.ElementTree(xml_copy), warnings
 
 
+# Validator owned by an XSD worker process (see _validate_files_against_xsd)
+_xsd_worker_validator = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file, cache):
+    """Create the per-process validator used by XSD pool workers."""
+    global _xsd_worker_validator
+    _xsd_worker_validator = validator_class(unpacked_dir, original_file, cache=cache)
+
+
+def _validate_file_in_xsd_worker(xml_file):
+    """Validate one XML file against its schema inside a pool worker."""
+    return _xsd_worker_validator.validate_file_against_xsd(xml_file)
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
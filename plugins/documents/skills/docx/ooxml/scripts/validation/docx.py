@@ -2,13 +2,14 @@
 Validator for Word document XML files against XSD schemas.
 """
 
-import re
-import tempfile
-import zipfile
-
-import lxml.etree
-
 from .base import BaseSchemaValidator
+from .streaming import (
+    DeletedTextRule,
+    ElementCountRule,
+    InsertedDelTextRule,
+    StreamingChecker,
+    WhitespacePreservationRule,
+)
 
 
 class DOCXSchemaValidator(BaseSchemaValidator):
@@ -22,52 +23,66 @@ class DOCXSchemaValidator(BaseSchemaValidator):
     ELEMENT_RELATIONSHIP_TYPES = {}
 
     def validate(self):
-        """Run all validation checks and return True if all pass."""
+        """Run all validation checks.
+
+        Returns:
+            ValidationReport: Violations and per-check costs; truthy if all pass
+        """
+        self.report = self._new_report()
+        check = self._run_check
+
         # Test 0: XML well-formedness
-        if not self.validate_xml():
-            return False
+        if not check("xml", self.validate_xml):
+            return self.report
 
         # Test 1: Namespace declarations
-        all_valid = True
-        if not self.validate_namespaces():
-            all_valid = False
+        check("namespaces", self.validate_namespaces)
 
         # Test 2: Unique IDs
-        if not self.validate_unique_ids():
-            all_valid = False
+        check("unique_ids", self.validate_unique_ids)
 
         # Test 3: Relationship and file reference validation
-        if not self.validate_file_references():
-            all_valid = False
+        check("file_references", self.validate_file_references)
 
         # Test 4: Content type declarations
-        if not self.validate_content_types():
-            all_valid = False
+        check("content_types", self.validate_content_types)
 
         # Test 5: XSD schema validation
-        if not self.validate_against_xsd():
-            all_valid = False
+        check("xsd", self.validate_against_xsd)
 
         # Test 6: Whitespace preservation
-        if not self.validate_whitespace_preservation():
-            all_valid = False
+        check("whitespace", self.validate_whitespace_preservation)
 
         # Test 7: Deletion validation
-        if not self.validate_deletions():
-            all_valid = False
+        check("deletions", self.validate_deletions)
 
         # Test 8: Insertion validation
-        if not self.validate_insertions():
-            all_valid = False
+        check("insertions", self.validate_insertions)
 
         # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
+        check("relationship_ids", self.validate_all_relationship_ids)
 
         # Count and compare paragraphs
         self.compare_paragraph_counts()
 
-        return all_valid
+        return self.report
+
+    def _streaming_rules(self, xml_file):
+        """Add the tracked-change text rules for document.xml files."""
+        rules = super()._streaming_rules(xml_file)
+        if xml_file.name == "document.xml":
+            label = rules["xml"].label
+            rules["whitespace"] = WhitespacePreservationRule(
+                label, self.WORD_2006_NAMESPACE
+            )
+            rules["deletions"] = DeletedTextRule(label, self.WORD_2006_NAMESPACE)
+            rules["insertions"] = InsertedDelTextRule(label, self.WORD_2006_NAMESPACE)
+            rules["paragraphs"] = self._paragraph_rule(label)
+        return rules
+
+    def _paragraph_rule(self, label):
+        """Return a rule counting w:p elements."""
+        return ElementCountRule(label, f"{{{self.WORD_2006_NAMESPACE}}}p")
 
     def validate_whitespace_preservation(self):
         """
@@ -80,41 +95,17 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements
-                for elem in root.iter(f"{{{self.WORD_2006_NAMESPACE}}}t"):
-                    if elem.text:
-                        text = elem.text
-                        # Check if text starts or ends with whitespace
-                        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
-                            # Check if xml:space="preserve" attribute exists
-                            xml_space_attr = f"{{{self.XML_NAMESPACE}}}space"
-                            if (
-                                xml_space_attr not in elem.attrib
-                                or elem.attrib[xml_space_attr] != "preserve"
-                            ):
-                                # Show a preview of the text
-                                text_preview = (
-                                    repr(text)[:50] + "..."
-                                    if len(repr(text)) > 50
-                                    else repr(text)
-                                )
-                                errors.append(
-                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                    f"Line {elem.sourceline}: w:t element with whitespace missing xml:space='preserve': {text_preview}"
-                                )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_result(
+                    "whitespace", xml_file, lambda: self._stream_part(xml_file)["whitespace"]
                 )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} whitespace preservation violations:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
@@ -133,37 +124,17 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all w:t elements that are descendants of w:del elements
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-                xpath_expression = ".//w:del//w:t"
-                problematic_t_elements = root.xpath(
-                    xpath_expression, namespaces=namespaces
-                )
-                for t_elem in problematic_t_elements:
-                    if t_elem.text:
-                        # Show a preview of the text
-                        text_preview = (
-                            repr(t_elem.text)[:50] + "..."
-                            if len(repr(t_elem.text)) > 50
-                            else repr(t_elem.text)
-                        )
-                        errors.append(
-                            f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                            f"Line {t_elem.sourceline}: <w:t> found within <w:del>: {text_preview}"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_result(
+                    "deletions", xml_file, lambda: self._stream_part(xml_file)["deletions"]
                 )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} deletion validation violations:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
@@ -179,13 +150,17 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
-            except Exception as e:
-                print(f"Error counting paragraphs in unpacked document: {e}")
+            # Counted during the part's streaming pass
+            paragraphs = self._cached_part_result(
+                "paragraphs", xml_file, lambda: self._stream_part(xml_file)["paragraphs"]
+            )
+            if paragraphs is None:
+                print(
+                    f"Error counting paragraphs in unpacked document: "
+                    f"{xml_file.relative_to(self.unpacked_dir)} could not be parsed"
+                )
+            else:
+                count = paragraphs
 
         return count
 
@@ -194,19 +169,16 @@ class DOCXSchemaValidator(BaseSchemaValidator):
         count = 0
 
         try:
-            # Create temporary directory to unpack original
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Unpack original docx
-                with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                    zip_ref.extractall(temp_dir)
-
-                # Parse document.xml
-                doc_xml_path = temp_dir + "/word/document.xml"
-                root = lxml.etree.parse(doc_xml_path).getroot()
-
-                # Count all w:p elements
-                paragraphs = root.findall(f".//{{{self.WORD_2006_NAMESPACE}}}p")
-                count = len(paragraphs)
+            # Stream document.xml straight from the original package
+            source = self._open_original_part("word/document.xml")
+            if source is None:
+                raise FileNotFoundError("word/document.xml not found")
+            with source:
+                rule = self._paragraph_rule("word/document.xml")
+                StreamingChecker({"paragraphs": rule}).run(source)
+            if rule.results is None:
+                raise ValueError("word/document.xml could not be parsed")
+            count = rule.results
 
         except Exception as e:
             print(f"Error counting paragraphs in original document: {e}")
@@ -224,36 +196,17 @@ class DOCXSchemaValidator(BaseSchemaValidator):
             if xml_file.name != "document.xml":
                 continue
 
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                namespaces = {"w": self.WORD_2006_NAMESPACE}
-
-                # Find w:delText in w:ins that are NOT within w:del
-                invalid_elements = root.xpath(
-                    ".//w:ins//w:delText[not(ancestor::w:del)]",
-                    namespaces=namespaces
-                )
-
-                for elem in invalid_elements:
-                    text_preview = (
-                        repr(elem.text or "")[:50] + "..."
-                        if len(repr(elem.text or "")) > 50
-                        else repr(elem.text or "")
-                    )
-                    errors.append(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Line {elem.sourceline}: <w:delText> within <w:ins>: {text_preview}"
-                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_result(
+                    "insertions", xml_file, lambda: self._stream_part(xml_file)["insertions"]
                 )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} insertion validation violations:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
@@ -0,0 +1,250 @@
+"""
+Read-only access to the parts of an OOXML package.
+
+Validators read parts through a Package instead of the filesystem, so the
+same checks run on an unpacked directory or straight from a .docx/.pptx/
+.xlsx archive. Archive members are streamed with ZipFile.open; nothing is
+extracted to disk.
+
+Parts are addressed by package-relative POSIX names ("word/document.xml").
+path() turns a name into root / name, which is how validators refer to
+parts; for a ZipPackage the root is the archive itself, so those paths do
+not exist on disk, but relative_to(root) still gives the part name and
+every message reads the same as for an unpacked directory.
+
+The package is listed once, into a manifest of PartInfo records shared by
+every check that needs the file list, sizes or extensions.
+"""
+
+import fnmatch
+import os
+import posixpath
+import zipfile
+from pathlib import Path, PurePosixPath
+
+import lxml.etree
+
+
+def open_package(source):
+    """Return a Package for an unpacked directory or an Office archive.
+
+    Args:
+        source: Package instance, directory path or archive path
+
+    Raises:
+        FileNotFoundError: If source is neither a directory nor a zip archive
+    """
+    if isinstance(source, Package):
+        return source
+    source = Path(source)
+    if source.is_dir():
+        return DirectoryPackage(source)
+    if source.is_file() and zipfile.is_zipfile(source):
+        return ZipPackage(source)
+    raise FileNotFoundError(f"{source} is not a directory or an Office file")
+
+
+class PartInfo:
+    """One file of a package manifest."""
+
+    def __init__(self, name, size):
+        """
+        Args:
+            name: Package-relative POSIX path
+            size: Size in bytes (uncompressed for archive members)
+        """
+        self.name = name
+        self.size = size
+        # Lowercase extension without the dot ("" if none)
+        self.extension = posixpath.splitext(name)[1].lstrip(".").lower()
+
+    def __repr__(self):
+        return f"PartInfo({self.name!r}, {self.size!r})"
+
+
+class Package:
+    """Files of an OOXML package. Subclasses implement the storage."""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self._manifest = None
+        self._root_tags = {}
+
+    def manifest(self):
+        """Return every file in the package, listing it on first use.
+
+        Returns:
+            dict: Part name -> PartInfo, in listing order
+        """
+        if self._manifest is None:
+            self._manifest = {info.name: info for info in self._list()}
+        return self._manifest
+
+    def names(self):
+        """Return the names of every file in the package."""
+        return list(self.manifest())
+
+    def root_tag(self, name):
+        """Return the Clark tag of a part's root element.
+
+        Only the start of the part is read, up to the root start tag.
+
+        Returns:
+            str: The tag, or None if the part cannot be read that far
+        """
+        if name not in self._root_tags:
+            tag = None
+            try:
+                with self.open(name) as f:
+                    for _, elem in lxml.etree.iterparse(
+                        f, events=("start",), resolve_entities=False, no_network=True
+                    ):
+                        tag = elem.tag
+                        break
+            except (lxml.etree.XMLSyntaxError, OSError):
+                pass
+            self._root_tags[name] = tag
+        return self._root_tags[name]
+
+    def _list(self):
+        """Yield a PartInfo for every file in the package."""
+        raise NotImplementedError
+
+    def exists(self, name):
+        """Return True if the package has a file with this name."""
+        raise NotImplementedError
+
+    def open(self, name):
+        """Open a file for reading as a binary file object."""
+        raise NotImplementedError
+
+    def size(self, name):
+        """Return a file's uncompressed size in bytes."""
+        info = self.manifest().get(name)
+        if info is None:
+            raise FileNotFoundError(f"{name} not found in {self.root}")
+        return info.size
+
+    def read(self, name):
+        """Return a file's content."""
+        with self.open(name) as f:
+            return f.read()
+
+    def path(self, name):
+        """Return the path validators use for a part (root / name)."""
+        return self.root / name
+
+    def name(self, path):
+        """Return the part name of a path returned by path()."""
+        return Path(path).relative_to(self.root).as_posix()
+
+    def rglob(self, pattern):
+        """Paths of files whose base name matches pattern, anywhere in the package."""
+        return [
+            self.path(name)
+            for name in self.manifest()
+            if fnmatch.fnmatchcase(name.rsplit("/", 1)[-1], pattern)
+        ]
+
+    def glob(self, pattern):
+        """Paths of files matching a package-relative pattern such as "ppt/slides/*.xml"."""
+        depth = pattern.count("/")
+        return [
+            self.path(name)
+            for name in self.manifest()
+            if name.count("/") == depth and PurePosixPath(name).match(pattern)
+        ]
+
+    def close(self):
+        """Release the underlying storage; a directory holds nothing open."""
+
+
+class DirectoryPackage(Package):
+    """An unpacked package directory."""
+
+    def exists(self, name):
+        # Checked on disk, so callers see files changed after the listing
+        return (self.root / name).is_file()
+
+    def open(self, name):
+        return open(self.root / name, "rb")
+
+    def read(self, name):
+        return (self.root / name).read_bytes()
+
+    def _list(self, directory=None, prefix=""):
+        """Walk the directory top-down in os.walk order, files before subdirectories."""
+        subdirectories = []
+        with os.scandir(directory or self.root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    subdirectories.append(entry)
+                elif entry.is_file():
+                    yield PartInfo(prefix + entry.name, entry.stat().st_size)
+        for entry in subdirectories:
+            yield from self._list(entry.path, f"{prefix}{entry.name}/")
+
+
+class OverlayPackage(Package):
+    """A directory of changed parts layered over a complete unpacked directory.
+
+    Parts in root shadow the parts of the same name in base, and parts only
+    in root are added, so root only needs to hold the files that changed.
+    As with a ZipPackage, path() names a file under root that may not exist
+    on disk.
+    """
+
+    def __init__(self, root, base):
+        super().__init__(root)
+        self.upper = DirectoryPackage(root)
+        self.base = DirectoryPackage(base)
+
+    def _layer(self, name):
+        return self.upper if self.upper.exists(name) else self.base
+
+    def exists(self, name):
+        return self.upper.exists(name) or self.base.exists(name)
+
+    def open(self, name):
+        return self._layer(name).open(name)
+
+    def read(self, name):
+        return self._layer(name).read(name)
+
+    def _list(self):
+        """List base in its own order with changed parts in place, then added parts."""
+        changed = {info.name: info for info in self.upper._list()}
+        for info in self.base._list():
+            yield changed.pop(info.name, info)
+        yield from changed.values()
+
+
+class ZipPackage(Package):
+    """A packed Office file, read member by member without extracting it."""
+
+    def __init__(self, root):
+        super().__init__(root)
+        self._zip = zipfile.ZipFile(self.root, "r")
+        self._members = {
+            info.filename: info for info in self._zip.infolist() if not info.is_dir()
+        }
+
+    def exists(self, name):
+        return name in self._members
+
+    def open(self, name):
+        try:
+            return self._zip.open(self._members[name])
+        except KeyError:
+            raise FileNotFoundError(f"{name} not found in {self.root}") from None
+
+    def _list(self):
+        for name, info in self._members.items():
+            yield PartInfo(name, info.file_size)
+
+    def close(self):
+        self._zip.close()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -5,6 +5,7 @@ Validator for PowerPoint presentation XML files against XSD schemas.
 import re
 
 from .base import BaseSchemaValidator
+from .report import Violation
 
 
 class PPTXSchemaValidator(BaseSchemaValidator):
@@ -26,98 +27,112 @@ class PPTXSchemaValidator(BaseSchemaValidator):
     }
 
     def validate(self):
-        """Run all validation checks and return True if all pass."""
+        """Run all validation checks.
+
+        Returns:
+            ValidationReport: Violations and per-check costs; truthy if all pass
+        """
+        self.report = self._new_report()
+        check = self._run_check
+
         # Test 0: XML well-formedness
-        if not self.validate_xml():
-            return False
+        if not check("xml", self.validate_xml):
+            return self.report
 
         # Test 1: Namespace declarations
-        all_valid = True
-        if not self.validate_namespaces():
-            all_valid = False
+        check("namespaces", self.validate_namespaces)
 
         # Test 2: Unique IDs
-        if not self.validate_unique_ids():
-            all_valid = False
+        check("unique_ids", self.validate_unique_ids)
 
         # Test 3: UUID ID validation
-        if not self.validate_uuid_ids():
-            all_valid = False
+        check("uuid_ids", self.validate_uuid_ids)
 
         # Test 4: Relationship and file reference validation
-        if not self.validate_file_references():
-            all_valid = False
+        check("file_references", self.validate_file_references)
 
         # Test 5: Slide layout ID validation
-        if not self.validate_slide_layout_ids():
-            all_valid = False
+        check("slide_layout_ids", self.validate_slide_layout_ids)
 
         # Test 6: Content type declarations
-        if not self.validate_content_types():
-            all_valid = False
+        check("content_types", self.validate_content_types)
 
         # Test 7: XSD schema validation
-        if not self.validate_against_xsd():
-            all_valid = False
+        check("xsd", self.validate_against_xsd)
 
         # Test 8: Notes slide reference validation
-        if not self.validate_notes_slide_references():
-            all_valid = False
+        check("notes_slide_references", self.validate_notes_slide_references)
 
         # Test 9: Relationship ID reference validation
-        if not self.validate_all_relationship_ids():
-            all_valid = False
+        check("relationship_ids", self.validate_all_relationship_ids)
 
         # Test 10: Duplicate slide layout references validation
-        if not self.validate_no_duplicate_slide_layouts():
-            all_valid = False
+        check("duplicate_slide_layouts", self.validate_no_duplicate_slide_layouts)
 
-        return all_valid
+        return self.report
 
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
         errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
+            errors.extend(
+                self._cached_part_result(
+                    "uuid_ids", xml_file, lambda: self._uuid_id_errors(xml_file)
                 )
+            )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
                 print("PASSED - All UUID-like IDs contain valid hex values")
             return True
 
+    def _uuid_id_errors(self, xml_file):
+        """Return UUID-like ID attributes with invalid hex characters in one file."""
+        import lxml.etree
+
+        errors = []
+        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+        uuid_pattern = re.compile(
+            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+        )
+
+        try:
+            root = self._parse(xml_file).getroot()
+
+            # Check all elements for ID attributes
+            for elem in root.iter():
+                for attr, value in elem.attrib.items():
+                    # Check if this is an ID attribute
+                    attr_name = attr.split("}")[-1].lower()
+                    if attr_name == "id" or attr_name.endswith("id"):
+                        # Check if value looks like a UUID (has the right length and pattern structure)
+                        if self._looks_like_uuid(value):
+                            # Validate that it contains only hex characters in the right positions
+                            if not uuid_pattern.match(value):
+                                errors.append(
+                                    Violation(
+                                        "uuid_ids",
+                                        f"ID '{value}' appears to be a UUID but contains invalid hex characters",
+                                        xml_file.relative_to(self.unpacked_dir),
+                                        elem.sourceline,
+                                    )
+                                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                Violation(
+                    "uuid_ids", f"Error: {e}", xml_file.relative_to(self.unpacked_dir)
+                )
+            )
+        return errors
+
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
         # Remove common UUID delimiters
@@ -132,7 +147,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         errors = []
 
         # Find all slide master files
-        slide_masters = list(self.unpacked_dir.glob("ppt/slideMasters/*.xml"))
+        slide_masters = list(self.package.glob("ppt/slideMasters/*.xml"))
 
         if not slide_masters:
             if self.verbose:
@@ -142,20 +157,23 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for slide_master in slide_masters:
             try:
                 # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
+                root = self._parse(slide_master).getroot()
 
                 # Find the corresponding _rels file for this slide master
                 rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
 
-                if not rels_file.exists():
+                if not self.package.exists(self.package.name(rels_file)):
                     errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                        Violation(
+                            "slide_layout_ids",
+                            f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}",
+                            slide_master.relative_to(self.unpacked_dir),
+                        )
                     )
                     continue
 
                 # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse(rels_file).getroot()
 
                 # Build a set of valid relationship IDs that point to slide layouts
                 valid_layout_rids = set()
@@ -177,20 +195,29 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                     if r_id and r_id not in valid_layout_rids:
                         errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
+                            Violation(
+                                "slide_layout_ids",
+                                f"sldLayoutId with id='{layout_id}' "
+                                f"references r:id='{r_id}' which is not found in slide layout relationships",
+                                slide_master.relative_to(self.unpacked_dir),
+                                sld_layout_id.sourceline,
+                            )
                         )
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+                    Violation(
+                        "slide_layout_ids",
+                        f"Error: {e}",
+                        slide_master.relative_to(self.unpacked_dir),
+                    )
                 )
 
         if errors:
+            self.report.add_violations(errors)
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             print(
                 "Remove invalid references or add missing slide layouts to the relationships file."
             )
@@ -202,14 +229,12 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_no_duplicate_slide_layouts(self):
         """Validate that each slide has exactly one slideLayout reference."""
-        import lxml.etree
-
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = list(self.package.glob("ppt/slides/_rels/*.xml.rels"))
 
         for rels_file in slide_rels_files:
             try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse(rels_file).getroot()
 
                 # Find all slideLayout relationships
                 layout_rels = [
@@ -222,18 +247,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
                 if len(layout_rels) > 1:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        Violation(
+                            "duplicate_slide_layouts",
+                            f"has {len(layout_rels)} slideLayout references",
+                            rels_file.relative_to(self.unpacked_dir),
+                        )
                     )
 
             except Exception as e:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    Violation(
+                        "duplicate_slide_layouts",
+                        f"Error: {e}",
+                        rels_file.relative_to(self.unpacked_dir),
+                    )
                 )
 
         if errors:
+            self.report.add_violations(errors)
             print("FAILED - Found slides with duplicate slideLayout references:")
             for error in errors:
-                print(error)
+                print(f"  {error}")
             return False
         else:
             if self.verbose:
@@ -248,7 +282,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
         # Find all slide relationship files
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        slide_rels_files = list(self.package.glob("ppt/slides/_rels/*.xml.rels"))
 
         if not slide_rels_files:
             if self.verbose:
@@ -258,7 +292,7 @@ class PPTXSchemaValidator(BaseSchemaValidator):
         for rels_file in slide_rels_files:
             try:
                 # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
+                root = self._parse(rels_file).getroot()
 
                 # Find all notesSlide relationships
                 for rel in root.findall(
@@ -284,25 +318,38 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    Violation(
+                        "notes_slide_references",
+                        f"Error: {e}",
+                        rels_file.relative_to(self.unpacked_dir),
+                    )
                 )
 
-        # Check for duplicate references
+        # Check for duplicate references; each is printed with the
+        # relationship files that reference the notes slide
+        referencing_files = {}
         for target, references in notes_slide_references.items():
             if len(references) > 1:
                 slide_names = [ref[0] for ref in references]
-                errors.append(
-                    f"  Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}"
+                error = Violation(
+                    "notes_slide_references",
+                    f"Notes slide '{target}' is referenced by multiple slides: {', '.join(slide_names)}",
                 )
-                for slide_name, rels_file in references:
-                    errors.append(f"    - {rels_file.relative_to(self.unpacked_dir)}")
+                errors.append(error)
+                referencing_files[error] = [
+                    rels_file.relative_to(self.unpacked_dir)
+                    for _, rels_file in references
+                ]
 
         if errors:
+            self.report.add_violations(errors)
             print(
-                f"FAILED - Found {len([e for e in errors if not e.startswith('    ')])} notes slide reference validation errors:"
+                f"FAILED - Found {len(errors)} notes slide reference validation errors:"
             )
             for error in errors:
-                print(error)
+                print(f"  {error}")
+                for rels_file in referencing_files.get(error, ()):
+                    print(f"    - {rels_file}")
             print("Each slide may optionally have its own slide file.")
             return False
         else:
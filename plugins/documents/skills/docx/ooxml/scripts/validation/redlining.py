@@ -1,119 +1,365 @@
 """
 Validator for tracked changes in Word documents.
+
+word/document.xml is streamed, from the edited package (unpacked directory
+or .docx) and straight from the original .docx, and the two paragraph-text streams are compared as they
+are produced, so neither document is held in memory as a tree. Paragraph
+texts (with Claude's tracked changes removed) are remembered in a
+ParagraphMemo by a fingerprint of the paragraph's XML: only paragraphs whose
+XML has not been seen before are walked, and a memo shared across runs (as
+Document does) reads the original document once per session.
 """
 
-import subprocess
-import tempfile
+import hashlib
 import zipfile
+from collections import OrderedDict, deque
+from itertools import zip_longest
 from pathlib import Path
 
+import lxml.etree
+
+from .package import DirectoryPackage, open_package
+from .report import ValidationReport
+from .text_diff import paragraph_diff
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+DOCUMENT_PART = "word/document.xml"
+CLAUDE_AUTHOR = "Claude"
+
+# Bytes fed to the parser at a time
+CHUNK_SIZE = 64 * 1024
+
+P_TAG = f"{{{W_NAMESPACE}}}p"
+T_TAG = f"{{{W_NAMESPACE}}}t"
+DELTEXT_TAG = f"{{{W_NAMESPACE}}}delText"
+INS_TAG = f"{{{W_NAMESPACE}}}ins"
+DEL_TAG = f"{{{W_NAMESPACE}}}del"
+AUTHOR_ATTR = f"{{{W_NAMESPACE}}}author"
+
+
+class ParagraphMemo:
+    """Paragraph texts remembered across RedliningValidator runs.
+
+    Paragraphs that hold tracked changes by Claude or nested paragraphs need
+    the full redlining rules; their texts are keyed by a fingerprint of the
+    paragraph's XML and whether it sits inside a w:del by Claude, so each
+    version of such a paragraph is walked once. Plain paragraphs are read
+    directly, which costs no more than fingerprinting them. The original
+    document's texts are also kept per file (path, size and modification
+    time).
+
+    Both are least-recently-used caches bounded by max_texts paragraphs and
+    max_originals documents, so a long-lived memo (a Document session or a
+    batch worker) does not grow without limit.
+    """
+
+    def __init__(self, max_texts=20000, max_originals=4):
+        self.max_texts = max_texts
+        self.max_originals = max_originals
+        self.texts = OrderedDict()  # fingerprint -> tuple of paragraph texts
+        self.originals = OrderedDict()  # (path, size, mtime) -> list of paragraph texts
+        self.hits = 0
+        self.misses = 0
+
+    def paragraph_texts(self, paragraph, unwrapped):
+        """Return the texts a top-level w:p contributes, computing them if new.
+
+        Args:
+            paragraph: lxml w:p element with no w:p ancestor
+            unwrapped: True if the paragraph is inside a w:del by Claude
+
+        Returns:
+            tuple: Non-empty texts of the paragraph and any paragraphs nested
+                in it, in start order
+        """
+        text = None if unwrapped else _plain_text(paragraph)
+        if text is not None:
+            return (text,) if text else ()
+
+        xml = lxml.etree.tostring(paragraph, with_tail=False)
+        key = (hashlib.blake2b(xml, digest_size=16).digest(), unwrapped)
+        texts = self.texts.get(key)
+        if texts is None:
+            self.misses += 1
+            target = _TrackedTextTarget(unwrapped=unwrapped)
+            _replay(paragraph, target)
+            texts = tuple(target.take_paragraphs())
+            _remember(self.texts, key, texts, self.max_texts)
+        else:
+            self.hits += 1
+            self.texts.move_to_end(key)
+        return texts
+
+    def original_texts(self, key):
+        """Return the remembered texts of an original document, or None."""
+        texts = self.originals.get(key)
+        if texts is not None:
+            self.originals.move_to_end(key)
+        return texts
+
+    def remember_original(self, key, texts):
+        """Remember the paragraph texts of an original document."""
+        _remember(self.originals, key, texts, self.max_originals)
+
+
+def _remember(cache, key, value, limit):
+    """Add an entry to an LRU OrderedDict, evicting the oldest beyond limit."""
+    cache[key] = value
+    while len(cache) > limit:
+        cache.popitem(last=False)
+
 
 class RedliningValidator:
     """Validator for tracked changes in Word documents."""
 
-    def __init__(self, unpacked_dir, original_docx, verbose=False):
-        self.unpacked_dir = Path(unpacked_dir)
+    def __init__(
+        self,
+        unpacked_dir,
+        original_docx,
+        verbose=False,
+        changed_parts=None,
+        diff=True,
+        memo=None,
+    ):
+        """
+        Args:
+            unpacked_dir: Unpacked (edited) document directory, .docx file or
+                Package
+            original_docx: Original .docx file
+            verbose: Print PASSED messages
+            changed_parts: Parts edited since original_docx (None = unknown)
+            diff: If True, a text mismatch is reported with a character-level
+                diff of the whole document; if False, comparison stops at the
+                first differing paragraph and only that paragraph is reported
+            memo: ParagraphMemo to reuse paragraph texts from earlier runs
+                (default: a new memo for this validator)
+        """
+        try:
+            self.package = open_package(unpacked_dir)
+        except FileNotFoundError:
+            # Reported as a missing document.xml by validate()
+            self.package = DirectoryPackage(unpacked_dir)
+        self._owns_package = self.package is not unpacked_dir
+        self.unpacked_dir = (
+            Path(unpacked_dir) if self._owns_package else self.package.root
+        )
         self.original_docx = Path(original_docx)
         self.verbose = verbose
-        self.namespaces = {
-            "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-        }
-
-    def validate(self):
-        """Main validation method that returns True if valid, False otherwise."""
-        # Verify unpacked directory exists and has correct structure
-        modified_file = self.unpacked_dir / "word" / "document.xml"
-        if not modified_file.exists():
-            print(f"FAILED - Modified document.xml not found at {modified_file}")
-            return False
+        self.diff = diff
+        self.memo = memo if memo is not None else ParagraphMemo()
 
-        # First, check if there are any tracked changes by Claude to validate
-        try:
-            import xml.etree.ElementTree as ET
+        # Parts edited since original_docx (None = unknown)
+        self.changed_parts = (
+            None
+            if changed_parts is None
+            else {str(part).replace("\\", "/") for part in changed_parts}
+        )
 
-            tree = ET.parse(modified_file)
-            root = tree.getroot()
+        # I/O counters sampled by the report
+        self._parse_count = 0
+        self._bytes_read = 0
+        self.report = ValidationReport(type(self).__name__, self.package)
 
-            # Check for w:del or w:ins tags authored by Claude
-            del_elements = root.findall(".//w:del", self.namespaces)
-            ins_elements = root.findall(".//w:ins", self.namespaces)
+    def validate(self):
+        """Main validation method.
 
-            # Filter to only include changes by Claude
-            claude_del_elements = [
-                elem
-                for elem in del_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
-            claude_ins_elements = [
-                elem
-                for elem in ins_elements
-                if elem.get(f"{{{self.namespaces['w']}}}author") == "Claude"
-            ]
+        Returns:
+            ValidationReport: Truthy if valid, with any violation recorded
+        """
+        self.report = ValidationReport(type(self).__name__, self.package)
+        self.report.time_check(
+            "tracked_changes",
+            self._validate_tracked_changes,
+            lambda: (self._parse_count, self._bytes_read),
+        )
+        return self.report
+
+    def close(self):
+        """Close the package this validator opened; its report stays usable."""
+        if self._owns_package:
+            self.package.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _fail(self, message, file=None):
+        """Print a FAILED message and record it in the report."""
+        self.report.add_violation("tracked_changes", message, file)
+        print(f"FAILED - {message}")
+        return False
+
+    def _validate_tracked_changes(self):
+        """Check that all changes by Claude are tracked. Returns True if valid."""
+        # Verify unpacked directory exists and has correct structure
+        modified_file = self.unpacked_dir / "word" / "document.xml"
+        if not self.package.exists(DOCUMENT_PART):
+            return self._fail(f"Modified document.xml not found at {modified_file}")
 
-            # Redlining validation is only needed if tracked changes by Claude have been used.
-            if not claude_del_elements and not claude_ins_elements:
-                if self.verbose:
-                    print("PASSED - No tracked changes by Claude found.")
-                return True
+        # An unedited document.xml cannot contain untracked changes
+        if self.changed_parts is not None and DOCUMENT_PART not in self.changed_parts:
+            if self.verbose:
+                print("PASSED - word/document.xml is unchanged")
+            return True
 
+        # Redlining validation is only needed if tracked changes by Claude have
+        # been used; the scan stops at the first one
+        try:
+            with self.package.open(DOCUMENT_PART) as stream:
+                has_claude_changes = self._has_claude_changes(stream)
         except Exception:
             # If we can't parse the XML, continue with full validation
-            pass
-
-        # Create temporary directory for unpacking original docx
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+            has_claude_changes = True
+        if not has_claude_changes:
+            if self.verbose:
+                print("PASSED - No tracked changes by Claude found.")
+            return True
 
-            # Unpack original docx
-            try:
-                with zipfile.ZipFile(self.original_docx, "r") as zip_ref:
-                    zip_ref.extractall(temp_path)
-            except Exception as e:
-                print(f"FAILED - Error unpacking original docx: {e}")
-                return False
-
-            original_file = temp_path / "word" / "document.xml"
-            if not original_file.exists():
-                print(
-                    f"FAILED - Original document.xml not found in {self.original_docx}"
+        # Read document.xml straight from the original docx
+        try:
+            original_zip = zipfile.ZipFile(self.original_docx, "r")
+        except Exception as e:
+            return self._fail(f"Error unpacking original docx: {e}")
+
+        with original_zip:
+            if DOCUMENT_PART not in original_zip.namelist():
+                return self._fail(
+                    f"Original document.xml not found in {self.original_docx}"
                 )
-                return False
 
-            # Parse both XML files using xml.etree.ElementTree for redlining validation
+            # Compare paragraph by paragraph, stopping at the first difference
             try:
-                import xml.etree.ElementTree as ET
-
-                modified_tree = ET.parse(modified_file)
-                modified_root = modified_tree.getroot()
-                original_tree = ET.parse(original_file)
-                original_root = original_tree.getroot()
-            except ET.ParseError as e:
-                print(f"FAILED - Error parsing XML files: {e}")
-                return False
-
-            # Remove Claude's tracked changes from both documents
-            self._remove_claude_tracked_changes(original_root)
-            self._remove_claude_tracked_changes(modified_root)
-
-            # Extract and compare text content
-            modified_text = self._extract_text_content(modified_root)
-            original_text = self._extract_text_content(original_root)
-
-            if modified_text != original_text:
-                # Show detailed character-level differences for each paragraph
-                error_message = self._generate_detailed_diff(
-                    original_text, modified_text
-                )
-                print(error_message)
-                return False
+                with self.package.open(DOCUMENT_PART) as modified:
+                    difference = self._first_difference(
+                        self._original_paragraphs(original_zip),
+                        self._paragraph_texts(modified),
+                    )
+                if difference is None:
+                    if self.verbose:
+                        print("PASSED - All changes by Claude are properly tracked")
+                    return True
+
+                if self.diff:
+                    # Show the differences of each changed paragraph
+                    with self.package.open(DOCUMENT_PART) as modified:
+                        error_message = self._generate_detailed_diff(
+                            list(self._original_paragraphs(original_zip)),
+                            list(self._paragraph_texts(modified)),
+                        )
+                else:
+                    error_message = self._generate_first_difference(*difference)
+            except lxml.etree.XMLSyntaxError as e:
+                return self._fail(f"Error parsing XML files: {e}")
+
+        self.report.add_violation(
+            "tracked_changes",
+            error_message.removeprefix("FAILED - "),
+            DOCUMENT_PART,
+        )
+        print(error_message)
+        return False
+
+    def _first_difference(self, original, modified):
+        """Compare two paragraph-text streams.
+
+        Returns:
+            tuple: (index, original_text, modified_text) of the first differing
+                non-empty paragraph (None past the end of a document), or None
+                if the texts match
+        """
+        paragraphs = zip_longest(original, modified)
+        for index, (original_text, modified_text) in enumerate(paragraphs):
+            if original_text != modified_text:
+                return index, original_text, modified_text
+        return None
 
-            if self.verbose:
-                print("PASSED - All changes by Claude are properly tracked")
-            return True
+    def _feed(self, stream, target):
+        """Yield after feeding each chunk of stream to a parser with target.
 
-    def _generate_detailed_diff(self, original_text, modified_text):
-        """Generate detailed word-level differences using git word diff."""
-        error_parts = [
+        Stops early if the caller stops iterating; the document is only
+        checked for completeness once the whole stream has been fed.
+        """
+        parser = lxml.etree.XMLParser(
+            target=target, resolve_entities=False, no_network=True, load_dtd=False
+        )
+        self._parse_count += 1
+        while chunk := stream.read(CHUNK_SIZE):
+            self._bytes_read += len(chunk)
+            parser.feed(chunk)
+            yield
+        parser.close()
+        yield
+
+    def _has_claude_changes(self, stream):
+        """Return True once a w:ins or w:del authored by Claude is seen."""
+        target = _TrackedTextTarget()
+        for _ in self._feed(stream, target):
+            if target.claude_changes:
+                return True
+        return False
+
+    def _original_paragraphs(self, original_zip):
+        """Yield the original's paragraph texts, from the memo once read in full."""
+        stat = self.original_docx.stat()
+        key = (str(self.original_docx.resolve()), stat.st_size, stat.st_mtime_ns)
+        texts = self.memo.original_texts(key)
+        if texts is not None:
+            yield from texts
+            return
+
+        texts = []
+        with original_zip.open(DOCUMENT_PART) as original:
+            for text in self._paragraph_texts(original):
+                texts.append(text)
+                yield text
+        self.memo.remember_original(key, texts)
+
+    def _paragraph_texts(self, stream):
+        """Yield each non-empty paragraph's text with Claude's changes removed.
+
+        Only w:p end events reach Python. Each top-level paragraph is looked
+        up in the memo by the fingerprint of its XML and then released, so
+        memory stays bounded by the largest paragraph.
+        """
+        self._parse_count += 1
+        events = lxml.etree.iterparse(
+            _CountingReader(stream, self),
+            events=("end",),
+            tag=P_TAG,
+            resolve_entities=False,
+            no_network=True,
+        )
+        for _, paragraph in events:
+            nested = dropped = unwrapped = False
+            for ancestor in paragraph.iterancestors(P_TAG, INS_TAG, DEL_TAG):
+                if ancestor.tag == P_TAG:
+                    nested = True
+                    break
+                if ancestor.get(AUTHOR_ATTR) == CLAUDE_AUTHOR:
+                    if ancestor.tag == INS_TAG:
+                        dropped = True
+                    else:
+                        unwrapped = True
+            if nested:
+                # Read together with its outermost paragraph
+                continue
+
+            if not dropped:
+                yield from self.memo.paragraph_texts(paragraph, unwrapped)
+
+            # Drop the finished paragraph and everything before it
+            paragraph.clear(keep_tail=True)
+            for node in (paragraph, *paragraph.iterancestors()):
+                parent = node.getparent()
+                if parent is None:
+                    break
+                del parent[: parent.index(node)]
+
+    def _failure_header(self):
+        """Explanation shared by both mismatch reports."""
+        return [
             "FAILED - Document text doesn't match after removing Claude's tracked changes",
             "",
             "Likely causes:",
@@ -127,152 +373,160 @@ class RedliningValidator:
             "",
         ]
 
-        # Show git word diff
-        git_diff = self._get_git_word_diff(original_text, modified_text)
-        if git_diff:
-            error_parts.extend(["Differences:", "============", git_diff])
-        else:
-            error_parts.append("Unable to generate word diff (git not available)")
+    def _generate_first_difference(self, index, original_text, modified_text):
+        """Describe the first paragraph whose text differs (diff=False)."""
+        end = "(end of document)"
+        error_parts = self._failure_header()
+        error_parts.extend(
+            [
+                f"First difference at non-empty paragraph {index + 1}:",
+                f"  original: {end if original_text is None else original_text}",
+                f"  modified: {end if modified_text is None else modified_text}",
+            ]
+        )
+        return "\n".join(error_parts)
 
+    def _generate_detailed_diff(self, original_paragraphs, modified_paragraphs):
+        """Generate detailed per-paragraph differences, character level where short."""
+        error_parts = self._failure_header()
+        error_parts.extend(
+            ["Differences:", "============"]
+            + paragraph_diff(original_paragraphs, modified_paragraphs)
+        )
         return "\n".join(error_parts)
 
-    def _get_git_word_diff(self, original_text, modified_text):
-        """Generate word diff using git with character-level precision."""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-
-                # Create two files
-                original_file = temp_path / "original.txt"
-                modified_file = temp_path / "modified.txt"
-
-                original_file.write_text(original_text, encoding="utf-8")
-                modified_file.write_text(modified_text, encoding="utf-8")
-
-                # Try character-level diff first for precise differences
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "--word-diff-regex=.",  # Character-by-character diff
-                        "-U0",  # Zero lines of context - show only changed lines
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
 
-                if result.stdout.strip():
-                    # Clean up the output - remove git diff header lines
-                    lines = result.stdout.split("\n")
-                    # Skip the header lines (diff --git, index, +++, ---, @@)
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-
-                    if content_lines:
-                        return "\n".join(content_lines)
-
-                # Fallback to word-level diff if character-level is too verbose
-                result = subprocess.run(
-                    [
-                        "git",
-                        "diff",
-                        "--word-diff=plain",
-                        "-U0",  # Zero lines of context
-                        "--no-index",
-                        str(original_file),
-                        str(modified_file),
-                    ],
-                    capture_output=True,
-                    text=True,
-                )
+class _TrackedTextTarget:
+    """lxml parser target producing paragraph text without Claude's changes.
 
-                if result.stdout.strip():
-                    lines = result.stdout.split("\n")
-                    content_lines = []
-                    in_content = False
-                    for line in lines:
-                        if line.startswith("@@"):
-                            in_content = True
-                            continue
-                        if in_content and line.strip():
-                            content_lines.append(line)
-                    return "\n".join(content_lines)
-
-        except (subprocess.CalledProcessError, FileNotFoundError, Exception):
-            # Git not available or other error, return None to use fallback
-            pass
+    Applies the redlining rules to a stream of parser events:
+    - w:ins by Claude is dropped together with everything inside it
+    - w:del by Claude is unwrapped, so its w:delText counts as text
+    - a paragraph's text is the text of every w:t below it, including
+      paragraphs nested in it (e.g. text boxes), which also count on their
+      own; paragraphs come out in the order they start
+    - empty paragraphs are skipped, so tracked insertions of structure
+      alone do not cause false positives
+    """
 
+    def __init__(self, unwrapped=False):
+        """
+        Args:
+            unwrapped: True if events start inside a w:del by Claude
+        """
+        self.claude_changes = False  # Seen a w:ins or w:del by Claude
+        self._roles = []  # Role of each open element ("ins", "del", "p", "t" or None)
+        self._dropped = 0  # Open w:ins elements by Claude
+        self._unwrapped = int(unwrapped)  # Open w:del elements by Claude
+        self._open_paragraphs = []  # [parts, finished] of each open w:p
+        self._paragraphs = deque()  # [parts, finished] in start order
+        self._text = None  # Text of the w:t being read, until its first child
+
+    def start(self, tag, attrib):
+        if self._text is not None:
+            # Only the text before a w:t's first child counts
+            self._finish_text()
+
+        role = None
+        if tag in (INS_TAG, DEL_TAG) and attrib.get(AUTHOR_ATTR) == CLAUDE_AUTHOR:
+            self.claude_changes = True
+            role = "ins" if tag == INS_TAG else "del"
+        if self._dropped:
+            role = "ins" if role == "ins" else None
+        elif tag == P_TAG:
+            role = "p"
+            paragraph = [[], False]
+            self._open_paragraphs.append(paragraph)
+            self._paragraphs.append(paragraph)
+        elif tag == T_TAG or (tag == DELTEXT_TAG and self._unwrapped):
+            role = "t"
+            self._text = []
+
+        if role == "ins":
+            self._dropped += 1
+        elif role == "del":
+            self._unwrapped += 1
+        self._roles.append(role)
+
+    def end(self, tag):
+        role = self._roles.pop()
+        if role == "ins":
+            self._dropped -= 1
+        elif role == "del":
+            self._unwrapped -= 1
+        elif role == "p":
+            self._open_paragraphs.pop()[1] = True
+        elif role == "t" and self._text is not None:
+            self._finish_text()
+
+    def data(self, data):
+        if self._text is not None:
+            self._text.append(data)
+
+    def close(self):
         return None
 
-    def _remove_claude_tracked_changes(self, root):
-        """Remove tracked changes authored by Claude from the XML root."""
-        ins_tag = f"{{{self.namespaces['w']}}}ins"
-        del_tag = f"{{{self.namespaces['w']}}}del"
-        author_attr = f"{{{self.namespaces['w']}}}author"
-
-        # Remove w:ins elements
-        for parent in root.iter():
-            to_remove = []
-            for child in parent:
-                if child.tag == ins_tag and child.get(author_attr) == "Claude":
-                    to_remove.append(child)
-            for elem in to_remove:
-                parent.remove(elem)
-
-        # Unwrap content in w:del elements where author is "Claude"
-        deltext_tag = f"{{{self.namespaces['w']}}}delText"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        for parent in root.iter():
-            to_process = []
-            for child in parent:
-                if child.tag == del_tag and child.get(author_attr) == "Claude":
-                    to_process.append((child, list(parent).index(child)))
-
-            # Process in reverse order to maintain indices
-            for del_elem, del_index in reversed(to_process):
-                # Convert w:delText to w:t before moving
-                for elem in del_elem.iter():
-                    if elem.tag == deltext_tag:
-                        elem.tag = t_tag
-
-                # Move all children of w:del to its parent before removing w:del
-                for child in reversed(list(del_elem)):
-                    parent.insert(del_index, child)
-                parent.remove(del_elem)
-
-    def _extract_text_content(self, root):
-        """Extract text content from Word XML, preserving paragraph structure.
-
-        Empty paragraphs are skipped to avoid false positives when tracked
-        insertions add only structural elements without text content.
-        """
-        p_tag = f"{{{self.namespaces['w']}}}p"
-        t_tag = f"{{{self.namespaces['w']}}}t"
-
-        paragraphs = []
-        for p_elem in root.findall(f".//{p_tag}"):
-            # Get all text elements within this paragraph
-            text_parts = []
-            for t_elem in p_elem.findall(f".//{t_tag}"):
-                if t_elem.text:
-                    text_parts.append(t_elem.text)
-            paragraph_text = "".join(text_parts)
-            # Skip empty paragraphs - they don't affect content validation
-            if paragraph_text:
-                paragraphs.append(paragraph_text)
-
-        return "\n".join(paragraphs)
+    def _finish_text(self):
+        """Add the collected w:t text to every open paragraph."""
+        text = "".join(self._text)
+        self._text = None
+        if text:
+            for parts, _ in self._open_paragraphs:
+                parts.append(text)
+
+    def take_paragraphs(self):
+        """Return the text of paragraphs completed so far, in start order."""
+        texts = []
+        while self._paragraphs and self._paragraphs[0][1]:
+            text = "".join(self._paragraphs.popleft()[0])
+            if text:
+                texts.append(text)
+        return texts
+
+
+class _CountingReader:
+    """File-like wrapper adding the bytes read to a validator's I/O counter."""
+
+    def __init__(self, stream, validator):
+        self._stream = stream
+        self._validator = validator
+
+    def read(self, size=-1):
+        data = self._stream.read(size)
+        self._validator._bytes_read += len(data)
+        return data
+
+
+def _plain_text(paragraph):
+    """Return a w:p's text if the redlining rules cannot affect it, else None.
+
+    The rules matter for paragraphs holding a nested w:p or a w:ins/w:del by
+    Claude, and w:t elements with children need the event-level reading.
+    """
+    for elem in paragraph.iterdescendants(P_TAG, INS_TAG, DEL_TAG):
+        if elem.tag == P_TAG or elem.get(AUTHOR_ATTR) == CLAUDE_AUTHOR:
+            return None
+    parts = []
+    for t in paragraph.iter(T_TAG):
+        if len(t):
+            return None
+        if t.text:
+            parts.append(t.text)
+    return "".join(parts)
+
+
+def _replay(elem, target):
+    """Send the parser events of an element's subtree to a parser target."""
+    target.start(elem.tag, elem.attrib)
+    if elem.text:
+        target.data(elem.text)
+    for child in elem:
+        # Comments and processing instructions only contribute their tail
+        if isinstance(child.tag, str):
+            _replay(child, target)
+        if child.tail:
+            target.data(child.tail)
+    target.end(elem.tag)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,175 @@
+"""
+Relationship graph of an OOXML package.
+
+The graph records every file in the package and, for each .rels file, the
+relationships it declares (ID, type, target) and the part each target
+resolves to. It is built with a single listing of the package and one parse
+per .rels file, after which target lookups are set operations instead of
+filesystem calls. update_part() refreshes a single file in place, so long-
+lived callers do not need to rebuild the graph after each edit.
+"""
+
+import posixpath
+
+import lxml.etree
+
+from .package import open_package
+
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+RELATIONSHIP_TAG = f"{{{PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+
+
+def part_sort_key(part_name):
+    """Sort key ordering part names the way pathlib orders paths."""
+    return part_name.split("/")
+
+
+def is_external_target(target):
+    """Return True for targets outside the package (URLs and mail links)."""
+    return target.startswith(("http", "mailto:"))
+
+
+class Relationship:
+    """One Relationship element of a .rels file."""
+
+    def __init__(self, rid, rel_type, target, part, line):
+        """
+        Args:
+            rid: Relationship ID (may be None if the element has no Id)
+            rel_type: Full relationship type URI ("" if missing)
+            target: Target attribute as written
+            part: Part name the target resolves to, or None for external
+                targets and targets with no Target attribute
+            line: Line of the Relationship element in the .rels file
+        """
+        self.id = rid
+        self.type = rel_type
+        self.target = target
+        self.part = part
+        self.line = line
+
+    @property
+    def type_name(self):
+        """Last segment of the relationship type URI (e.g. "image")."""
+        return self.type.split("/")[-1] if "/" in self.type else self.type
+
+
+class RelationshipGraph:
+    """Parts, .rels files and relationship targets of a package.
+
+    Part names are package-relative POSIX paths such as "word/document.xml".
+    """
+
+    def __init__(self, root, parse=None):
+        """
+        Build the graph with one listing of the package.
+
+        Args:
+            root: Unpacked package directory, Office file or Package
+            parse: Optional callable parsing a part path (see Package.path)
+                into an lxml tree (default: parse the part's content)
+        """
+        self.package = open_package(root)
+        self.root = self.package.root
+        self._parse = parse or self._parse_part
+        self.files = set(self.package.names())  # Every file in the package
+        self.relationships = {}  # .rels part -> list of Relationship
+        self.errors = {}  # .rels part -> exception raised while parsing it
+
+        for rels_part in self.files:
+            if rels_part.endswith(".rels"):
+                self._load_rels(rels_part)
+
+    @property
+    def rels_parts(self):
+        """All .rels files, in path order."""
+        return sorted(
+            (p for p in self.files if p.endswith(".rels")), key=part_sort_key
+        )
+
+    @property
+    def referenced_parts(self):
+        """Parts that are the existing target of at least one relationship."""
+        return {
+            rel.part
+            for rels in self.relationships.values()
+            for rel in rels
+            if rel.part in self.files
+        }
+
+    def rels_part_for(self, part_name):
+        """Return the .rels file holding a part's relationships (dir/_rels/name.rels)."""
+        directory, name = posixpath.split(part_name)
+        return posixpath.join(directory, "_rels", f"{name}.rels")
+
+    def source_dir(self, rels_part):
+        """Directory that targets in a .rels file are relative to."""
+        rels_dir = posixpath.dirname(rels_part)
+        if posixpath.basename(rels_part) == ".rels":
+            # Root .rels file - targets are relative to the package root
+            return ""
+        # e.g. word/_rels/document.xml.rels -> targets relative to word/
+        return posixpath.dirname(rels_dir)
+
+    def resolve_target(self, rels_part, target):
+        """Resolve a relationship target to a part name.
+
+        Returns:
+            str: The part name, or None if the target leaves the package
+        """
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.join(self.source_dir(rels_part), target)
+        path = posixpath.normpath(path)
+        if path.startswith("../") or path == "..":
+            return None
+        return path
+
+    def update_part(self, part_name):
+        """Refresh one file after it was added, changed or removed.
+
+        Args:
+            part_name: Package-relative path of the file
+        """
+        if self.package.exists(part_name):
+            self.files.add(part_name)
+        else:
+            self.files.discard(part_name)
+
+        if part_name.endswith(".rels"):
+            self.relationships.pop(part_name, None)
+            self.errors.pop(part_name, None)
+            if part_name in self.files:
+                self._load_rels(part_name)
+
+    def _load_rels(self, rels_part):
+        """Parse one .rels file into Relationship records."""
+        try:
+            root = self._parse(self.package.path(rels_part)).getroot()
+        except Exception as e:
+            self.errors[rels_part] = e
+            return
+
+        relationships = []
+        for rel in root.iter(RELATIONSHIP_TAG):
+            target = rel.get("Target")
+            part = None
+            if target and not is_external_target(target):
+                part = self.resolve_target(rels_part, target)
+            relationships.append(
+                Relationship(
+                    rel.get("Id"), rel.get("Type", ""), target, part, rel.sourceline
+                )
+            )
+        self.relationships[rels_part] = relationships
+
+    def _parse_part(self, path):
+        with self.package.open(self.package.name(path)) as f:
+            return lxml.etree.parse(f)
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,165 @@
+"""
+Machine-readable results of a validation run.
+
+Every validator's validate() returns a ValidationReport. It is truthy when
+validation passed, so existing `if not validator.validate()` callers keep
+working, and it records each violation and the cost of each check.
+
+Checks build Violation objects as they find problems; the lines printed
+for a failed check are str() of those same objects.
+"""
+
+import time
+
+from .package import DirectoryPackage, Package
+
+
+class Violation:
+    """A single validation failure."""
+
+    def __init__(self, rule, message, file=None, line=None, located=True):
+        """
+        Args:
+            rule: Name of the check that failed (e.g. "unique_ids")
+            message: Human-readable description
+            file: Part path relative to the package root, if known
+            line: Line number within the part, if known
+            located: Print the message after "<file>: Line <n>: "; False for
+                messages that already name the file
+        """
+        self.rule = rule
+        self.message = message
+        self.file = str(file).replace("\\", "/") if file is not None else None
+        self.line = line
+        self.located = located
+
+    def __str__(self):
+        """The line printed for this violation ("<file>: Line <n>: <message>")."""
+        if not (self.file and self.located):
+            return self.message
+        if self.line is None:
+            return f"{self.file}: {self.message}"
+        return f"{self.file}: Line {self.line}: {self.message}"
+
+    def to_dict(self):
+        return {
+            "file": self.file,
+            "line": self.line,
+            "rule": self.rule,
+            "message": self.message,
+        }
+
+    def to_state(self):
+        """Return a JSON-serializable tuple that from_state() turns back into a Violation."""
+        return (self.rule, self.message, self.file, self.line, self.located)
+
+    @classmethod
+    def from_state(cls, state):
+        return cls(*state)
+
+    def __repr__(self):
+        return f"Violation({self.rule!r}, {self.message!r}, file={self.file!r}, line={self.line!r})"
+
+
+class CheckResult:
+    """Outcome and cost of one check."""
+
+    def __init__(self, name, passed, seconds, parses=0, bytes_read=0):
+        self.name = name
+        self.passed = passed
+        self.seconds = seconds
+        self.parses = parses
+        self.bytes_read = bytes_read
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "passed": self.passed,
+            "seconds": round(self.seconds, 6),
+            "parses": self.parses,
+            "bytes_read": self.bytes_read,
+        }
+
+
+class ValidationReport:
+    """Violations and per-check timings collected by one validator."""
+
+    def __init__(self, validator, root=None):
+        """
+        Args:
+            validator: Name of the validator that produced the report
+            root: Package (or unpacked package directory) being validated
+        """
+        self.validator = validator
+        if root is not None and not isinstance(root, Package):
+            root = DirectoryPackage(root)
+        self.package = root
+        self.root = self.package.root if self.package else None
+        self.violations = []
+        self.checks = []
+        self._passed = None
+
+    @property
+    def passed(self):
+        """True unless a check failed (or the run was marked failed)."""
+        if self._passed is not None:
+            return self._passed
+        return all(check.passed for check in self.checks)
+
+    @passed.setter
+    def passed(self, value):
+        self._passed = value
+
+    def __bool__(self):
+        return bool(self.passed)
+
+    @property
+    def failed_checks(self):
+        """Names of the checks that failed, in run order."""
+        return [check.name for check in self.checks if not check.passed]
+
+    def add_violation(self, rule, message, file=None, line=None):
+        """Record one violation."""
+        self.violations.append(Violation(rule, message, file, line))
+
+    def add_violations(self, violations):
+        """Record Violation objects built by a check."""
+        self.violations.extend(violations)
+
+    def time_check(self, name, check, counters=None):
+        """Run a check, recording whether it passed and what it cost.
+
+        Args:
+            name: Check name
+            check: Callable returning True if the check passed
+            counters: Optional callable returning (parses, bytes_read) totals,
+                sampled before and after the check
+
+        Returns:
+            bool: The check's result
+        """
+        before = counters() if counters else (0, 0)
+        start = time.perf_counter()
+        try:
+            passed = bool(check())
+        finally:
+            seconds = time.perf_counter() - start
+            after = counters() if counters else (0, 0)
+        self.checks.append(
+            CheckResult(
+                name, passed, seconds, after[0] - before[0], after[1] - before[1]
+            )
+        )
+        return passed
+
+    def to_dict(self):
+        return {
+            "validator": self.validator,
+            "passed": self.passed,
+            "violations": [violation.to_dict() for violation in self.violations],
+            "checks": [check.to_dict() for check in self.checks],
+        }
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,166 @@
+"""
+Persistent cache of per-part validation results.
+
+Results are keyed by the part content hash, the check (including the schema
+it validates against) and a fingerprint of the validator source code, so
+editing a validator invalidates every entry it produced. The cache is a
+SQLite database with least-recently-used eviction once it holds more than
+max_entries results.
+
+The cache is opt-in: validators only use it when $OOXML_VALIDATION_CACHE
+names a database file (validate.py --cache sets it to the user cache
+directory), so nothing is written outside the package being validated by
+default.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from .report import Violation
+
+# Environment variable overriding the cache database location
+CACHE_PATH_ENV = "OOXML_VALIDATION_CACHE"
+
+DEFAULT_MAX_ENTRIES = 20000
+
+_validator_version = None
+
+
+def validator_version():
+    """Fingerprint of the validation package source, computed once per process."""
+    global _validator_version
+    if _validator_version is None:
+        digest = hashlib.sha256()
+        for source in sorted(Path(__file__).parent.glob("*.py")):
+            digest.update(source.name.encode())
+            digest.update(source.read_bytes())
+        _validator_version = digest.hexdigest()[:16]
+    return _validator_version
+
+
+def _encode(value):
+    """json.dumps hook storing Violations as {"violation": state}."""
+    if isinstance(value, Violation):
+        return {"violation": value.to_state()}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode(obj):
+    """json.loads hook reversing _encode()."""
+    if obj.keys() == {"violation"}:
+        return Violation.from_state(obj["violation"])
+    return obj
+
+
+def configured_cache_path():
+    """Cache database named by $OOXML_VALIDATION_CACHE, or None if unset."""
+    if os.environ.get(CACHE_PATH_ENV):
+        return Path(os.environ[CACHE_PATH_ENV])
+    return None
+
+
+def default_cache_path():
+    """Location of the cache database ($OOXML_VALIDATION_CACHE or the user cache dir)."""
+    if configured_cache_path():
+        return configured_cache_path()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ooxml-validation" / "results.sqlite3"
+
+
+class ResultCache:
+    """Size-bounded LRU store mapping result keys to JSON-serializable values.
+
+    Values may contain Violation objects; they round-trip through the JSON.
+    """
+
+    def __init__(self, path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: Database file (default: default_cache_path())
+            max_entries: Number of results kept before the least recently
+                used ones are evicted
+
+        Raises:
+            sqlite3.Error, OSError: If the database cannot be opened
+        """
+        self.path = Path(path) if path else default_cache_path()
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=5, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+        )
+
+    @classmethod
+    def open(cls, path=None, max_entries=DEFAULT_MAX_ENTRIES):
+        """Open the cache, returning None if it is disabled or unavailable.
+
+        Args:
+            path: Database file (default: $OOXML_VALIDATION_CACHE; the cache
+                is disabled when neither is set)
+            max_entries: See ResultCache()
+        """
+        path = path or configured_cache_path()
+        if path is None:
+            return None
+        try:
+            return cls(path, max_entries)
+        except (sqlite3.Error, OSError):
+            return None
+
+    @staticmethod
+    def make_key(*parts):
+        """Build a cache key from JSON-serializable parts and the validator version."""
+        payload = json.dumps([validator_version(), *parts], separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss."""
+        try:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            return json.loads(row[0], object_hook=_decode)
+        except sqlite3.Error:
+            return None
+
+    def put(self, key, value):
+        """Store value under key, evicting least recently used results if full."""
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value, last_used) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=_encode), time.time()),
+            )
+            (count,) = self._db.execute("SELECT COUNT(*) FROM results").fetchone()
+            if count > self.max_entries:
+                # Evict down to 90% so eviction does not run on every insert
+                self._db.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY last_used LIMIT ?)",
+                    (count - int(self.max_entries * 0.9),),
+                )
+        except sqlite3.Error:
+            pass  # A failed write only costs a future cache miss
+
+    def close(self):
+        """Close the database connection."""
+        self._db.close()
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,141 @@
+"""
+Compiled XSD schema registry shared by all validators in a process.
+
+Each schema is compiled at most once per process. Compiled lxml schemas
+cannot be serialized, so the optional on-disk cache stores a pre-resolved
+bundle instead: the schema and every file it imports or includes, in a
+single JSON file. Later runs load the bundle with one read and resolve all
+imports from memory instead of walking the schemas tree on disk.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import lxml.etree
+
+XSD_NAMESPACE = "http://www.w3.org/2001/XMLSchema"
+
+# Environment variable naming the default on-disk bundle directory
+CACHE_DIR_ENV = "OOXML_SCHEMA_CACHE_DIR"
+
+# Bump when the bundle layout changes so stale bundles are ignored
+BUNDLE_VERSION = 1
+
+# Compiled schemas keyed by resolved schema path
+_schemas = {}
+
+
+def get_schema(schema_path, cache_dir=None):
+    """Return the compiled XMLSchema for an XSD file, compiling it only once.
+
+    Args:
+        schema_path: Path to the XSD file
+        cache_dir: Optional directory for pre-resolved schema bundles.
+            Defaults to the OOXML_SCHEMA_CACHE_DIR environment variable.
+
+    Returns:
+        lxml.etree.XMLSchema: The compiled schema
+    """
+    schema_path = Path(schema_path).resolve()
+    key = str(schema_path)
+    if key not in _schemas:
+        cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        if cache_dir:
+            _schemas[key] = _compile_from_bundle(schema_path, Path(cache_dir))
+        else:
+            with open(schema_path, "rb") as xsd_file:
+                xsd_doc = lxml.etree.parse(xsd_file, base_url=key)
+            _schemas[key] = lxml.etree.XMLSchema(xsd_doc)
+    return _schemas[key]
+
+
+def clear():
+    """Drop all compiled schemas held by this process."""
+    _schemas.clear()
+
+
+class _BundleResolver(lxml.etree.Resolver):
+    """Resolve schema imports from an in-memory bundle."""
+
+    def __init__(self, files):
+        super().__init__()
+        self.files = files
+
+    def resolve(self, system_url, public_id, context):
+        path = system_url[7:] if system_url.startswith("file://") else system_url
+        content = self.files.get(str(Path(path).resolve()))
+        if content is None:
+            return None  # Fall back to the default resolver
+        return self.resolve_string(content, context, base_url=system_url)
+
+
+def _compile_from_bundle(schema_path, cache_dir):
+    """Compile a schema using its on-disk bundle, creating the bundle if needed."""
+    bundle_file = (
+        cache_dir / f"{hashlib.sha1(str(schema_path).encode()).hexdigest()[:16]}.json"
+    )
+    files = _load_bundle(bundle_file)
+    if files is None:
+        files = {}
+        _collect_schema_files(schema_path, files)
+        _write_bundle(bundle_file, files)
+
+    contents = {path: content.encode("utf-8") for path, (_, _, content) in files.items()}
+    parser = lxml.etree.XMLParser()
+    parser.resolvers.add(_BundleResolver(contents))
+    root = lxml.etree.fromstring(
+        contents[str(schema_path)], parser, base_url=str(schema_path)
+    )
+    return lxml.etree.XMLSchema(lxml.etree.ElementTree(root))
+
+
+def _collect_schema_files(schema_path, files):
+    """Recursively collect a schema and all files it imports or includes."""
+    key = str(schema_path)
+    if key in files:
+        return
+    stat = schema_path.stat()
+    content = schema_path.read_text(encoding="utf-8")
+    files[key] = (stat.st_size, stat.st_mtime_ns, content)
+
+    root = lxml.etree.fromstring(content.encode("utf-8"))
+    for elem in root.iter(f"{{{XSD_NAMESPACE}}}import", f"{{{XSD_NAMESPACE}}}include"):
+        location = elem.get("schemaLocation")
+        if location and "://" not in location:
+            _collect_schema_files((schema_path.parent / location).resolve(), files)
+
+
+def _load_bundle(bundle_file):
+    """Load a bundle, returning None if it is missing or out of date."""
+    try:
+        bundle = json.loads(bundle_file.read_text(encoding="utf-8"))
+        if bundle.get("version") != BUNDLE_VERSION:
+            return None
+        files = {path: tuple(entry) for path, entry in bundle["files"].items()}
+        # A bundle is only valid while every schema file is unchanged
+        for path, (size, mtime_ns, _) in files.items():
+            stat = os.stat(path)
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return None
+        return files
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_bundle(bundle_file, files):
+    """Write a bundle atomically; failures only cost the warm start."""
+    try:
+        bundle_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = bundle_file.with_suffix(f".{os.getpid()}.tmp")
+        temp_file.write_text(
+            json.dumps({"version": BUNDLE_VERSION, "files": files}), encoding="utf-8"
+        )
+        os.replace(temp_file, bundle_file)
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,487 @@
+"""
+Single-pass streaming checks over a part's XML.
+
+StreamingChecker walks a file once with lxml.etree.iterparse and feeds every
+start and end event to a set of rules. Finished elements are cleared as soon
+as their end event has been handled, so memory stays bounded by the depth of
+the document rather than its size. Each rule collects its own results and
+decides how a parse failure is reported.
+"""
+
+import re
+
+import lxml.etree
+
+from .report import Violation
+
+MC_NAMESPACE = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+ALTERNATE_CONTENT_TAG = f"{{{MC_NAMESPACE}}}AlternateContent"
+XML_SPACE_ATTR = "{http://www.w3.org/XML/1998/namespace}space"
+
+
+def local_name(tag):
+    """Return a Clark-notation tag or attribute name without its namespace."""
+    return tag.split("}")[-1] if "}" in tag else tag
+
+
+def text_preview(text):
+    """Return the truncated repr used in violation messages."""
+    return repr(text)[:50] + "..." if len(repr(text)) > 50 else repr(text)
+
+
+class StreamState:
+    """Position of the current event, shared by all rules in a pass."""
+
+    def __init__(self):
+        self.depth = 0  # Depth of the current element (1 for the root)
+        self.alternate_content = 0  # Number of open mc:AlternateContent elements
+        self.open_tags = {}  # Clark tag -> number of open elements with that tag
+
+    def inside(self, tag):
+        """Return True if an element with the given Clark tag is open."""
+        return self.open_tags.get(tag, 0) > 0
+
+
+class Rule:
+    """A check driven by StreamingChecker events.
+
+    Subclasses set tags to the Clark names whose events they need (None for
+    every element) and override start() and/or end(). A rule whose tags
+    cannot be listed up front can leave tags as None and override wants()
+    instead. Findings go into self.results, which must stay
+    JSON-serializable apart from Violation objects (see ResultCache).
+    """
+
+    tags = None
+    check = None  # Name of the check the rule's violations belong to
+
+    def __init__(self, label):
+        """
+        Args:
+            label: Part path used in messages (relative to the package root)
+        """
+        self.label = label
+        self.results = []
+
+    def wants(self, tag):
+        """Return True if the rule needs events for this Clark tag.
+
+        Only consulted when tags is None, once per distinct tag in a part.
+        """
+        return True
+
+    def start(self, elem, state):
+        """Handle a start event; attributes are available, children are not."""
+
+    def end(self, elem, state):
+        """Handle an end event; text and tail are available."""
+
+    def failed(self, error):
+        """Report that the part could not be parsed."""
+        self.results = [self.violation(f"Error: {error}")]
+
+    def violation(self, message, line=None, located=True):
+        """Return a Violation of this rule's check in its part."""
+        return Violation(self.check, message, self.label, line, located)
+
+
+class StreamingChecker:
+    """Run a set of rules over one XML source in a single iterparse pass."""
+
+    def __init__(self, rules):
+        """
+        Args:
+            rules: dict mapping result names to Rule instances
+        """
+        self.rules = rules
+        self._start = {}
+        self._end = {}
+        self._every_start = []
+        self._every_end = []
+        self._selective = []  # (rule, overrides_start, overrides_end)
+        self._routed = set()  # Tags whose selective rules have been added
+        for rule in rules.values():
+            overrides_start = type(rule).start is not Rule.start
+            overrides_end = type(rule).end is not Rule.end
+            if rule.tags is None:
+                if type(rule).wants is not Rule.wants:
+                    self._selective.append((rule, overrides_start, overrides_end))
+                    continue
+                if overrides_start:
+                    self._every_start.append(rule)
+                if overrides_end:
+                    self._every_end.append(rule)
+                continue
+            for tag in rule.tags:
+                if overrides_start:
+                    self._start.setdefault(tag, []).append(rule)
+                if overrides_end:
+                    self._end.setdefault(tag, []).append(rule)
+
+    def run(self, source):
+        """Stream source through every rule.
+
+        Args:
+            source: File path or file-like object
+
+        Returns:
+            dict: Result name -> rule results
+        """
+        state = StreamState()
+        try:
+            for event, elem in lxml.etree.iterparse(source, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    if self._selective and tag not in self._routed:
+                        self._route(tag)
+                    state.depth += 1
+                    state.open_tags[tag] = state.open_tags.get(tag, 0) + 1
+                    if tag == ALTERNATE_CONTENT_TAG:
+                        state.alternate_content += 1
+                    for rule in self._every_start:
+                        rule.start(elem, state)
+                    for rule in self._start.get(tag, ()):
+                        rule.start(elem, state)
+                else:
+                    for rule in self._every_end:
+                        rule.end(elem, state)
+                    for rule in self._end.get(tag, ()):
+                        rule.end(elem, state)
+                    if tag == ALTERNATE_CONTENT_TAG:
+                        state.alternate_content -= 1
+                    state.open_tags[tag] -= 1
+                    state.depth -= 1
+
+                    # Drop the finished subtree and any earlier siblings
+                    elem.clear(keep_tail=True)
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+        except Exception as e:
+            for rule in self.rules.values():
+                rule.failed(e)
+
+        return {name: rule.results for name, rule in self.rules.items()}
+
+    def _route(self, tag):
+        """Dispatch a newly seen tag to the selective rules that want it."""
+        self._routed.add(tag)
+        for rule, overrides_start, overrides_end in self._selective:
+            if rule.wants(tag):
+                if overrides_start:
+                    self._start.setdefault(tag, []).append(rule)
+                if overrides_end:
+                    self._end.setdefault(tag, []).append(rule)
+
+
+class WellFormedRule(Rule):
+    """Record whether the part parses; results are None or an error message."""
+
+    tags = ()
+    check = "xml"
+
+    def __init__(self, label):
+        super().__init__(label)
+        self.results = None
+
+    def failed(self, error):
+        if isinstance(error, lxml.etree.XMLSyntaxError):
+            self.results = self.violation(error.msg, error.lineno)
+        else:
+            self.results = self.violation(f"Unexpected error: {str(error)}")
+
+
+class RootRule(Rule):
+    """Base for rules that only look at the root element."""
+
+    def start(self, elem, state):
+        if state.depth == 1:
+            self.root(elem)
+
+    def root(self, elem):
+        """Handle the root element."""
+
+
+class RootNameRule(RootRule):
+    """Record the local name of the root element (None if unparseable)."""
+
+    def __init__(self, label):
+        super().__init__(label)
+        self.results = None
+
+    def root(self, elem):
+        self.results = local_name(elem.tag)
+
+    def failed(self, error):
+        self.results = None
+
+
+class IgnorableNamespaceRule(RootRule):
+    """Namespace prefixes listed in an Ignorable attribute must be declared."""
+
+    check = "namespaces"
+
+    def root(self, elem):
+        declared = set(elem.nsmap.keys()) - {None}  # Exclude default namespace
+        for attr_val in [v for k, v in elem.attrib.items() if k.endswith("Ignorable")]:
+            undeclared = set(attr_val.split()) - declared
+            self.results.extend(
+                self.violation(f"Namespace '{ns}' in Ignorable but not declared")
+                for ns in sorted(undeclared)
+            )
+
+    def failed(self, error):
+        # Malformed parts are reported by the well-formedness check
+        self.results = []
+
+
+class IdTargets:
+    """Clark tags and attributes matched against a set of ID requirements.
+
+    Requirements name elements and attributes by lowercase local name in
+    any namespace, so the Clark names that match are only known once seen.
+    Each is lowered once and remembered; see id_targets().
+    """
+
+    def __init__(self, requirements):
+        """
+        Args:
+            requirements: Lowercase local element name -> (attribute, scope)
+        """
+        self.requirements = requirements
+        self._tags = {}  # Clark tag -> (local name, attribute, scope) or None
+        self._attrs = {}  # Clark attribute name -> lowercase local name
+
+    def lookup(self, tag):
+        """Return (lowercase local name, attribute, scope) for a tag, or None."""
+        try:
+            return self._tags[tag]
+        except KeyError:
+            name = local_name(tag).lower()
+            requirement = self.requirements.get(name)
+            target = (name, *requirement) if requirement else None
+            self._tags[tag] = target
+            return target
+
+    def find_id(self, elem, attr_name):
+        """Return the first attribute of elem named attr_name (any namespace/case)."""
+        attrs = self._attrs
+        for attr in elem.keys():
+            name = attrs.get(attr)
+            if name is None:
+                name = attrs[attr] = local_name(attr).lower()
+            if name == attr_name:
+                return elem.get(attr)
+        return None
+
+
+# IdTargets per requirements mapping, shared by every part in the process
+_id_targets = {}
+
+
+def id_targets(requirements):
+    """Return the shared IdTargets for a requirements mapping."""
+    key = tuple(sorted(requirements.items()))
+    if key not in _id_targets:
+        _id_targets[key] = IdTargets(requirements)
+    return _id_targets[key]
+
+
+class UniqueIdRule(Rule):
+    """Collect ID findings outside mc:AlternateContent, in document order.
+
+    File-scoped duplicates are reported directly as ("error", Violation).
+    Globally scoped IDs are returned as ("global", id, line, tag) so that
+    the validator can check them across files. Only elements named in the
+    requirements reach start().
+    """
+
+    check = "unique_ids"
+
+    def __init__(self, label, requirements):
+        """
+        Args:
+            label: Part path used in messages
+            requirements: Lowercase local element name -> (attribute, scope)
+        """
+        super().__init__(label)
+        self.requirements = requirements
+        self.targets = id_targets(requirements)
+        self.file_ids = {}  # (tag, attribute) -> {id: first line}
+
+    def wants(self, tag):
+        return self.targets.lookup(tag) is not None
+
+    def start(self, elem, state):
+        if state.alternate_content:
+            return
+
+        tag, attr_name, scope = self.targets.lookup(elem.tag)
+        id_value = self.targets.find_id(elem, attr_name)
+        if id_value is None:
+            return
+
+        if scope == "global":
+            self.results.append(("global", id_value, elem.sourceline, tag))
+        elif scope == "file":
+            seen = self.file_ids.setdefault((tag, attr_name), {})
+            if id_value in seen:
+                self.results.append(
+                    (
+                        "error",
+                        self.violation(
+                            f"Duplicate {attr_name}='{id_value}' in <{tag}> "
+                            f"(first occurrence at line {seen[id_value]})",
+                            elem.sourceline,
+                        ),
+                    )
+                )
+            else:
+                seen[id_value] = elem.sourceline
+
+    def failed(self, error):
+        self.results = [("error", self.violation(f"Error: {error}"))]
+
+
+class RelationshipIdRule(Rule):
+    """r:id attributes must name a relationship in the part's .rels file."""
+
+    R_ID_ATTR = (
+        "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+    )
+    check = "relationship_ids"
+
+    def __init__(self, label, rid_to_type, expected_type=None, errors=()):
+        """
+        Args:
+            label: Part path used in messages
+            rid_to_type: Relationship ID -> relationship type name
+            expected_type: Optional callable mapping an element's local name
+                to the relationship type it must point to (or None)
+            errors: Violations already found in the .rels file
+        """
+        super().__init__(label)
+        self.rid_to_type = rid_to_type
+        self.expected_type = expected_type
+        self.rels_errors = list(errors)
+        self.results = list(errors)
+
+    def start(self, elem, state):
+        rid_attr = elem.get(self.R_ID_ATTR)
+        if not rid_attr:
+            return
+
+        elem_name = local_name(elem.tag)
+        if rid_attr not in self.rid_to_type:
+            valid_ids = ", ".join(sorted(self.rid_to_type.keys())[:5])
+            more = "..." if len(self.rid_to_type) > 5 else ""
+            self.results.append(
+                self.violation(
+                    f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                    f"(valid IDs: {valid_ids}{more})",
+                    elem.sourceline,
+                )
+            )
+        elif self.expected_type:
+            expected_type = self.expected_type(elem_name)
+            if expected_type:
+                actual_type = self.rid_to_type[rid_attr]
+                # Check if the actual type matches or contains the expected type
+                if expected_type not in actual_type.lower():
+                    self.results.append(
+                        self.violation(
+                            f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                            f"but should point to a '{expected_type}' relationship",
+                            elem.sourceline,
+                        )
+                    )
+
+    def failed(self, error):
+        self.results = self.rels_errors + [
+            self.violation(f"Error processing {self.label}: {error}", located=False)
+        ]
+
+
+class ElementCountRule(Rule):
+    """Count the elements with one Clark tag; results is the count (None if unparseable)."""
+
+    def __init__(self, label, tag):
+        super().__init__(label)
+        self.tags = (tag,)
+        self.results = 0
+
+    def end(self, elem, state):
+        self.results += 1
+
+    def failed(self, error):
+        self.results = None
+
+
+class WhitespacePreservationRule(Rule):
+    """w:t elements with leading or trailing whitespace need xml:space='preserve'."""
+
+    check = "whitespace"
+
+    def __init__(self, label, word_namespace):
+        super().__init__(label)
+        self.tags = (f"{{{word_namespace}}}t",)
+
+    def end(self, elem, state):
+        text = elem.text
+        if not text:
+            return
+        # Check if text starts or ends with whitespace
+        if re.match(r"^\s.*", text) or re.match(r".*\s$", text):
+            if elem.get(XML_SPACE_ATTR) != "preserve":
+                self.results.append(
+                    self.violation(
+                        f"w:t element with whitespace missing xml:space='preserve': {text_preview(text)}",
+                        elem.sourceline,
+                    )
+                )
+
+
+class DeletedTextRule(Rule):
+    """w:t elements must not appear within w:del."""
+
+    check = "deletions"
+
+    def __init__(self, label, word_namespace):
+        super().__init__(label)
+        self.del_tag = f"{{{word_namespace}}}del"
+        self.tags = (f"{{{word_namespace}}}t",)
+
+    def end(self, elem, state):
+        if elem.text and state.inside(self.del_tag):
+            self.results.append(
+                self.violation(
+                    f"<w:t> found within <w:del>: {text_preview(elem.text)}",
+                    elem.sourceline,
+                )
+            )
+
+
+class InsertedDelTextRule(Rule):
+    """w:delText is only allowed within w:ins if it is also within a w:del."""
+
+    check = "insertions"
+
+    def __init__(self, label, word_namespace):
+        super().__init__(label)
+        self.ins_tag = f"{{{word_namespace}}}ins"
+        self.del_tag = f"{{{word_namespace}}}del"
+        self.tags = (f"{{{word_namespace}}}delText",)
+
+    def end(self, elem, state):
+        if state.inside(self.ins_tag) and not state.inside(self.del_tag):
+            self.results.append(
+                self.violation(
+                    f"<w:delText> within <w:ins>: {text_preview(elem.text or '')}",
+                    elem.sourceline,
+                )
+            )
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
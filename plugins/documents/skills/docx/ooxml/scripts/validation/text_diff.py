@@ -0,0 +1,196 @@
+"""
+In-process word and character diff for redlining failure reports.
+
+Documents are compared paragraph by paragraph first: Myers' O(ND) algorithm
+aligns the two paragraph lists, so unchanged paragraphs cost one comparison
+each however long the document is. Only paragraphs that were replaced are
+diffed again, character by character (or word by word when they are long),
+and rendered in git's --word-diff=plain style: [-removed-]{+added+}.
+"""
+
+import re
+
+# Paragraph pairs longer than this (combined characters) are diffed by word
+CHAR_DIFF_MAX_LENGTH = 4000
+
+# Give up aligning a region after this many edits and treat it as replaced
+MAX_EDITS = 2000
+
+_WORD = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+def diff_opcodes(a, b, max_edits=MAX_EDITS):
+    """Return the edits turning sequence a into sequence b.
+
+    Uses Myers' greedy algorithm after trimming the common prefix and
+    suffix. Regions needing more than max_edits insertions and deletions
+    are reported as a single replacement.
+
+    Args:
+        a: Original sequence (str or list of hashable items)
+        b: Modified sequence
+        max_edits: Edit budget before falling back to a replacement
+
+    Returns:
+        list: (tag, i1, i2, j1, j2) tuples as in difflib.SequenceMatcher,
+            where tag is "equal", "delete", "insert" or "replace"
+    """
+    n, m = len(a), len(b)
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while (
+        suffix < n - prefix
+        and suffix < m - prefix
+        and a[n - 1 - suffix] == b[m - 1 - suffix]
+    ):
+        suffix += 1
+
+    steps = [("equal", i, i) for i in range(prefix)]
+    steps.extend(
+        (tag, prefix + i, prefix + j)
+        for tag, i, j in _myers(
+            a[prefix : n - suffix], b[prefix : m - suffix], max_edits
+        )
+    )
+    steps.extend(("equal", n - suffix + i, m - suffix + i) for i in range(suffix))
+    return _group_steps(steps, n, m)
+
+
+def _myers(a, b, max_edits):
+    """Return ("equal"|"delete"|"insert", i, j) steps of a shortest edit script."""
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace = []
+    for d in range(min(n + m, max_edits) + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]  # Step down: insert b[y - 1]
+            else:
+                x = v[k - 1] + 1  # Step right: delete a[x - 1]
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m)
+
+    # Too different to align within the budget
+    return [("delete", i, 0) for i in range(n)] + [("insert", n, j) for j in range(m)]
+
+
+def _backtrack(trace, x, y):
+    """Walk the saved frontiers back from (x, y) to build the edit steps."""
+    steps = []
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            steps.append(("equal", x, y))
+        if d > 0:
+            if x == prev_x:
+                steps.append(("insert", x, prev_y))
+            else:
+                steps.append(("delete", prev_x, y))
+        x, y = prev_x, prev_y
+    steps.reverse()
+    return steps
+
+
+def _group_steps(steps, n, m):
+    """Merge single-item steps into difflib-style opcodes."""
+    opcodes = []
+    i = j = 0
+    for tag, _, _ in steps:
+        di = 0 if tag == "insert" else 1
+        dj = 0 if tag == "delete" else 1
+        kind = "equal" if tag == "equal" else "change"
+        if opcodes and opcodes[-1][0] == kind:
+            opcodes[-1][2] += di
+            opcodes[-1][4] += dj
+        else:
+            opcodes.append([kind, i, i + di, j, j + dj])
+        i += di
+        j += dj
+    assert (i, j) == (n, m), "Edit script does not cover both sequences"
+
+    result = []
+    for kind, i1, i2, j1, j2 in opcodes:
+        if kind == "change":
+            kind = "replace" if i1 < i2 and j1 < j2 else "delete" if i1 < i2 else "insert"
+        result.append((kind, i1, i2, j1, j2))
+    return result
+
+
+def word_diff(original, modified):
+    """Render one paragraph's changes as text with [-removed-]{+added+} markers.
+
+    Short paragraphs are compared character by character, long ones word
+    by word.
+    """
+    if len(original) + len(modified) <= CHAR_DIFF_MAX_LENGTH:
+        a, b = original, modified
+    else:
+        a, b = _WORD.findall(original), _WORD.findall(modified)
+
+    parts = []
+    for tag, i1, i2, j1, j2 in diff_opcodes(a, b):
+        removed = "".join(a[i1:i2])
+        added = "".join(b[j1:j2])
+        if tag == "equal":
+            parts.append(removed)
+            continue
+        if removed:
+            parts.append(f"[-{removed}-]")
+        if added:
+            parts.append(f"{{+{added}+}}")
+    return "".join(parts)
+
+
+def paragraph_diff(original_paragraphs, modified_paragraphs):
+    """Describe how two documents' paragraph texts differ.
+
+    Paragraphs are aligned first; replaced paragraphs are then paired in
+    order and diffed within. Unchanged paragraphs produce no output.
+
+    Args:
+        original_paragraphs: List of paragraph texts of the original
+        modified_paragraphs: List of paragraph texts of the modified document
+
+    Returns:
+        list: One line per changed, removed or inserted paragraph, anchored
+            by its (1-based) paragraph number in the original document
+    """
+    lines = []
+    for tag, i1, i2, j1, j2 in diff_opcodes(original_paragraphs, modified_paragraphs):
+        if tag == "equal":
+            continue
+        paired = min(i2 - i1, j2 - j1)
+        for offset in range(paired):
+            lines.append(
+                f"Paragraph {i1 + offset + 1}: "
+                + word_diff(
+                    original_paragraphs[i1 + offset], modified_paragraphs[j1 + offset]
+                )
+            )
+        for i in range(i1 + paired, i2):
+            lines.append(f"Paragraph {i + 1}: [-{original_paragraphs[i]}-]")
+        for j in range(j1 + paired, j2):
+            anchor = f"after paragraph {i2}" if i2 else "at start"
+            lines.append(f"Inserted {anchor}: {{+{modified_paragraphs[j]}+}}")
+    return lines
+
+
+if __name__ == "__main__":
+    raise RuntimeError("This module should not be run directly.")
@@ -26,7 +26,9 @@ Usage:
     doc.save()
 """
 
+import copy
 import html
+import os
 import random
 import shutil
 import tempfile
@@ -36,13 +38,27 @@ from pathlib import Path
 from defusedxml import minidom
 from ooxml.scripts.pack import pack_document
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
-from ooxml.scripts.validation.redlining import RedliningValidator
+from ooxml.scripts.validation.package import DirectoryPackage, OverlayPackage
+from ooxml.scripts.validation.redlining import ParagraphMemo, RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import XML_NAMESPACE, LxmlXMLEditor, XMLEditor
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
 
+# Namespaces used by LxmlDocxXMLEditor
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NAMESPACE = "http://schemas.microsoft.com/office/word/2010/wordml"
+W16CEX_NAMESPACE = "http://schemas.microsoft.com/office/word/2018/wordml/cex"
+W16DU_NAMESPACE = "http://schemas.microsoft.com/office/word/2023/wordml/word16du"
+
+# ID families allocated by the Docx editors (see XMLEditor.next_id)
+DOCX_ID_KINDS = {
+    **XMLEditor.ID_KINDS,
+    "change": (("w:ins", "w:del"), "w:id", "", 0),
+    "comment": (("w:comment",), "w:id", "", 0),
+}
+
 
 class DocxXMLEditor(XMLEditor):
     """XMLEditor that automatically applies RSID, author, and date to new elements.
@@ -50,12 +66,14 @@ class DocxXMLEditor(XMLEditor):
     Automatically adds attributes to elements that support them when inserting new content:
     - w:rsidR, w:rsidRDefault, w:rsidP (for w:p and w:r elements)
     - w:author and w:date (for w:ins, w:del, w:comment elements)
-    - w:id (for w:ins and w:del elements)
+    - w:id (for w:ins and w:del elements, from next_id("change"))
 
     Attributes:
         dom (defusedxml.minidom.Document): The DOM document for direct manipulation
     """
 
+    ID_KINDS = DOCX_ID_KINDS
+
     def __init__(
         self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
     ):
@@ -72,23 +90,9 @@ class DocxXMLEditor(XMLEditor):
         self.author = author
         self.initials = initials
 
-    def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
-
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w16du"):  # type: ignore
             root.setAttribute(  # type: ignore
                 "xmlns:w16du",
@@ -97,7 +101,7 @@ class DocxXMLEditor(XMLEditor):
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
             root.setAttribute(  # type: ignore
                 "xmlns:w16cex",
@@ -106,7 +110,7 @@ class DocxXMLEditor(XMLEditor):
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w14"):  # type: ignore
             root.setAttribute(  # type: ignore
                 "xmlns:w14",
@@ -127,6 +131,9 @@ class DocxXMLEditor(XMLEditor):
         Args:
             nodes: List of DOM nodes to process
         """
+        # Every tracked-change helper (suggest_deletion, revert_*) ends here
+        self.mark_dirty()
+
         from datetime import datetime, timezone
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -167,7 +174,7 @@ class DocxXMLEditor(XMLEditor):
         def add_tracked_change_attrs(elem):
             # Auto-assign w:id if not present
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                elem.setAttribute("w:id", str(self.next_id("change")))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -204,62 +211,28 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:r": add_rsid_to_r,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
-
-    def replace_node(self, elem, new_content):
-        """Replace node with automatic attribute injection."""
-        nodes = super().replace_node(elem, new_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def insert_after(self, elem, xml_content):
-        """Insert after with automatic attribute injection."""
-        nodes = super().insert_after(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def insert_before(self, elem, xml_content):
-        """Insert before with automatic attribute injection."""
-        nodes = super().insert_before(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+            # Handle the node and its descendants in one document-order walk
+            for elem in [node, *node.getElementsByTagName("*")]:
+                handler = handlers.get(elem.tagName)
+                if handler:
+                    handler(elem)
 
-    def append_to(self, elem, xml_content):
-        """Append to with automatic attribute injection."""
-        nodes = super().append_to(elem, xml_content)
+    def _nodes_inserted(self, nodes):
+        """Apply automatic attributes to content inserted by edits and batches."""
         self._inject_attributes_to_nodes(nodes)
-        return nodes
 
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
@@ -306,7 +279,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
 
             # Process each run
             for run in runs:
@@ -318,7 +291,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
                 for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
+                    del_text = self._dom.createElement("w:delText")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while t_elem.firstChild:
                         del_text.appendChild(t_elem.firstChild)
@@ -391,7 +364,7 @@ class DocxXMLEditor(XMLEditor):
                 continue
 
             # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
+            ins_elem = self._dom.createElement("w:ins")
 
             for run in runs:
                 # Clone the run
@@ -399,7 +372,7 @@ class DocxXMLEditor(XMLEditor):
 
                 # Convert w:delText → w:t
                 for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
+                    t_elem = self._dom.createElement("w:t")
                     # Copy ALL child nodes (not just firstChild) to handle entities
                     while del_text.firstChild:
                         t_elem.appendChild(del_text.firstChild)
@@ -418,11 +391,12 @@ class DocxXMLEditor(XMLEditor):
                 ins_elem.appendChild(new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            del_elem.parentNode.insertBefore(ins_elem, del_elem.nextSibling)
+            self._inject_attributes_to_nodes([ins_elem])
 
             # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+            if is_single_del:
+                created_insertion = ins_elem
 
         # Return based on input type
         if is_single_del and created_insertion:
@@ -502,7 +476,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -520,7 +494,7 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             parent = elem.parentNode
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
@@ -546,20 +520,20 @@ class DocxXMLEditor(XMLEditor):
                 rPr_list = pPr.getElementsByTagName("w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
+                    rPr = self._dom.createElement("w:rPr")
                     pPr.appendChild(rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
+                del_marker = self._dom.createElement("w:del")
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -578,7 +552,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
@@ -593,6 +567,302 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(LxmlXMLEditor):
+    """DocxXMLEditor on the lxml backend (Document(engine="lxml")).
+
+    Applies the same RSID, author, date and ID attributes to inserted content
+    and offers the same tracked-change helpers as DocxXMLEditor. Nodes are
+    lxml elements.
+
+    Attributes:
+        tree (lxml.etree._ElementTree): The parsed tree for direct manipulation
+    """
+
+    ID_KINDS = DOCX_ID_KINDS
+    suggest_paragraph = staticmethod(DocxXMLEditor.suggest_paragraph)
+
+    def __init__(
+        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+    ):
+        """Initialize with required RSID and optional author.
+
+        Args:
+            xml_path: Path to XML file to edit
+            rsid: RSID to automatically apply to new elements
+            author: Author name for tracked changes and comments (default: "Claude")
+            initials: Author initials (default: "C")
+        """
+        super().__init__(xml_path)
+        self.rsid = rsid
+        self.author = author
+        self.initials = initials
+
+    def _inject_attributes_to_nodes(self, nodes):
+        """Inject RSID, author, and date attributes into nodes where applicable.
+
+        Same rules as DocxXMLEditor._inject_attributes_to_nodes().
+
+        Args:
+            nodes: List of lxml nodes to process
+        """
+        # Every tracked-change helper (suggest_deletion, revert_*) ends here
+        self.mark_dirty()
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        def w(name):
+            return f"{{{W_NAMESPACE}}}{name}"
+
+        def set_default(elem, name, value):
+            if elem.get(name) is None:
+                elem.set(name, value)
+
+        def add_rsid_to_p(elem):
+            set_default(elem, w("rsidR"), self.rsid)
+            set_default(elem, w("rsidRDefault"), self.rsid)
+            set_default(elem, w("rsidP"), self.rsid)
+            # Add w14:paraId and w14:textId if not present
+            for name in ("paraId", "textId"):
+                if elem.get(f"{{{W14_NAMESPACE}}}{name}") is None:
+                    self._ensure_namespace("w14", W14_NAMESPACE)
+                    elem.set(f"{{{W14_NAMESPACE}}}{name}", _generate_hex_id())
+
+        def add_rsid_to_r(elem):
+            # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
+            if any(parent.tag == w("del") for parent in elem.iterancestors()):
+                set_default(elem, w("rsidDel"), self.rsid)
+            else:
+                set_default(elem, w("rsidR"), self.rsid)
+
+        def add_tracked_change_attrs(elem):
+            # Auto-assign w:id if not present
+            if elem.get(w("id")) is None:
+                elem.set(w("id"), str(self.next_id("change")))
+            set_default(elem, w("author"), self.author)
+            set_default(elem, w("date"), timestamp)
+            # Add w16du:dateUtc (same as w:date since we generate UTC timestamps)
+            if elem.get(f"{{{W16DU_NAMESPACE}}}dateUtc") is None:
+                self._ensure_namespace("w16du", W16DU_NAMESPACE)
+                elem.set(f"{{{W16DU_NAMESPACE}}}dateUtc", timestamp)
+
+        def add_comment_attrs(elem):
+            set_default(elem, w("author"), self.author)
+            set_default(elem, w("date"), timestamp)
+            set_default(elem, w("initials"), self.initials)
+
+        def add_comment_extensible_date(elem):
+            if elem.get(f"{{{W16CEX_NAMESPACE}}}dateUtc") is None:
+                self._ensure_namespace("w16cex", W16CEX_NAMESPACE)
+                elem.set(f"{{{W16CEX_NAMESPACE}}}dateUtc", timestamp)
+
+        def add_xml_space_to_t(elem):
+            # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
+            text = elem.text
+            if text and (text[0].isspace() or text[-1].isspace()):
+                set_default(elem, f"{{{XML_NAMESPACE}}}space", "preserve")
+
+        handlers = {
+            w("p"): add_rsid_to_p,
+            w("r"): add_rsid_to_r,
+            w("t"): add_xml_space_to_t,
+            w("ins"): add_tracked_change_attrs,
+            w("del"): add_tracked_change_attrs,
+            w("comment"): add_comment_attrs,
+            f"{{{W16CEX_NAMESPACE}}}commentExtensible": add_comment_extensible_date,
+        }
+        for node in nodes:
+            if not isinstance(node.tag, str):
+                continue
+
+            # Handle the node and its descendants in one document-order walk
+            for elem in node.iter(*handlers):
+                handlers[elem.tag](elem)
+
+    def _nodes_inserted(self, nodes):
+        """Apply automatic attributes to content inserted by edits and batches."""
+        self._inject_attributes_to_nodes(nodes)
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion().
+
+        Args:
+            elem: Element to process (w:ins, w:p, w:body, etc.)
+
+        Returns:
+            list: List containing the processed element(s)
+
+        Raises:
+            ValueError: If the element contains no w:ins elements
+        """
+        ins_tag = f"{{{W_NAMESPACE}}}ins"
+        ins_elements = [elem] if elem.tag == ins_tag else list(elem.iter(ins_tag))
+
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{self.tag_name(elem)}> contains no insertions. "
+            )
+
+        # Process all insertions - wrap all children in w:del
+        for ins_elem in ins_elements:
+            runs = list(ins_elem.iter(f"{{{W_NAMESPACE}}}r"))
+            if not runs:
+                continue
+
+            for run in runs:
+                self._mark_run_deleted(run)
+                self._rename_all(run, "t", "delText")
+
+            # Move all children from ins to a del wrapper inside it
+            del_wrapper = self._new_element("w:del")
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            del_wrapper.extend(list(ins_elem))
+            ins_elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion().
+
+        Args:
+            elem: Element to process (w:del, w:p, w:body, etc.)
+
+        Returns:
+            list: If elem is w:del, returns [elem, new_ins]. Otherwise returns [elem].
+
+        Raises:
+            ValueError: If the element contains no w:del elements
+        """
+        del_tag = f"{{{W_NAMESPACE}}}del"
+        is_single_del = elem.tag == del_tag
+        del_elements = [elem] if is_single_del else list(elem.iter(del_tag))
+
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{self.tag_name(elem)}> contains no deletions. "
+            )
+
+        created_insertion = None
+
+        # Process all deletions - create insertions that copy the deleted content
+        for del_elem in del_elements:
+            runs = list(del_elem.iter(f"{{{W_NAMESPACE}}}r"))
+            if not runs:
+                continue
+
+            ins_elem = self._new_element("w:ins")
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                self._rename_all(new_run, "delText", "t")
+
+                # Update run attributes: w:rsidDel → w:rsidR
+                rsid_del = new_run.attrib.pop(f"{{{W_NAMESPACE}}}rsidDel", None)
+                if rsid_del is not None:
+                    new_run.set(f"{{{W_NAMESPACE}}}rsidR", rsid_del)
+                elif new_run.get(f"{{{W_NAMESPACE}}}rsidR") is None:
+                    new_run.set(f"{{{W_NAMESPACE}}}rsidR", self.rsid)
+                new_run.tail = None
+                ins_elem.append(new_run)
+
+            # Insert the new insertion after the deletion
+            del_elem.addnext(ins_elem)
+            self._inject_attributes_to_nodes([ins_elem])
+
+            if is_single_del:
+                created_insertion = ins_elem
+
+        if is_single_del and created_insertion is not None:
+            return [elem, created_insertion]
+        return [elem]
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion().
+
+        Args:
+            elem: A w:r or w:p element without existing tracked changes
+
+        Returns:
+            Element: The w:del wrapper for a run, or the modified paragraph
+
+        Raises:
+            ValueError: If element has existing tracked changes or invalid structure
+        """
+        name = self.tag_name(elem)
+        if name == "w:r":
+            if self.find_all("w:delText", within=elem):
+                raise ValueError("w:r element already contains w:delText")
+
+            self._rename_all(elem, "t", "delText")
+            self._mark_run_deleted(elem)
+
+            # Wrap in w:del, leaving the run's tail outside the wrapper
+            del_wrapper = self._new_element("w:del")
+            elem.addprevious(del_wrapper)
+            del_wrapper.tail, elem.tail = elem.tail, None
+            del_wrapper.append(elem)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return del_wrapper
+
+        elif name == "w:p":
+            if self.find_all("w:ins", within=elem) or self.find_all("w:del", within=elem):
+                raise ValueError("w:p element already contains tracked changes")
+
+            # Numbered list items also get <w:del/> in the paragraph mark's w:rPr
+            pPr_list = self.find_all("w:pPr", within=elem)
+            if pPr_list and self.find_all("w:numPr", within=pPr_list[0]):
+                pPr = pPr_list[0]
+                rPr_list = self.find_all("w:rPr", within=pPr)
+                if rPr_list:
+                    rPr = rPr_list[0]
+                else:
+                    rPr = self._new_element("w:rPr")
+                    pPr.append(rPr)
+                rPr.insert(0, self._new_element("w:del"))
+
+            self._rename_all(elem, "t", "delText")
+            for run in elem.iter(f"{{{W_NAMESPACE}}}r"):
+                self._mark_run_deleted(run)
+
+            # Wrap all non-pPr children in <w:del>
+            pPr_tag = f"{{{W_NAMESPACE}}}pPr"
+            children = [c for c in elem if c.tag != pPr_tag]
+            del_wrapper = self._new_element("w:del")
+            elem.append(del_wrapper)
+            del_wrapper.extend(children)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {name}")
+
+    def _mark_run_deleted(self, run):
+        """Move a run's w:rsidR to w:rsidDel (or set w:rsidDel to this RSID)."""
+        rsid = run.attrib.pop(f"{{{W_NAMESPACE}}}rsidR", None)
+        if rsid is not None:
+            run.set(f"{{{W_NAMESPACE}}}rsidDel", rsid)
+        elif run.get(f"{{{W_NAMESPACE}}}rsidDel") is None:
+            run.set(f"{{{W_NAMESPACE}}}rsidDel", self.rsid)
+
+    def _rename_all(self, elem, old, new):
+        """Rename every w:<old> element below elem to w:<new>, keeping content."""
+        for child in list(elem.iter(f"{{{W_NAMESPACE}}}{old}")):
+            child.tag = f"{{{W_NAMESPACE}}}{new}"
+
+
+# Editor class used by Document for each engine
+EDITOR_ENGINES = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -609,6 +879,62 @@ def _generate_rsid() -> str:
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+# ioctl that makes a file share another file's data blocks (Linux reflink)
+FICLONE = 0x40049409
+
+
+def _clone_or_copy(src, dst):
+    """Copy src to dst as an independent file.
+
+    Uses a reflink (shared blocks, copied on write by the filesystem) where
+    supported, e.g. on Btrfs or XFS, and a plain copy everywhere else.
+    Either way, writing to dst can never change src.
+    """
+    try:
+        import fcntl
+
+        with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+            fcntl.ioctl(f_dst.fileno(), FICLONE, f_src.fileno())
+        shutil.copystat(src, dst)
+    except (ImportError, OSError):
+        shutil.copy2(src, dst)
+    return dst
+
+
+def _link_or_copy(src, dst):
+    """Hard-link src to dst, falling back to a copy (e.g. across filesystems)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _write_back(src, dst, parts):
+    """Copy the named parts from src into dst.
+
+    Each part is copied to a temporary name and renamed into place, so a
+    destination file is never rewritten in place.
+    """
+    for part in parts:
+        target = Path(dst) / part
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp = target.with_name(f".{target.name}.tmp")
+        shutil.copy2(Path(src) / part, temp)
+        os.replace(temp, target)
+
+
+def _same_size_and_mtime(source, target):
+    """True if target looks like an earlier copy2() of source."""
+    try:
+        source_stat, target_stat = source.stat(), target.stat()
+    except FileNotFoundError:
+        return False
+    return (
+        source_stat.st_size == target_stat.st_size
+        and source_stat.st_mtime_ns == target_stat.st_mtime_ns
+    )
+
+
 class Document:
     """Manages comments in unpacked Word documents."""
 
@@ -619,6 +945,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        engine="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,20 +957,39 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            engine: XML backend for editors: "minidom" (default, DocxXMLEditor) or
+                "lxml" (LxmlDocxXMLEditor, much lighter on large documents)
         """
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
+        if engine not in EDITOR_ENGINES:
+            raise ValueError(
+                f"Unknown engine: {engine} (expected one of {', '.join(EDITOR_ENGINES)})"
+            )
+        self.engine = engine
 
-        # Create temporary directory with subdirectories for unpacked content and baseline
+        # Create temporary directory for the working copy. A part is copied
+        # into it only when an editor opens it (see __getitem__) or the
+        # Document creates it; every other part stays in the original directory.
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self.unpacked_path.mkdir()
+        self._original_docx = None
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Original versions of the parts save() has replaced in the original
+        # directory (parts it added have none), for packing original_docx
+        self._baseline_path = Path(self.temp_dir) / "baseline"
+        self._replaced_parts = set()
+
+        # Editors of the parts copied in by __getitem__, by part name; such a
+        # part only counts as changed once its editor has saved it
+        self._opened_parts = {}
+
+        # Paragraph texts kept between validations, so each save only re-reads
+        # the paragraphs that changed and never re-reads the original
+        self._redlining_memo = ParagraphMemo()
 
         self.word_path = self.unpacked_path / "word"
 
@@ -664,9 +1010,8 @@ class Document:
         self.comments_ids_path = self.word_path / "commentsIds.xml"
         self.comments_extensible_path = self.word_path / "commentsExtensible.xml"
 
-        # Load existing comments and determine next ID (before setup modifies files)
+        # Load existing comments (before setup modifies files)
         self.existing_comments = self._load_existing_comments()
-        self.next_comment_id = self._get_next_comment_id()
 
         # Convenient access to document.xml editor (semi-private)
         self._document = self["word/document.xml"]
@@ -702,12 +1047,21 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
-            if not file_path.exists():
-                raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            opened = not file_path.exists()
+            if opened:
+                # Copy the part into the working copy on first use
+                source = self.original_path / xml_path
+                if not source.is_file():
+                    raise ValueError(f"XML file not found: {xml_path}")
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                _clone_or_copy(source, file_path)
+            # Use the engine's DocxXMLEditor with RSID, author, and initials for all editors
+            editor = EDITOR_ENGINES[self.engine](
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
+            if opened:
+                self._opened_parts[Path(xml_path).as_posix()] = editor
+            self._editors[xml_path] = editor
         return self._editors[xml_path]
 
     def add_comment(self, start, end, text: str) -> int:
@@ -727,7 +1081,7 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
+        comment_id = self._next_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -737,7 +1091,7 @@ class Document:
 
         # If end node is a paragraph, append comment markup inside it
         # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
+        if self._document.tag_name(end) == "w:p":
             self._document.append_to(end, self._comment_range_end_xml(comment_id))
         else:
             self._document.insert_after(end, self._comment_range_end_xml(comment_id))
@@ -759,7 +1113,6 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
     def reply_to_comment(
@@ -784,7 +1137,7 @@ class Document:
             raise ValueError(f"Parent comment with id={parent_comment_id} not found")
 
         parent_info = self.existing_comments[parent_comment_id]
-        comment_id = self.next_comment_id
+        comment_id = self._next_comment_id()
         para_id = _generate_hex_id()
         durable_id = _generate_hex_id()
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -800,7 +1153,7 @@ class Document:
         self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
-        parent_ref_run = parent_ref_elem.parentNode
+        parent_ref_run = self._document.parent(parent_ref_elem)
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
@@ -827,9 +1180,72 @@ class Document:
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
         return comment_id
 
+    @property
+    def original_docx(self):
+        """Path to the packed original document, built on first use.
+
+        Packed from the original directory, with the parts save() has
+        replaced there taken from their baseline copies, so it reflects the
+        document as it was opened.
+        """
+        if self._original_docx is None:
+            original_docx = Path(self.temp_dir) / "original.docx"
+            if not self._replaced_parts:
+                pack_document(self.original_path, original_docx, validate=False)
+            else:
+                # Reassemble the original tree from links, without copying data
+                source = Path(self.temp_dir) / "original"
+                for part in DirectoryPackage(self.original_path).names():
+                    path = self.original_path / part
+                    if part in self._replaced_parts:
+                        path = self._baseline_path / part
+                        if not path.is_file():
+                            continue  # Added by save()
+                    target = source / part
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    _link_or_copy(path, target)
+                pack_document(source, original_docx, validate=False)
+                shutil.rmtree(source)
+            self._original_docx = original_docx
+        return self._original_docx
+
+    def changed_parts(self):
+        """
+        List the parts that differ from the original document.
+
+        A part counts as changed when it is in unpacked_path and was not just
+        copied there by __getitem__: files created from templates, anything
+        added to unpacked_path (e.g. images), and opened parts once their
+        editor has saved them. Edits still held only in editors are not
+        included until save().
+
+        Returns:
+            list: Package-relative POSIX paths, sorted
+        """
+        changed = []
+        for dirpath, _, filenames in os.walk(self.unpacked_path):
+            directory = Path(dirpath)
+            for filename in filenames:
+                part = (directory / filename).relative_to(self.unpacked_path).as_posix()
+                editor = self._opened_parts.get(part)
+                if editor is None or editor.written:
+                    changed.append(part)
+        return sorted(changed)
+
+    def _keep_baseline(self, parts):
+        """Copy the original files of parts into the baseline, once per part."""
+        for part in parts:
+            if part in self._replaced_parts:
+                continue
+            source = self.original_path / part
+            if source.is_file():
+                target = self._baseline_path / part
+                target.parent.mkdir(parents=True, exist_ok=True)
+                _clone_or_copy(source, target)
+            self._replaced_parts.add(part)
+
     def __del__(self):
         """Clean up temporary directory on deletion."""
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
@@ -842,36 +1258,48 @@ class Document:
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
-        schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-        redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-
-        # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+        # Validate the working copy over the original directory, limited to
+        # the parts that changed
+        package = OverlayPackage(self.unpacked_path, self.original_path)
+        changed_parts = self.changed_parts()
+        with DOCXSchemaValidator(
+            package,
+            self.original_docx,
+            verbose=False,
+            changed_parts=changed_parts,
+        ) as schema_validator:
+            report = schema_validator.validate()
+        if not report:
+            raise ValueError(
+                f"Schema validation failed: {', '.join(report.failed_checks)}"
+            )
+        with RedliningValidator(
+            package,
+            self.original_docx,
+            verbose=False,
+            changed_parts=changed_parts,
+            memo=self._redlining_memo,
+        ) as redlining_validator:
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
 
     def save(self, destination=None, validate=True) -> None:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only files whose content differs from the destination are written.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
         """
         # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
+        if self._has_part("word/comments.xml"):
             self._ensure_comment_relationships()
             self._ensure_comment_content_types()
 
-        # Save all modified XML files in temp directory
+        # Save modified XML files in temp directory (editors skip untouched parts)
         for editor in self._editors.values():
             editor.save()
 
@@ -879,45 +1307,51 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
+        # Copy changed parts from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        changed_parts = self.changed_parts()
+        if target_path.resolve() == self.original_path.resolve():
+            # Keep the original files this save replaces, for original_docx
+            if self._original_docx is None:
+                self._keep_baseline(changed_parts)
+        else:
+            # A new destination also needs the untouched parts; skip those an
+            # earlier save already copied there
+            untouched = [
+                part
+                for part in DirectoryPackage(self.original_path).names()
+                if part not in changed_parts
+                and not _same_size_and_mtime(
+                    self.original_path / part, target_path / part
+                )
+            ]
+            _write_back(self.original_path, target_path, untouched)
+        _write_back(self.unpacked_path, target_path, changed_parts)
 
     # ==================== Private: Initialization ====================
 
-    def _get_next_comment_id(self):
-        """Get the next available comment ID."""
-        if not self.comments_path.exists():
-            return 0
-
-        editor = self["word/comments.xml"]
-        max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
-            if comment_id:
-                try:
-                    max_id = max(max_id, int(comment_id))
-                except ValueError:
-                    pass
-        return max_id + 1
+    def _next_comment_id(self):
+        """Allocate the next comment ID from comments.xml, creating it if needed."""
+        self._create_from_template("word/comments.xml")
+        return self["word/comments.xml"].next_id("comment")
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._has_part("word/comments.xml"):
             return {}
 
         editor = self["word/comments.xml"]
         existing = {}
 
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor.find_all("w:comment"):
+            comment_id = editor.get_attribute(comment_elem, "w:id")
             if not comment_id:
                 continue
 
             # Find para_id from the w:p element within the comment
             para_id = None
-            for p_elem in comment_elem.getElementsByTagName("w:p"):
-                para_id = p_elem.getAttribute("w14:paraId")
+            for p_elem in editor.find_all("w:p", within=comment_elem):
+                para_id = editor.get_attribute(p_elem, "w14:paraId")
                 if para_id:
                     break
 
@@ -937,8 +1371,7 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml
         """
         # Create or update word/people.xml
-        people_file = self.word_path / "people.xml"
-        self._update_people_xml(people_file)
+        self._create_from_template("word/people.xml")
 
         # Update XML files
         self._add_content_type_for_people(self.unpacked_path / "[Content_Types].xml")
@@ -951,11 +1384,18 @@ class Document:
             self.word_path / "settings.xml", track_revisions=track_revisions
         )
 
-    def _update_people_xml(self, path):
-        """Create people.xml if it doesn't exist."""
-        if not path.exists():
-            # Copy from template
-            shutil.copy(TEMPLATE_DIR / "people.xml", path)
+    def _has_part(self, part):
+        """Check if a part exists in the working copy or the original directory."""
+        return any(
+            (root / part).is_file() for root in (self.unpacked_path, self.original_path)
+        )
+
+    def _create_from_template(self, part):
+        """Create a word/ part from its template if the document lacks it."""
+        if not self._has_part(part):
+            path = self.unpacked_path / part
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(TEMPLATE_DIR / Path(part).name, path)
 
     def _add_content_type_for_people(self, path):
         """Add people.xml content type to [Content_Types].xml if not already present."""
@@ -965,7 +1405,7 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
+        root = editor.root
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
@@ -976,8 +1416,8 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor.root
+        root_tag = editor.tag_name(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid = editor.get_next_rid()
 
@@ -998,34 +1438,33 @@ class Document:
         """
         editor = self["word/settings.xml"]
         root = editor.get_node(tag="w:settings")
-        prefix = root.tagName.split(":")[0] if ":" in root.tagName else "w"
+        root_tag = editor.tag_name(root)
+        prefix = root_tag.split(":")[0] if ":" in root_tag else "w"
 
         # Conditionally add trackRevisions if requested
         if track_revisions:
-            track_revisions_exists = any(
-                elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
-            )
+            track_revisions_exists = bool(editor.find_all(f"{prefix}:trackRevisions"))
 
             if not track_revisions_exists:
                 track_rev_xml = f"<{prefix}:trackRevisions/>"
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor.find_all(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
                         break
                 if not inserted:
                     # Insert as first child of settings
-                    if root.firstChild:
-                        editor.insert_before(root.firstChild, track_rev_xml)
+                    first_child = editor.first_child(root)
+                    if first_child is not None:
+                        editor.insert_before(first_child, track_rev_xml)
                     else:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor.find_all(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1036,15 +1475,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor.find_all(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
-                    f"{prefix}:clrSchemeMapping"
-                )
+                clr_elements = editor.find_all(f"{prefix}:clrSchemeMapping")
                 if clr_elements:
                     editor.insert_before(clr_elements[0], rsids_xml)
                     inserted = True
@@ -1055,8 +1492,8 @@ class Document:
             # Check if this rsid already exists
             rsids_elem = rsids_elements[0]
             rsid_exists = any(
-                elem.getAttribute(f"{prefix}:val") == self.rsid
-                for elem in rsids_elem.getElementsByTagName(f"{prefix}:rsid")
+                editor.get_attribute(elem, f"{prefix}:val") == self.rsid
+                for elem in editor.find_all(f"{prefix}:rsid", within=rsids_elem)
             )
 
             if not rsid_exists:
@@ -1069,9 +1506,6 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
-
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
 
@@ -1090,10 +1524,7 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
+        self._create_from_template("word/commentsExtended.xml")
 
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
@@ -1106,8 +1537,7 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+        self._create_from_template("word/commentsIds.xml")
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
@@ -1117,10 +1547,7 @@ class Document:
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
+        self._create_from_template("word/commentsExtensible.xml")
 
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
@@ -1159,31 +1586,29 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
+        for rel_elem in editor.find_all("Relationship"):
+            if editor.get_attribute(rel_elem, "Target") == target:
                 return True
         return False
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
+        for override_elem in editor.find_all("Override"):
+            if editor.get_attribute(override_elem, "PartName") == part_name:
                 return True
         return False
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
+        for person_elem in editor.find_all("w15:person"):
+            if editor.get_attribute(person_elem, "w15:author") == author:
                 return True
         return False
 
     def _add_author_to_people(self, author):
         """Add author to people.xml (called during initialization)."""
-        people_path = self.word_path / "people.xml"
-
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._has_part("word/people.xml"):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
@@ -1207,8 +1632,8 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor.root
+        root_tag = editor.tag_name(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid_num = int(editor.get_next_rid()[3:])
 
@@ -1247,7 +1672,7 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor.root
 
         # Add Override elements
         overrides = [
@@ -6,6 +6,11 @@ This module provides XMLEditor, a tool for manipulating XML files with support f
 line-number-based node finding and DOM manipulation. Each element is automatically
 annotated with its original line and column position during parsing.
 
+LxmlXMLEditor offers the same interface on lxml, which keeps line numbers natively
+(sourceline) and needs far less memory than minidom for large parts. Elements it
+returns are lxml elements, so backend-neutral code should go through the editor's
+accessors (root, find_all, tag_name, parent, get_attribute, first_child).
+
 Example usage:
     editor = XMLEditor("document.xml")
 
@@ -30,12 +35,19 @@ Example usage:
     editor.save()
 """
 
+import hashlib
 import html
+import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Union
 
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+from ooxml.scripts.xml_format import parse as parse_xml, remove_keeping_tail
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 
 class XMLEditor:
@@ -50,8 +62,13 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        generation: Number of mutations made through this editor (see dirty)
     """
 
+    # Integer ID families next_id() allocates:
+    # kind -> (tags, attribute, value prefix, first ID)
+    ID_KINDS = {"rid": (("Relationship",), "Id", "rId", 1)}
+
     def __init__(self, xml_path):
         """
         Initialize with path to XML file and parse with line number tracking.
@@ -71,7 +88,27 @@ class XMLEditor:
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
         parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+
+        # Bumped by every mutation made through the editor
+        self.generation = 0
+        self._saved_generation = 0
+
+        # Set once nodes have been handed to the caller, who may then change
+        # them directly; save() must then compare content (see dirty)
+        self._handed_out = False
+
+        # Digest of the content last written by save() (None before the first write)
+        self._saved_digest = None
+
+        # Lookup index for get_node, built on first use and dropped on mutation
+        self._index = None
+
+        # Edits queued by batch() (None outside a batch)
+        self._batch = None
+
+        # ID allocators by kind, seeded on first use (see next_id)
+        self._allocators = {}
 
     def get_node(
         self,
@@ -109,40 +146,34 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
-
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+        index = self._get_index()
+
+        # Check line_number filter
+        if line_number is None:
+            matches = index.elements(tag)
+        elif isinstance(line_number, range):
+            matches = [
+                elem
+                for elem in index.elements(tag)
+                if index.line(elem) in line_number
+            ]
+        else:
+            matches = index.at_line(tag, line_number)
+
+        # Check attrs filter
+        if attrs is not None:
+            for attr_name, attr_value in attrs.items():
+                allowed = index.with_attr(tag, attr_name, attr_value)
+                matches = [elem for elem in matches if elem in allowed]
+
+        # Check contains filter
+        if contains is not None:
+            # Normalize the search string: convert HTML entities to Unicode characters
+            # This allows searching for both "&#8220;Rowan" and ""Rowan"
+            normalized_contains = html.unescape(contains)
+            matches = [
+                elem for elem in matches if normalized_contains in index.text(elem)
+            ]
 
         if not matches:
             # Build descriptive error message
@@ -178,6 +209,7 @@ class XMLEditor:
                 f"Multiple nodes found: <{tag}>. "
                 f"Add more filters (attrs, line_number, or contains) to narrow the search."
             )
+        self._handed_out = True
         return matches[0]
 
     def _get_element_text(self, elem):
@@ -186,6 +218,7 @@ class XMLEditor:
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
+        Results are cached until the next mutation.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
@@ -193,15 +226,13 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
-        text_parts = []
-        for node in elem.childNodes:
-            if node.nodeType == node.TEXT_NODE:
-                # Skip whitespace-only text nodes (XML formatting)
-                if node.data.strip():
-                    text_parts.append(node.data)
-            elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
-        return "".join(text_parts)
+        return self._get_index().text(elem)
+
+    def _get_index(self):
+        """Return the lookup index for the current DOM, building it if needed."""
+        if self._index is None:
+            self._index = _ElementIndex(self._dom.documentElement)
+        return self._index
 
     def replace_node(self, elem, new_content):
         """
@@ -217,12 +248,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._edit("replace", elem, new_content)
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +264,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._edit("after", elem, xml_content)
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +280,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._edit("before", elem, xml_content)
 
     def append_to(self, elem, xml_content):
         """
@@ -282,32 +296,293 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        return self._edit("append", elem, xml_content)
+
+    @contextmanager
+    def batch(self):
+        """
+        Queue edits and apply them together when the block ends.
+
+        Inside the block, replace_node, insert_after, insert_before and
+        append_to only record the edit and return an empty list, which is
+        filled with the inserted nodes when the batch is applied. On exit all
+        fragments are parsed as one wrapper document and every target is
+        checked, then the edits are applied in the order they were made and
+        subclasses post-process every inserted node in a single pass. If the
+        block raises, a fragment is malformed, or a target cannot be edited
+        (not in the document, or inside an element an earlier edit of the
+        batch replaces), no queued edit is applied. Nested batches join the
+        outermost one.
+
+        Example:
+            with editor.batch():
+                for elem, xml in edits:
+                    editor.replace_node(elem, xml)
+        """
+        if self._batch is not None:
+            yield self
+            return
+
+        self._batch = []
+        try:
+            yield self
+            edits = self._batch
+        finally:
+            self._batch = None
+        if edits:
+            self._apply_edits(edits)
+
+    def _edit(self, position, elem, xml_content):
+        """Apply one edit now, or queue it while a batch is open."""
+        nodes = []
+        if self._batch is not None:
+            self._batch.append((position, elem, xml_content, nodes))
+        else:
+            self._apply_edits([(position, elem, xml_content, nodes)])
         return nodes
 
+    def _apply_edits(self, edits):
+        """
+        Parse and place a list of edits.
+
+        Every target is checked and every fragment parsed before the first
+        edit is placed, so a failure leaves the document unchanged.
+
+        Args:
+            edits: (position, elem, xml_content, nodes) tuples, where position
+                is "replace", "after", "before" or "append" and nodes is the
+                list returned to the caller, extended with the inserted nodes
+
+        Raises:
+            ValueError: If a target cannot be edited
+        """
+        self._check_targets(edits)
+        fragments = self._parse_fragments([xml for _, _, xml, _ in edits])
+        inserted = []
+        for (position, elem, _, nodes), fragment in zip(edits, fragments):
+            self._place(position, elem, fragment)
+            nodes.extend(fragment)
+            inserted.extend(fragment)
+        self.mark_dirty()
+        self._observe_ids(inserted)
+        if len(edits) > 1:
+            inserted = self._in_document_order(inserted)
+        self._nodes_inserted(inserted)
+
+    def _check_targets(self, edits):
+        """Raise ValueError unless every edit's target can be edited in turn.
+
+        A target must be in the document, must not be the root element
+        unless appending to it, and must not be (or be inside) an element
+        replaced by an earlier edit of the same list.
+        """
+        root = self._root_element()
+        replaced = set()
+        for position, elem, _, _ in edits:
+            node = elem
+            while node is not None and node is not root:
+                if node in replaced:
+                    raise ValueError(
+                        f"<{self.tag_name(elem)}> was removed by an earlier "
+                        "replace_node() in this batch"
+                    )
+                node = self.parent(node)
+            if node is None:
+                raise ValueError(
+                    f"<{self.tag_name(elem)}> is not part of {self.xml_path.name}"
+                )
+            if elem is root and position != "append":
+                raise ValueError("The root element can only be appended to")
+            if position == "replace":
+                replaced.add(elem)
+
+    def _root_element(self):
+        """Return the root element without handing it out (see dirty)."""
+        return self._dom.documentElement
+
+    def _nodes_inserted(self, nodes):
+        """Hook called with the nodes inserted by each edit or batch, in document order."""
+
+    def _place(self, position, elem, nodes):
+        """Insert parsed nodes relative to elem (see _apply_edits)."""
+        if position == "append":
+            for node in nodes:
+                elem.appendChild(node)
+            return
+
+        parent = elem.parentNode
+        if position == "after":
+            next_sibling = elem.nextSibling
+            for node in nodes:
+                if next_sibling:
+                    parent.insertBefore(node, next_sibling)
+                else:
+                    parent.appendChild(node)
+        else:
+            for node in nodes:
+                parent.insertBefore(node, elem)
+            if position == "replace":
+                parent.removeChild(elem)
+
+    def _subtree(self, node):
+        """Return node and every element below it, or nothing for non-elements."""
+        if node.nodeType != node.ELEMENT_NODE:
+            return []
+        return [node, *node.getElementsByTagName("*")]
+
+    def _in_document_order(self, nodes):
+        """Return the element nodes among nodes, sorted by document position."""
+        position = {elem: i for i, elem in enumerate(self._get_index().elements("*"))}
+        return sorted(
+            (node for node in nodes if node in position), key=position.__getitem__
+        )
+
+    @property
+    def dom(self):
+        """The parsed DOM tree; changes made to it directly are saved (see dirty)."""
+        self._handed_out = True
+        return self._dom
+
+    @property
+    def root(self):
+        """The document's root element."""
+        self._handed_out = True
+        return self._root_element()
+
+    def find_all(self, tag, within=None):
+        """
+        Return all elements with a tag name, in document order.
+
+        Args:
+            tag: The XML tag name (e.g., "w:comment"), or "*" for every element
+            within: Optional element to search below (the element itself is not
+                included); defaults to the whole document
+
+        Returns:
+            list: The matching elements
+        """
+        self._handed_out = True
+        if within is None:
+            return self._get_index().elements(tag)
+        return list(within.getElementsByTagName(tag))
+
+    def tag_name(self, elem):
+        """Return an element's tag name as written, e.g. "w:p"."""
+        return elem.tagName
+
+    def parent(self, elem):
+        """Return an element's parent node."""
+        return elem.parentNode
+
+    def get_attribute(self, elem, name):
+        """Return an attribute value by prefixed name ("" if missing)."""
+        return elem.getAttribute(name)
+
+    def first_child(self, elem):
+        """Return an element's first child node (None if it has none)."""
+        return elem.firstChild
+
     def get_next_rid(self):
-        """Get the next available rId for relationships files."""
-        max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
-            rel_id = rel_elem.getAttribute("Id")
-            if rel_id.startswith("rId"):
-                try:
-                    max_id = max(max_id, int(rel_id[3:]))
-                except ValueError:
-                    pass
-        return f"rId{max_id + 1}"
+        """Allocate the next available rId for relationships files."""
+        return f"rId{self.next_id('rid')}"
+
+    def next_id(self, kind):
+        """
+        Allocate an unused integer ID of one of the kinds in ID_KINDS.
+
+        The first call for a kind scans the document for IDs already in use;
+        later calls count up from there without rescanning. IDs carried by
+        content inserted through the editor (replace_node, insert_after,
+        insert_before, append_to) are taken into account, so IDs written
+        explicitly into raw XML are never handed out again. Each call returns
+        a new ID, whether or not it ends up in the document.
+
+        Args:
+            kind: Key of ID_KINDS, e.g. "rid"
+
+        Returns:
+            int: The allocated ID
+
+        Example:
+            rel_id = f"rId{editor.next_id('rid')}"
+        """
+        allocator = self._allocators.get(kind)
+        if allocator is None:
+            tags, attribute, prefix, first = self.ID_KINDS[kind]
+            allocator = _IdAllocator(prefix, first)
+            for tag in tags:
+                for elem in self._get_index().elements(tag):
+                    allocator.observe(self.get_attribute(elem, attribute))
+            self._allocators[kind] = allocator
+        return allocator.allocate()
+
+    def _observe_ids(self, nodes):
+        """Move seeded allocators past any ID found in newly inserted nodes."""
+        if not self._allocators:
+            return
+        watched = {}  # tag -> list of (attribute, allocator)
+        for kind, allocator in self._allocators.items():
+            tags, attribute, _, _ = self.ID_KINDS[kind]
+            for tag in tags:
+                watched.setdefault(tag, []).append((attribute, allocator))
+        for node in nodes:
+            for elem in self._subtree(node):
+                for attribute, allocator in watched.get(self.tag_name(elem), ()):
+                    allocator.observe(self.get_attribute(elem, attribute))
+
+    def mark_dirty(self):
+        """
+        Record a mutation made directly on the DOM.
+
+        replace_node, insert_after, insert_before and append_to call this
+        automatically. Call it after changing the DOM directly so that
+        get_node() stops using its cached lookups; save() does not depend on
+        it. next_id() does not rescan after direct changes, so new elements
+        that carry explicit IDs should be inserted through the edit methods.
+        """
+        self.generation += 1
+        self._index = None
+
+    @property
+    def dirty(self):
+        """True if the DOM may differ from what was loaded or last saved.
+
+        Mutations made through the editor are counted, but direct changes
+        to nodes it handed out (get_node, find_all, root, dom) cannot be
+        seen, so an editor that handed out nodes always counts as dirty and
+        save() compares the serialized content instead.
+        """
+        return self._handed_out or self.generation != self._saved_generation
+
+    @property
+    def written(self):
+        """True once save() has replaced the file on disk."""
+        return self._saved_digest is not None
 
     def save(self):
         """
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). The file is replaced
+        rather than rewritten, so readers never see a partly written part.
+        Nothing is written if the editor is not dirty or the content is the
+        same as at the last save.
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        if not self.dirty:
+            return
+        content = self._serialize()
+        digest = hashlib.sha256(content).digest()
+        if digest != self._saved_digest:
+            temp_path = self.xml_path.with_name(f".{self.xml_path.name}.tmp")
+            temp_path.write_bytes(content)
+            os.replace(temp_path, self.xml_path)
+            self._saved_digest = digest
+        self._saved_generation = self.generation
+
+    def _serialize(self):
+        """Return the document as bytes in its original encoding."""
+        return self._dom.toxml(encoding=self.encoding)
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,8 +597,23 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments in one wrapper document.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            One list of imported defusedxml.minidom.Node objects per fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
         # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
+        root_elem = self._dom.documentElement
         namespaces = []
         if root_elem and root_elem.attributes:
             for i in range(root_elem.attributes.length):
@@ -332,15 +622,416 @@ class XMLEditor:
                     namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
 
         ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
+        wrapper = f"<root {ns_decl}>{_wrap_fragments(xml_contents)}</root>"
         fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
+        fragments = fragment_doc.documentElement.childNodes  # type: ignore
+        assert len(fragments) == len(xml_contents), "Fragments must be balanced"
+
+        result = []
+        for fragment in fragments:
+            nodes = [
+                self._dom.importNode(child, deep=True) for child in fragment.childNodes
+            ]
+            elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+            assert elements, "Fragment must contain at least one element"
+            result.append(nodes)
+        return result
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml instead of minidom.
+
+    Same interface and lookup rules as XMLEditor, but elements are lxml
+    elements and line numbers come from lxml's sourceline. Tag and attribute
+    names are written with their prefixes ("w:p", "w:id") as in XMLEditor.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree._ElementTree
+        generation: Number of mutations made through this editor (see dirty)
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        data = self.xml_path.read_bytes()
+        header = data[:200].decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+
+        self._tree = parse_xml(data)
+
+        # Bumped by every mutation made through the editor
+        self.generation = 0
+        self._saved_generation = 0
+
+        # Set once nodes have been handed to the caller (see XMLEditor.dirty)
+        self._handed_out = False
+
+        # Digest of the content last written by save() (None before the first write)
+        self._saved_digest = None
+
+        # Lookup index for get_node, built on first use and dropped on mutation
+        self._index = None
+
+        # Edits queued by batch() (None outside a batch)
+        self._batch = None
+
+        # ID allocators by kind, seeded on first use (see next_id)
+        self._allocators = {}
+
+    @property
+    def tree(self):
+        """The parsed lxml tree; changes made to it directly are saved (see dirty)."""
+        self._handed_out = True
+        return self._tree
+
+    @property
+    def root(self):
+        """The document's root element."""
+        self._handed_out = True
+        return self._root_element()
+
+    def _root_element(self):
+        return self._tree.getroot()
+
+    def find_all(self, tag, within=None):
+        """
+        Return all elements with a tag name, in document order.
+
+        Args:
+            tag: The XML tag name (e.g., "w:comment"), or "*" for every element
+            within: Optional element to search below (the element itself is not
+                included); defaults to the whole document
+
+        Returns:
+            list: The matching elements
+        """
+        self._handed_out = True
+        if within is None:
+            return self._get_index().elements(tag)
+        return [
+            elem
+            for elem in within.iter(lxml.etree.Element)
+            if elem is not within and (tag == "*" or self.tag_name(elem) == tag)
         ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
-        assert elements, "Fragment must contain at least one element"
-        return nodes
+
+    def tag_name(self, elem):
+        """Return an element's tag name as written, e.g. "w:p"."""
+        return _prefixed_name(elem)
+
+    def parent(self, elem):
+        """Return an element's parent element."""
+        return elem.getparent()
+
+    def get_attribute(self, elem, name):
+        """Return an attribute value by prefixed name ("" if missing)."""
+        return elem.get(self._qualify(elem, name), "")
+
+    def first_child(self, elem):
+        """Return an element's first child (None if it has none)."""
+        return elem[0] if len(elem) else None
+
+    def _serialize(self):
+        """Return the document as bytes in its original encoding."""
+        return f'<?xml version="1.0" encoding="{self.encoding}"?>'.encode(
+            "ascii"
+        ) + lxml.etree.tostring(
+            self._tree, encoding=self.encoding, xml_declaration=False
+        )
+
+    def _get_index(self):
+        """Return the lookup index for the current tree, building it if needed."""
+        if self._index is None:
+            self._index = _LxmlElementIndex(self._root_element())
+        return self._index
+
+    def _qualify(self, elem, name):
+        """Turn a prefixed name such as "w:id" into lxml's {namespace}id form."""
+        prefix, _, local = name.rpartition(":")
+        if not prefix:
+            return name
+        if prefix == "xml":
+            return f"{{{XML_NAMESPACE}}}{local}"
+        namespace = self._root_element().nsmap.get(prefix) or elem.nsmap.get(prefix)
+        if namespace is None:
+            raise ValueError(f"Unknown namespace prefix: {prefix}")
+        return f"{{{namespace}}}{local}"
+
+    def _ensure_namespace(self, prefix, uri):
+        """Declare a namespace on the root element if it is not declared there.
+
+        lxml cannot add a declaration to an existing element directly, so the
+        declaration is added through cleanup_namespaces() while keeping every
+        declaration already present in the tree.
+        """
+        root = self._root_element()
+        if root.nsmap.get(prefix) == uri:
+            return
+        prefixes = {prefix}
+        for elem in root.iter(lxml.etree.Element):
+            prefixes.update(p for p in elem.nsmap if p)
+        lxml.etree.cleanup_namespaces(
+            root, top_nsmap={prefix: uri}, keep_ns_prefixes=sorted(prefixes)
+        )
+
+    def _new_element(self, tag):
+        """Create a detached element for this tree from a prefixed tag name.
+
+        The element carries the root's namespace declarations, which lxml
+        drops again as redundant once it is inserted into the tree.
+        """
+        root = self._root_element()
+        return root.makeelement(self._qualify(root, tag), nsmap=root.nsmap)
+
+    def _place(self, position, elem, nodes):
+        """Insert parsed nodes relative to elem (see XMLEditor._apply_edits)."""
+        if position == "append":
+            for node in nodes:
+                elem.append(node)
+        elif position == "after":
+            anchor = elem
+            for node in nodes:
+                anchor.addnext(node)
+                anchor = node
+        else:
+            for node in nodes:
+                elem.addprevious(node)
+            if position == "replace":
+                remove_keeping_tail(elem)
+
+    def _subtree(self, node):
+        """Return node and every element below it, or nothing for non-elements."""
+        if not isinstance(node.tag, str):
+            return []
+        return node.iter(lxml.etree.Element)
+
+    def _in_document_order(self, nodes):
+        """Return the element nodes among nodes, sorted by document position."""
+        wanted = {node for node in nodes if isinstance(node.tag, str)}
+        return [
+            elem
+            for elem in self._root_element().iter(lxml.etree.Element)
+            if elem in wanted
+        ]
+
+    def _parse_fragments(self, xml_contents):
+        """
+        Parse several XML fragments in one wrapper document.
+
+        Fragments are parsed with the root element's namespace declarations
+        in scope. Their elements report line 0, since they have no line in
+        the original file.
+
+        Args:
+            xml_contents: List of strings containing XML fragments
+
+        Returns:
+            One list of detached lxml nodes (elements and comments) per fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        namespaces = [
+            f'xmlns="{uri}"' if prefix is None else f'xmlns:{prefix}="{uri}"'
+            for prefix, uri in self._root_element().nsmap.items()
+        ]
+        wrapper = (
+            f"<root {' '.join(namespaces)}>{_wrap_fragments(xml_contents)}</root>"
+        )
+        fragments = list(parse_xml(wrapper.encode("utf-8")).getroot())
+        assert len(fragments) == len(xml_contents), "Fragments must be balanced"
+
+        result = []
+        for fragment in fragments:
+            nodes = list(fragment)
+            for node in nodes:
+                for elem in node.iter():
+                    elem.sourceline = 0
+            elements = [n for n in nodes if isinstance(n.tag, str)]
+            assert elements, "Fragment must contain at least one element"
+            result.append(nodes)
+        return result
+
+
+class _IdAllocator:
+    """
+    Hands out increasing integer IDs above every ID seen so far.
+
+    observe() raises the floor for IDs found in the document; allocate()
+    returns the next free ID in constant time.
+    """
+
+    def __init__(self, prefix="", first=0):
+        self.prefix = prefix
+        self.next_id = first
+
+    def observe(self, value):
+        """Record an ID value as written, e.g. "rId7" or "12"; others are ignored."""
+        if not value or not value.startswith(self.prefix):
+            return
+        try:
+            number = int(value[len(self.prefix) :])
+        except ValueError:
+            return
+        if number >= self.next_id:
+            self.next_id = number + 1
+
+    def allocate(self):
+        """Return an unused ID and reserve it."""
+        number = self.next_id
+        self.next_id += 1
+        return number
+
+
+class _ElementIndex:
+    """
+    Lookup tables over a parsed DOM for XMLEditor.get_node.
+
+    Elements are collected by tag in one document-order walk. Attribute,
+    line and text lookups are built the first time they are asked for.
+    The index describes a single DOM state; XMLEditor discards it on every
+    mutation.
+    """
+
+    def __init__(self, root):
+        self._all = []
+        self._by_tag = {}
+        self._by_attr = {}  # (tag, attr) -> value -> set of elements
+        self._by_line = {}  # tag -> line -> list of elements
+        self._text = {}  # element -> text content
+
+        for elem in self._walk(root):
+            self._all.append(elem)
+            self._by_tag.setdefault(self.tag_name(elem), []).append(elem)
+
+    def _walk(self, root):
+        """Yield root and every element below it, in document order."""
+        stack = [root] if root is not None else []
+        while stack:
+            elem = stack.pop()
+            yield elem
+            stack.extend(
+                child
+                for child in reversed(elem.childNodes)
+                if child.nodeType == child.ELEMENT_NODE
+            )
+
+    def tag_name(self, elem):
+        """Tag name of an element as written, e.g. "w:p"."""
+        return elem.tagName
+
+    def attribute(self, elem, attr_name):
+        """Attribute value by prefixed name, "" if missing (like getAttribute)."""
+        return elem.getAttribute(attr_name)
+
+    def line(self, elem):
+        """Line on which an element starts in the parsed file (None if unknown)."""
+        return getattr(elem, "parse_position", (None,))[0]
+
+    def elements(self, tag):
+        """Elements with this tag name ("*" for all), in document order."""
+        if tag == "*":
+            return list(self._all)
+        return list(self._by_tag.get(tag, ()))
+
+    def at_line(self, tag, line_number):
+        """Elements with this tag starting on the given line, in document order."""
+        if tag not in self._by_line:
+            by_line = {}
+            for elem in self.elements(tag):
+                by_line.setdefault(self.line(elem), []).append(elem)
+            self._by_line[tag] = by_line
+        return list(self._by_line[tag].get(line_number, ()))
+
+    def with_attr(self, tag, attr_name, attr_value):
+        """Elements with this tag whose attribute equals a value.
+
+        A missing attribute has the value "", as with getAttribute().
+        """
+        key = (tag, attr_name)
+        if key not in self._by_attr:
+            by_value = {}
+            for elem in self.elements(tag):
+                by_value.setdefault(self.attribute(elem, attr_name), set()).add(elem)
+            self._by_attr[key] = by_value
+        return self._by_attr[key].get(attr_value, set())
+
+    def text(self, elem):
+        """Non-whitespace text content of an element, cached per element."""
+        text = self._text.get(elem)
+        if text is None:
+            text = "".join(self._text_parts(elem))
+            self._text[elem] = text
+        return text
+
+    def _text_parts(self, elem):
+        for node in elem.childNodes:
+            if node.nodeType == node.TEXT_NODE:
+                # Skip whitespace-only text nodes (XML formatting)
+                if node.data.strip():
+                    yield node.data
+            elif node.nodeType == node.ELEMENT_NODE:
+                yield self.text(node)
+
+
+class _LxmlElementIndex(_ElementIndex):
+    """_ElementIndex over an lxml tree (see LxmlXMLEditor)."""
+
+    def __init__(self, root):
+        self._namespaces = dict(root.nsmap)
+        self._names = {}  # (qualified tag, prefix) -> prefixed tag name
+        super().__init__(root)
+
+    def _walk(self, root):
+        return root.iter(lxml.etree.Element)
+
+    def tag_name(self, elem):
+        key = (elem.tag, elem.prefix)
+        name = self._names.get(key)
+        if name is None:
+            name = self._names[key] = _prefixed_name(elem)
+        return name
+
+    def attribute(self, elem, attr_name):
+        prefix, _, local = attr_name.rpartition(":")
+        if not prefix:
+            return elem.get(attr_name, "")
+        if prefix == "xml":
+            namespace = XML_NAMESPACE
+        else:
+            namespace = self._namespaces.get(prefix) or elem.nsmap.get(prefix)
+        return elem.get(f"{{{namespace}}}{local}", "") if namespace else ""
+
+    def line(self, elem):
+        return elem.sourceline or None
+
+    def _text_parts(self, elem):
+        # itertext() yields text and tails in document order, skipping comments
+        return (text for text in elem.itertext() if text.strip())
+
+
+def _wrap_fragments(xml_contents):
+    """Join fragments, each inside its own unprefixed <fragment> element."""
+    return "".join(f"<fragment>{xml}</fragment>" for xml in xml_contents)
+
+
+def _prefixed_name(elem):
+    """Return an lxml element's tag as prefix:localname, e.g. "w:p"."""
+    local = lxml.etree.QName(elem).localname
+    return f"{elem.prefix}:{local}" if elem.prefix else local
 
 
 def _create_line_tracking_parser():
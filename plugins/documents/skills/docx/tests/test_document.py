@@ -0,0 +1,124 @@
+"""
+Checks that Document only copies and writes back the parts it touches.
+
+Run from the docx skill directory:
+    python -m pytest tests
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.document import Document  # noqa: E402
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+PARTS = {
+    "[Content_Types].xml": (
+        HEADER
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        HEADER
+        + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        HEADER
+        + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/settings" Target="settings.xml"/>'
+        "</Relationships>"
+    ),
+    "word/document.xml": (
+        HEADER + f'<w:document xmlns:w="{W}"><w:body>'
+        "<w:p><w:r><w:t>Hello</w:t></w:r></w:p>"
+        "</w:body></w:document>"
+    ),
+    "word/settings.xml": HEADER + f'<w:settings xmlns:w="{W}"/>',
+    "word/styles.xml": HEADER + f'<w:styles xmlns:w="{W}"/>',
+}
+
+
+@pytest.fixture
+def unpacked(tmp_path):
+    root = tmp_path / "unpacked"
+    for name, content in PARTS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    (root / "word" / "media").mkdir()
+    (root / "word" / "media" / "image1.png").write_bytes(b"\x89PNG" + bytes(4096))
+    return root
+
+
+def test_only_opened_and_created_parts_are_copied(unpacked):
+    doc = Document(unpacked, rsid="00AB12CD")
+
+    copied = {
+        path.relative_to(doc.unpacked_path).as_posix()
+        for path in doc.unpacked_path.rglob("*")
+        if path.is_file()
+    }
+    assert "word/media/image1.png" not in copied
+    assert "word/styles.xml" not in copied
+    assert "word/people.xml" in copied
+
+
+def test_save_writes_back_changed_parts_only(unpacked):
+    styles = unpacked / "word" / "styles.xml"
+    before = styles.stat().st_mtime_ns
+    doc = Document(unpacked, rsid="00AB12CD")
+    doc["word/styles.xml"]  # Opened but never changed
+
+    doc.save(validate=False)
+
+    assert styles.stat().st_mtime_ns == before
+    settings = (unpacked / "word" / "settings.xml").read_text(encoding="utf-8")
+    assert "00AB12CD" in settings
+    assert (unpacked / "word" / "people.xml").is_file()
+    assert "word/styles.xml" not in doc.changed_parts()
+
+
+def test_original_docx_survives_save_to_original(unpacked):
+    doc = Document(unpacked, rsid="00AB12CD")
+    doc.save(validate=False)
+    text = doc["word/document.xml"].get_node(tag="w:t")
+    text.firstChild.data = "Changed"
+    doc.save(validate=False)
+
+    with zipfile.ZipFile(doc.original_docx) as original:
+        names = original.namelist()
+        settings = original.read("word/settings.xml").decode("utf-8")
+        document = original.read("word/document.xml").decode("utf-8")
+    assert "word/people.xml" not in names
+    assert "00AB12CD" not in settings
+    assert "Hello" in document
+    document = (unpacked / "word" / "document.xml").read_text(encoding="utf-8")
+    assert "Changed" in document
+
+
+def test_save_to_new_destination_is_complete(unpacked, tmp_path):
+    doc = Document(unpacked, rsid="00AB12CD")
+    destination = tmp_path / "saved"
+
+    doc.save(destination, validate=False)
+
+    saved = {
+        path.relative_to(destination).as_posix()
+        for path in destination.rglob("*")
+        if path.is_file()
+    }
+    assert saved == set(PARTS) | {"word/media/image1.png", "word/people.xml"}
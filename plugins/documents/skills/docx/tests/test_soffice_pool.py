@@ -0,0 +1,104 @@
+"""
+Pins the two soffice pool clients to the same behaviour.
+
+xlsx/recalc.py carries its own copy of pool_request(); both are run against
+the same fake pool here so they cannot drift apart.
+
+Run from the docx skill directory:
+    python -m pytest tests
+"""
+
+import importlib.util
+import json
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(SKILLS_DIR / "docx"))
+
+from ooxml.scripts.soffice_pool import pool_request  # noqa: E402
+
+
+def _load_recalc():
+    pytest.importorskip("openpyxl")
+    spec = importlib.util.spec_from_file_location(
+        "xlsx_recalc", SKILLS_DIR / "xlsx" / "recalc.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _docx_client(socket_path):
+    request = {"op": "recalc", "path": "/tmp/book.xlsx", "timeout": 5}
+    return pool_request(request, socket_path=socket_path)
+
+
+def _xlsx_client(socket_path, monkeypatch):
+    recalc = _load_recalc()
+    monkeypatch.setenv("SOFFICE_POOL_SOCKET", str(socket_path))
+    return recalc.recalc_with_pool("/tmp/book.xlsx", 5)
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are length limited, so stay out of pytest's tmp_path
+    directory = tempfile.mkdtemp(prefix="pool-test-")
+    yield Path(directory) / "pool.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+def _serve_once(socket_path, reply):
+    """Accept one connection, read the request and send `reply` (or nothing)."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.listen(1)
+
+    def handle():
+        conn, _ = server.accept()
+        with conn, conn.makefile("rb") as reader:
+            reader.readline()
+            if reply is not None:
+                conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+        server.close()
+
+    thread = threading.Thread(target=handle, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.fixture(params=["docx", "xlsx"])
+def client(request, monkeypatch):
+    if request.param == "docx":
+        return _docx_client
+    return lambda path: _xlsx_client(path, monkeypatch)
+
+
+def test_no_pool_returns_none(client, socket_path):
+    assert client(socket_path) is None
+
+
+def test_stale_socket_returns_none(client, socket_path):
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    server.close()
+    assert client(socket_path) is None
+
+
+def test_closed_without_answer_returns_none(client, socket_path):
+    thread = _serve_once(socket_path, None)
+    assert client(socket_path) is None
+    thread.join(5)
+
+
+def test_response_is_returned(client, socket_path):
+    reply = {"ok": True, "output": "/tmp/book.xlsx"}
+    thread = _serve_once(socket_path, reply)
+    assert client(socket_path) == reply
+    thread.join(5)
@@ -0,0 +1,79 @@
+"""
+Checks that validators release the files they open.
+
+Run from the docx skill directory:
+    python -m pytest tests
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ooxml.scripts.validation import (  # noqa: E402
+    DOCXSchemaValidator,
+    RedliningValidator,
+)
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+        'officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{W}"><w:body>'
+        "<w:p><w:r><w:t>Hello</w:t></w:r></w:p>"
+        "</w:body></w:document>"
+    ),
+}
+
+
+@pytest.fixture
+def docx_file(tmp_path):
+    path = tmp_path / "sample.docx"
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in PARTS.items():
+            archive.writestr(name, content)
+    return path
+
+
+@pytest.mark.parametrize("validator_class", [DOCXSchemaValidator, RedliningValidator])
+def test_validator_closes_packed_input(docx_file, validator_class):
+    with validator_class(docx_file, docx_file) as validator:
+        report = validator.validate()
+        assert validator.package._zip.fp is not None
+
+    assert validator.package._zip.fp is None
+    assert report.to_dict()["validator"] == validator_class.__name__
+
+
+def test_schema_validator_closes_original(docx_file, tmp_path):
+    unpacked = tmp_path / "unpacked"
+    with zipfile.ZipFile(docx_file) as archive:
+        archive.extractall(unpacked)
+
+    with DOCXSchemaValidator(unpacked, docx_file) as validator:
+        validator._read_original_part("word/document.xml")
+        original_zip = validator._original_zip
+        assert original_zip.fp is not None
+
+    assert original_zip.fp is None
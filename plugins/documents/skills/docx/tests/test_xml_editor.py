@@ -0,0 +1,49 @@
+"""
+Regression checks for XMLEditor saving.
+
+Run from the docx skill directory:
+    python -m pytest tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scripts.utilities import LxmlXMLEditor, XMLEditor  # noqa: E402
+
+SAMPLE = '<?xml version="1.0" encoding="utf-8"?><root><a id="1"/><a id="3"/></root>'
+
+
+@pytest.fixture
+def xml_file(tmp_path):
+    path = tmp_path / "part.xml"
+    path.write_text(SAMPLE, encoding="utf-8")
+    return path
+
+
+def _set_id(node, value):
+    if hasattr(node, "setAttribute"):
+        node.setAttribute("id", value)
+    else:
+        node.set("id", value)
+
+
+@pytest.mark.parametrize("editor_class", [XMLEditor, LxmlXMLEditor])
+def test_direct_edit_of_get_node_result_is_saved(xml_file, editor_class):
+    editor = editor_class(xml_file)
+    node = editor.get_node(tag="a", attrs={"id": "1"})
+    _set_id(node, "2")
+
+    assert editor.dirty
+    editor.save()
+    assert 'id="2"' in xml_file.read_text(encoding="utf-8")
+
+
+@pytest.mark.parametrize("editor_class", [XMLEditor, LxmlXMLEditor])
+def test_untouched_editor_does_not_write(xml_file, editor_class):
+    editor = editor_class(xml_file)
+    editor.save()
+    assert xml_file.read_text(encoding="utf-8") == SAMPLE
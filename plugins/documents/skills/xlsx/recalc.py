@@ -4,11 +4,14 @@ Excel Formula Recalculation Script
 Recalculates all formulas in an Excel file using LibreOffice
 """
 
+import getpass
 import json
 import sys
+import socket
 import subprocess
 import os
 import platform
+import tempfile
 from pathlib import Path
 from openpyxl import load_workbook
 
@@ -50,22 +53,61 @@ def setup_libreoffice_macro():
         return False
 
 
-def recalc(filename, timeout=30):
+# Same as CLIENT_TIMEOUT_MARGIN in docx/ooxml/scripts/soffice_pool.py
+POOL_TIMEOUT_MARGIN = 30
+
+
+def pool_socket_path():
+    """Socket of a running soffice pool (docx/ooxml/scripts/soffice_pool.py)"""
+    if os.environ.get('SOFFICE_POOL_SOCKET'):
+        return os.environ['SOFFICE_POOL_SOCKET']
+    return os.path.join(tempfile.gettempdir(), f'soffice-pool-{getpass.getuser()}.sock')
+
+
+def recalc_with_pool(abs_path, timeout):
     """
-    Recalculate formulas in Excel file and report any errors
-    
-    Args:
-        filename: Path to Excel file
-        timeout: Maximum time to wait for recalculation (seconds)
+    Recalculate and save the file using a warm soffice pool worker
     
     Returns:
-        dict with error locations and counts
+        None if no pool is running, it dropped the connection or it did
+        not answer in time, otherwise the pool's response dict
     """
-    if not Path(filename).exists():
-        return {'error': f'File {filename} does not exist'}
-    
-    abs_path = str(Path(filename).absolute())
+    # Copy of pool_request() in docx/ooxml/scripts/soffice_pool.py, which
+    # this skill does not ship with; keep the two in sync (both are run
+    # against the same server by docx/tests/test_soffice_pool.py).
+    path = pool_socket_path()
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(path):
+        return None
+    
+    request = {'op': 'recalc', 'path': abs_path, 'timeout': timeout}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            # Job timeout plus the pool client margin (queueing, worker restarts)
+            sock.settimeout(timeout + POOL_TIMEOUT_MARGIN)
+            sock.connect(path)
+            sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+            with sock.makefile('rb') as reader:
+                line = reader.readline()
+    except (ConnectionRefusedError, FileNotFoundError):
+        return None  # Stale socket from a pool that is no longer running
+    except (ConnectionResetError, BrokenPipeError):
+        return None  # The pool went away while handling the request
+    except socket.timeout:
+        print('soffice pool did not answer in time; running soffice directly', file=sys.stderr)
+        return None
+    
+    if not line:
+        return None  # The pool closed the connection without answering
+    return json.loads(line)
+
+
+def recalc_with_macro(abs_path, timeout):
+    """
+    Recalculate and save the file by starting soffice with the recalculation macro
     
+    Returns:
+        None on success (or timeout), otherwise a dict with the error
+    """
     if not setup_libreoffice_macro():
         return {'error': 'Failed to setup LibreOffice macro'}
     
@@ -97,6 +139,33 @@ def recalc(filename, timeout=30):
             return {'error': 'LibreOffice macro not configured properly'}
         else:
             return {'error': error_msg}
+    return None
+
+
+def recalc(filename, timeout=30):
+    """
+    Recalculate formulas in Excel file and report any errors
+    
+    Args:
+        filename: Path to Excel file
+        timeout: Maximum time to wait for recalculation (seconds)
+    
+    Returns:
+        dict with error locations and counts
+    """
+    if not Path(filename).exists():
+        return {'error': f'File {filename} does not exist'}
+    
+    abs_path = str(Path(filename).absolute())
+    
+    # Prefer a running soffice pool, which skips LibreOffice start-up
+    response = recalc_with_pool(abs_path, timeout)
+    if response is None:
+        error = recalc_with_macro(abs_path, timeout)
+        if error:
+            return error
+    elif not response['ok'] and not response.get('timeout'):
+        return {'error': response.get('error', 'Unknown error during recalculation')}
     
     # Check for Excel errors in the recalculated file - scan ALL cells
     try: